@@ -1,48 +1,75 @@
 """External-facing functions of Seedcase Sprout."""
 # This exposes only the functions we want exposed when
 # the package is imported via `from seedcase_sprout import *`.
+#
+# The functions and classes are imported from their modules when they are first
+# used (PEP 562), so importing the package doesn't import Polars, jsonschema, and
+# the other dependencies that only some of them need.
 
+import sys
+from importlib import import_module
 from pprint import pprint
 from textwrap import dedent
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
-from .as_readme_text import as_readme_text
-from .check_data import check_data
-from .check_properties import (
-    check_package_properties,
-    check_properties,
-    check_resource_properties,
-)
-from .create_properties_script import create_properties_script
-from .create_resource_properties_script import create_resource_properties_script
-from .examples import (
-    ExamplePackage,
-    example_data,
-    example_data_all_types,
-    example_package_properties,
-    example_resource_properties,
-    example_resource_properties_all_types,
-)
-from .extract_resource_properties import extract_resource_properties
-from .join_resource_batches import join_resource_batches
-from .paths import PackagePath
-from .properties import (
-    ConstraintsProperties,
-    ContributorProperties,
-    FieldProperties,
-    LicenseProperties,
-    PackageProperties,
-    ReferenceProperties,
-    ResourceProperties,
-    SourceProperties,
-    TableSchemaForeignKeyProperties,
-    TableSchemaProperties,
-)
-from .read_properties import read_properties
-from .read_resource_batches import read_resource_batches
-from .write_file import write_file
-from .write_properties import write_properties
-from .write_resource_batch import write_resource_batch
-from .write_resource_data import write_resource_data
+if TYPE_CHECKING:
+    from .as_readme_text import as_readme_text
+    from .build_resource_data import build_resource_data
+    from .check_data import check_data
+    from .check_foreign_keys import check_foreign_keys
+    from .check_properties import (
+        check_package_properties,
+        check_properties,
+        check_resource_properties,
+    )
+    from .check_resource_batches import check_resource_batches
+    from .compact_resource_batches import (
+        BatchCompactionReport,
+        compact_resource_batches,
+    )
+    from .create_properties_script import create_properties_script
+    from .create_resource_properties_script import create_resource_properties_script
+    from .examples import (
+        ExamplePackage,
+        example_data,
+        example_data_all_types,
+        example_package_properties,
+        example_resource_properties,
+        example_resource_properties_all_types,
+    )
+    from .extract_resource_properties import extract_resource_properties
+    from .join_resource_batches import join_resource_batches
+    from .lookup_resource_data import lookup_resource_data
+    from .parquet_write_options import (
+        ParquetWriteOptions,
+        set_default_parquet_write_options,
+    )
+    from .paths import PackagePath
+    from .properties import (
+        ConstraintsProperties,
+        ContributorProperties,
+        FieldProperties,
+        LicenseProperties,
+        PackageProperties,
+        ReferenceProperties,
+        ResourceProperties,
+        SourceProperties,
+        TableSchemaForeignKeyProperties,
+        TableSchemaProperties,
+    )
+    from .properties_cache import (
+        PropertiesCacheInfo,
+        clear_properties_cache,
+        get_properties_cache_info,
+    )
+    from .read_properties import read_properties
+    from .read_resource_batches import read_resource_batches
+    from .scan_resource_batches import scan_resource_batches
+    from .write_file import write_file
+    from .write_properties import write_properties
+    from .write_resource_batch import write_resource_batch
+    from .write_resource_data import write_resource_data
 
 __all__ = [
     # Properties -----
@@ -57,6 +84,9 @@ __all__ = [
     "TableSchemaForeignKeyProperties",
     "TableSchemaProperties",
     "read_properties",
+    "get_properties_cache_info",
+    "clear_properties_cache",
+    "PropertiesCacheInfo",
     "create_properties_script",
     # Example properties -----
     "example_package_properties",
@@ -69,12 +99,19 @@ __all__ = [
     "write_properties",
     "as_readme_text",
     # Resources -----
+    "build_resource_data",
+    "compact_resource_batches",
+    "BatchCompactionReport",
     "extract_resource_properties",
     "join_resource_batches",
+    "lookup_resource_data",
     "read_resource_batches",
+    "scan_resource_batches",
     "write_resource_batch",
     "create_resource_properties_script",
     "write_resource_data",
+    "ParquetWriteOptions",
+    "set_default_parquet_write_options",
     # Path -----
     "PackagePath",
     # Helpers -----
@@ -87,4 +124,87 @@ __all__ = [
     "check_properties",
     "check_resource_properties",
     "check_data",
+    "check_foreign_keys",
+    "check_resource_batches",
 ]
+
+"""The module each exported function or class is defined in."""
+_EXPORTS = {
+    "as_readme_text": "as_readme_text",
+    "build_resource_data": "build_resource_data",
+    "check_data": "check_data",
+    "check_foreign_keys": "check_foreign_keys",
+    "check_package_properties": "check_properties",
+    "check_properties": "check_properties",
+    "check_resource_properties": "check_properties",
+    "check_resource_batches": "check_resource_batches",
+    "BatchCompactionReport": "compact_resource_batches",
+    "compact_resource_batches": "compact_resource_batches",
+    "create_properties_script": "create_properties_script",
+    "create_resource_properties_script": "create_resource_properties_script",
+    "ExamplePackage": "examples",
+    "example_data": "examples",
+    "example_data_all_types": "examples",
+    "example_package_properties": "examples",
+    "example_resource_properties": "examples",
+    "example_resource_properties_all_types": "examples",
+    "extract_resource_properties": "extract_resource_properties",
+    "join_resource_batches": "join_resource_batches",
+    "lookup_resource_data": "lookup_resource_data",
+    "ParquetWriteOptions": "parquet_write_options",
+    "set_default_parquet_write_options": "parquet_write_options",
+    "PackagePath": "paths",
+    "ConstraintsProperties": "properties",
+    "ContributorProperties": "properties",
+    "FieldProperties": "properties",
+    "LicenseProperties": "properties",
+    "PackageProperties": "properties",
+    "ReferenceProperties": "properties",
+    "ResourceProperties": "properties",
+    "SourceProperties": "properties",
+    "TableSchemaForeignKeyProperties": "properties",
+    "TableSchemaProperties": "properties",
+    "clear_properties_cache": "properties_cache",
+    "get_properties_cache_info": "properties_cache",
+    "PropertiesCacheInfo": "properties_cache",
+    "read_properties": "read_properties",
+    "read_resource_batches": "read_resource_batches",
+    "scan_resource_batches": "scan_resource_batches",
+    "write_file": "write_file",
+    "write_properties": "write_properties",
+    "write_resource_batch": "write_resource_batch",
+    "write_resource_data": "write_resource_data",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Imports an exported function or class from its module on first use."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Lists the exported names, also those that haven't been imported yet."""
+    return sorted({*globals(), *__all__})
+
+
+class _LazyModule(ModuleType):
+    """The package module, keeping exported names bound to what they export.
+
+    Importing a submodule sets it as an attribute of the package. Most exports have
+    the same name as the submodule they are defined in, e.g., `check_data`, so
+    without this, `seedcase_sprout.check_data` could become the submodule instead of
+    the function once another module has imported it.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets the attribute, unless it would replace an export with its module."""
+        if name in _EXPORTS and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
@@ -0,0 +1,348 @@
+from json import JSONDecodeError
+from pathlib import Path
+
+import polars as pl
+
+from seedcase_sprout.check_properties import _check_resource_properties_once
+from seedcase_sprout.get_nested_attr import get_nested_attr
+from seedcase_sprout.internals import (
+    _create_resource_data_path,
+    _get_json_hash,
+    _lock,
+    _read_json,
+    _write_json,
+)
+from seedcase_sprout.join_resource_batches import join_resource_batches
+from seedcase_sprout.parquet_write_options import (
+    ParquetWriteOptions,
+    _get_parquet_write_kwargs,
+)
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.properties import ResourceProperties
+from seedcase_sprout.read_resource_batches import (
+    _get_batch_file_timestamps,
+    read_resource_batches,
+)
+from seedcase_sprout.write_resource_data import (
+    _read_partitions_manifest,
+    write_resource_data,
+)
+
+
+def build_resource_data(
+    resource_properties: ResourceProperties,
+    package_path: Path | None = None,
+    incremental: bool = True,
+    partition_by: list[str] | None = None,
+    parquet_options: ParquetWriteOptions | None = None,
+) -> Path:
+    """Builds the resource's data file from the files in its `batch/` folder.
+
+    This function reads the batch files with `read_resource_batches()`, joins them with
+    `join_resource_batches()` and writes the result with `write_resource_data()`.
+
+    Which batch files have been joined into the data file is recorded in a manifest
+    file next to it (see `PackagePath().resource_data_manifest()`). With `incremental`,
+    only batch files that were added after the last build are read. Their rows are
+    merged into the existing data file by the primary key, with the rows from the new
+    batch files replacing any existing rows with the same primary key. If no batch
+    file has been added or changed and the properties and the write options are the
+    same, nothing is read or written and the function returns right away, so
+    resources can be built on a schedule without rewriting unchanged data. The
+    `bytes`, `hash`, and `path` of the `resource_properties` are then set from the
+    manifest, as if the data file had been written.
+
+    The data file is fully rebuilt from all batch files instead, if:
+
+    - `incremental` is False.
+    - The manifest or the data file is missing or doesn't match the manifest.
+    - The resource properties have changed since the last build.
+    - `partition_by` or `parquet_options` differ from the last build.
+    - A batch file that was already joined into the data file has been removed or
+      changed, as seen from its size and modification time.
+    - A new batch file is older than the newest batch file already joined, so its rows
+      can't simply replace the existing ones.
+
+    The resource is locked while building, so no batch files can be added to it in
+    the meantime.
+
+    Args:
+        resource_properties: The `ResourceProperties` object that contains the
+            properties of the resource to build the data file for.
+        package_path: The path to the data package root folder (where `datapackage.json`
+            is located). Defaults to the current working directory.
+        incremental: Whether to only merge new batch files into the existing data file
+            when possible. Defaults to True.
+        partition_by: The names of the fields to partition the data by, written as
+            described in `write_resource_data()`. Defaults to None, which builds a
+            single data file.
+        parquet_options: The options for writing the Parquet file(s). Defaults to None,
+            which uses the default options (see `set_default_parquet_write_options()`).
+
+    Returns:
+        Outputs the path of the data file.
+
+    Raises:
+        ExceptionGroup: A group of `CheckError`s, if resource properties are incorrect.
+        ValueError: If there are no batch files for the resource.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            resource_properties = sp.example_resource_properties()
+            sp.write_resource_batch(sp.example_data(), resource_properties)
+            sp.build_resource_data(resource_properties)
+
+            # Only the new batch file is merged into the data file
+            sp.write_resource_batch(sp.example_data(), resource_properties)
+            sp.build_resource_data(resource_properties)
+        ```
+    """
+    _check_resource_properties_once(resource_properties)
+    path = PackagePath(package_path)
+    with _lock(path.resource(str(resource_properties.name))):
+        return _build_resource_data(
+            resource_properties, path, incremental, partition_by, parquet_options
+        )
+
+
+def _build_resource_data(
+    resource_properties: ResourceProperties,
+    path: PackagePath,
+    incremental: bool,
+    partition_by: list[str] | None,
+    parquet_options: ParquetWriteOptions | None,
+) -> Path:
+    """Builds the data file, while the resource folder is locked."""
+    resource_name = str(resource_properties.name)
+    data_path = (
+        path.resource_partitioned_data(resource_name)
+        if partition_by
+        else path.resource_data(resource_name)
+    )
+    manifest_path = path.resource_data_manifest(resource_name)
+
+    batch_files = path.resource_batch_files(resource_name)
+    timestamps = _get_batch_file_timestamps(batch_files)
+    properties_hash = _get_properties_hash(resource_properties)
+    write_settings_hash = _get_json_hash(
+        {
+            "partition_by": partition_by or None,
+            "parquet_options": _get_parquet_write_kwargs(parquet_options),
+        }
+    )
+    new_batch_files = (
+        _get_new_batch_files(
+            manifest_path, data_path, timestamps, properties_hash, write_settings_hash
+        )
+        if incremental
+        else None
+    )
+
+    if new_batch_files == []:
+        # Nothing is written, so the properties describe the data file of the last
+        # build, as `write_resource_data()` would.
+        manifest = _read_json(manifest_path)
+        resource_properties.bytes = None if partition_by else manifest["data_file_size"]
+        resource_properties.hash = manifest["data_file_hash"]
+        resource_properties.path = _create_resource_data_path(
+            resource_name, partitioned=bool(partition_by)
+        )
+        return data_path
+
+    if new_batch_files is None:
+        data = join_resource_batches(
+            read_resource_batches(resource_properties, batch_files),
+            resource_properties,
+        )
+    else:
+        new_data = join_resource_batches(
+            read_resource_batches(resource_properties, new_batch_files),
+            resource_properties,
+        )
+        data = _merge_by_primary_key(
+            _read_data(data_path),
+            new_data,
+            get_nested_attr(resource_properties, "schema.primary_key"),
+        )
+
+    write_resource_data(
+        data, resource_properties, path.root(), partition_by, parquet_options
+    )
+    # Keep the partition fingerprints recorded by `write_resource_data()`.
+    _write_json(
+        _create_manifest(
+            data_path,
+            timestamps,
+            properties_hash,
+            write_settings_hash,
+            resource_properties.hash,
+        )
+        | _read_partitions_manifest(manifest_path),
+        manifest_path,
+    )
+    return data_path
+
+
+def _get_properties_hash(resource_properties: ResourceProperties) -> str:
+    """Hashes the resource properties that the data file is built from.
+
+    The `bytes`, `hash`, and `path` properties are left out, as they describe the
+    data file and are updated each time it is written.
+    """
+    properties = resource_properties.compact_dict
+    return _get_json_hash(
+        {
+            key: value
+            for key, value in properties.items()
+            if key not in ("bytes", "hash", "path")
+        }
+    )
+
+
+def _get_new_batch_files(
+    manifest_path: Path,
+    data_path: Path,
+    timestamps: dict[Path, str],
+    properties_hash: str,
+    write_settings_hash: str,
+) -> list[Path] | None:
+    """Gets the batch files that haven't been joined into the data file yet.
+
+    Args:
+        manifest_path: The path to the manifest of the data file.
+        data_path: The path to the data file.
+        timestamps: The timestamps of all batch files, by their paths, sorted by
+            timestamp.
+        properties_hash: The hash of the current resource properties.
+        write_settings_hash: The hash of the partitioning and the Parquet options to
+            write the data file with.
+
+    Returns:
+        The new batch files, in the same order as `batch_files`. None, if the data
+            file must be fully rebuilt.
+    """
+    try:
+        manifest = _read_json(manifest_path)
+        joined_batch_files = set(manifest["batch_files"])
+        latest_timestamp = manifest["latest_batch_timestamp"]
+        data_size, data_mtime_ns = _get_data_stat(data_path)
+        is_consistent = (
+            manifest["properties_hash"] == properties_hash
+            and manifest["write_settings_hash"] == write_settings_hash
+            and "data_file_hash" in manifest
+            and manifest["data_file_size"] == data_size
+            and manifest["data_file_mtime_ns"] == data_mtime_ns
+        )
+    except (OSError, JSONDecodeError, KeyError, TypeError):
+        return None
+
+    batch_files = list(timestamps)
+    batch_file_names = {path.name for path in batch_files}
+    if not is_consistent or not joined_batch_files <= batch_file_names:
+        return None
+    if manifest["batch_files_hash"] != _get_batch_files_hash(
+        [path for path in batch_files if path.name in joined_batch_files]
+    ):
+        return None
+
+    new_batch_files = [
+        path for path in batch_files if path.name not in joined_batch_files
+    ]
+    if any(timestamps[path] < latest_timestamp for path in new_batch_files):
+        return None
+
+    return new_batch_files
+
+
+def _merge_by_primary_key(
+    data: pl.DataFrame, new_data: pl.DataFrame, primary_key: list[str] | str | None
+) -> pl.DataFrame:
+    """Merges new data into existing data, replacing rows with the same primary key.
+
+    Without a primary key, only rows that are identical to an existing row are dropped,
+    matching `join_resource_batches()`.
+    """
+    if not primary_key:
+        return pl.concat([data, new_data]).unique()
+
+    return pl.concat(
+        [data.join(new_data, on=primary_key, how="anti", nulls_equal=True), new_data]
+    )
+
+
+def _create_manifest(
+    data_path: Path,
+    timestamps: dict[Path, str],
+    properties_hash: str,
+    write_settings_hash: str,
+    data_file_hash: str | None,
+) -> dict:
+    """Creates the manifest recording which batch files the data file was built from.
+
+    Args:
+        data_path: The path to the data file.
+        timestamps: The timestamps of all batch files joined into the data file, by
+            their paths, sorted by timestamp.
+        properties_hash: The hash of the resource properties used for the build.
+        write_settings_hash: The hash of the partitioning and the Parquet options the
+            data file was written with.
+        data_file_hash: The `hash` property of the written data file, if it's a single
+            file.
+
+    Returns:
+        The manifest as a dictionary.
+    """
+    data_size, data_mtime_ns = _get_data_stat(data_path)
+    batch_files = list(timestamps)
+    return {
+        "batch_files": [path.name for path in batch_files],
+        "latest_batch_timestamp": timestamps[batch_files[-1]],
+        "batch_files_hash": _get_batch_files_hash(batch_files),
+        "properties_hash": properties_hash,
+        "write_settings_hash": write_settings_hash,
+        "data_file_size": data_size,
+        "data_file_hash": data_file_hash,
+        "data_file_mtime_ns": data_mtime_ns,
+    }
+
+
+def _get_batch_files_hash(batch_files: list[Path]) -> str:
+    """Hashes the names, sizes, and modification times of the batch files.
+
+    This only needs the metadata of the files, not their content, so it's quick to
+    check whether any batch file has been changed since the last build.
+    """
+    stats = [(path.name, path.stat()) for path in batch_files]
+    return _get_json_hash(
+        [[name, stat.st_size, stat.st_mtime_ns] for name, stat in stats]
+    )
+
+
+def _get_data_stat(data_path: Path) -> tuple[int, int]:
+    """Gets the size and the modification time of the data file.
+
+    For partitioned data, these are the total size and the latest modification time
+    of the files in the folder.
+
+    Raises:
+        FileNotFoundError: If the data file or folder doesn't exist.
+    """
+    if not data_path.is_dir():
+        data_stat = data_path.stat()
+        return data_stat.st_size, data_stat.st_mtime_ns
+
+    stats = [path.stat() for path in data_path.glob("**/*.parquet")]
+    return (
+        sum(stat.st_size for stat in stats),
+        max((stat.st_mtime_ns for stat in stats), default=0),
+    )
+
+
+def _read_data(data_path: Path) -> pl.DataFrame:
+    """Reads the data file, or all files in the folder for partitioned data."""
+    if data_path.is_dir():
+        return pl.read_parquet(data_path / "**" / "*.parquet", hive_partitioning=False)
+    return pl.read_parquet(data_path)
@@ -1,9 +1,10 @@
-from typing import cast
+from datetime import date, datetime, time
+from typing import TypeVar, cast
 
 import polars as pl
 
 from seedcase_sprout.check_properties import (
-    check_resource_properties,
+    _check_resource_properties_once,
 )
 from seedcase_sprout.get_nested_attr import get_nested_attr
 from seedcase_sprout.internals import _map
@@ -16,10 +17,10 @@ from seedcase_sprout.properties import (
     ResourceProperties,
 )
 
+Data = TypeVar("Data", bound=pl.DataFrame | pl.LazyFrame)
 
-def check_data(
-    data: pl.DataFrame, resource_properties: ResourceProperties
-) -> pl.DataFrame:
+
+def check_data(data: Data, resource_properties: ResourceProperties) -> Data:
     """Checks that the DataFrame matches the requirements in the resource properties.
 
     Runs a few checks to compare between the data and the properties on the items:
@@ -30,6 +31,7 @@ def check_data(
     | Column types | `field.types` |
     | Column values' types | `field.types` |
     | Column values' constraints | `field.constraints` |
+    | Uniqueness of key values | `schema.primary_key`, `schema.unique_keys` |
 
     Error messages output generally in the format of:
 
@@ -40,8 +42,21 @@ def check_data(
     > - In the properties: {mismatch}
     > - In the data: {mismatch}
 
+    All constraints of all fields are checked together in a single pass over the data.
+    The `json_schema` constraint is not checked. If `data` is a LazyFrame, the column
+    names and types are checked against its schema, without reading in the data. The
+    data are only read if any of the fields have constraints or the resource has a
+    primary key or unique keys.
+
+    Duplicate key values are found by grouping the data by the key columns, which
+    Polars does by hashing them. This runs on Polars' streaming engine, so a
+    LazyFrame, e.g., from `pl.scan_parquet()`, is checked without reading all of it
+    into memory or sorting it. Rows with a missing value in any of the columns of a
+    unique key are ignored for that key, while missing values in the primary key are
+    compared like any other value.
+
     Args:
-        data: A Polars DataFrame.
+        data: A Polars DataFrame or LazyFrame.
         resource_properties: The specific `ResourceProperties` for the `data`.
 
     Returns:
@@ -51,6 +66,9 @@ def check_data(
         ExceptionGroup[CheckError]: If the resource properties are incorrect.
         ValueError: If column names in the data are incorrect.
         ExceptionGroup[ValueError]: If data types in the data are incorrect.
+        ExceptionGroup[ValueError]: If values in the data don't match the constraints.
+        ExceptionGroup[ValueError]: If the primary key or unique keys have duplicate
+            values.
 
     Examples:
         ```{python}
@@ -62,17 +80,16 @@ def check_data(
         )
         ```
     """
-    check_resource_properties(resource_properties)
+    _check_resource_properties_once(resource_properties)
     _check_column_names(data, resource_properties)
     _check_column_types(data, resource_properties)
-    # _check_column_values_constraints(data, resource_properties)
+    _check_column_values_constraints(data, resource_properties)
+    _check_keys_unique(data, resource_properties)
 
     return data
 
 
-def _check_column_names(
-    data: pl.DataFrame, resource_properties: ResourceProperties
-) -> pl.DataFrame:
+def _check_column_names(data: Data, resource_properties: ResourceProperties) -> Data:
     """Checks that column names in `data` match those in `resource_properties`.
 
     Columns may appear in any order.
@@ -88,7 +105,7 @@ def _check_column_names(
         ValueError: If the column names don't match the names in
             `resource_properties`.
     """
-    columns_in_data = data.schema.names()
+    columns_in_data = data.collect_schema().names()
     columns_in_resource = [
         field.name
         for field in cast(
@@ -125,9 +142,7 @@ def _format_column_name_error_message(
     return message
 
 
-def _check_column_types(
-    data: pl.DataFrame, resource_properties: ResourceProperties
-) -> pl.DataFrame:
+def _check_column_types(data: Data, resource_properties: ResourceProperties) -> Data:
     """Checks that column data types match the data types specified in the properties.
 
     The resource properties specify a Frictionless data type for each column.
@@ -150,7 +165,7 @@ def _check_column_types(
         list[FieldProperties],
         get_nested_attr(resource_properties, "schema.fields", default=[]),
     )
-    polars_schema = data.schema
+    polars_schema = data.collect_schema()
     errors = [
         _get_column_type_error(polars_schema[str(field.name)], field)
         for field in fields
@@ -196,3 +211,359 @@ def _get_column_type_error(
         f"Expected type of column '{field.name}' "
         f"to be {allowed_types_str} but found {polars_type}."
     )
+
+
+def _check_column_values_constraints(
+    data: Data, resource_properties: ResourceProperties
+) -> Data:
+    """Checks that column values match the constraints given in the properties.
+
+    Column names and types are expected to match those in the resource properties.
+
+    Args:
+        data: The data to check.
+        resource_properties: The resource properties to check against.
+
+    Returns:
+        The data, if all values match the constraints.
+
+    Raises:
+        ExceptionGroup: A group of `ValueError`s, one per broken constraint or
+            constraint bound that can't be parsed.
+    """
+    fields = cast(
+        list[FieldProperties],
+        get_nested_attr(resource_properties, "schema.fields", default=[]),
+    )
+    violations, errors = _get_constraint_violations(data, fields)
+    errors += [
+        ValueError(
+            f"Column '{violation['field']}' has {violation['count']} value(s) that "
+            f"don't match the '{violation['constraint']}' constraint, e.g., in "
+            f"row(s) {violation['rows']}."
+        )
+        for violation in violations.filter(pl.col("count") > 0).iter_rows(named=True)
+    ]
+
+    if errors:
+        raise ExceptionGroup(
+            "The following columns in the data have values that do not match the "
+            "constraints in the resource properties:",
+            errors,
+        )
+    return data
+
+
+def _get_constraint_violations(
+    data: pl.DataFrame | pl.LazyFrame,
+    fields: list[FieldProperties],
+    max_rows: int = 5,
+) -> tuple[pl.DataFrame, list[ValueError]]:
+    """Counts the values in each column that don't match each of its constraints.
+
+    All constraints of all fields are compiled into Polars expressions that are
+    evaluated in a single `select()` over the data, on Polars' streaming engine.
+
+    Args:
+        data: The data to check.
+        fields: The fields with the constraints to check.
+        max_rows: The maximum number of row indices to output per constraint.
+
+    Returns:
+        A DataFrame with one row per constraint, giving the field name, the
+            constraint name, the number of values that don't match it, and the
+            indices of the first `max_rows` rows with those values. Also, the errors
+            for the constraints that can't be checked.
+    """
+    schema = data.collect_schema()
+    checks = []
+    errors = []
+    for field in fields:
+        field_violations, field_errors = _get_constraint_violation_exprs(
+            field, schema[str(field.name)]
+        )
+        checks += [
+            (str(field.name), constraint, violation)
+            for constraint, violation in field_violations.items()
+        ]
+        errors += field_errors
+
+    violations_schema = pl.Schema(
+        {
+            "field": pl.String(),
+            "constraint": pl.String(),
+            "count": pl.UInt64(),
+            "rows": pl.List(pl.UInt64),
+        }
+    )
+    if not checks:
+        return pl.DataFrame(schema=violations_schema), errors
+
+    row_index = _get_unused_column_name("row", schema)
+    results = (
+        data.lazy()
+        .with_row_index(row_index)
+        .select(
+            expression
+            for index, (_, _, violation) in enumerate(checks)
+            for expression in (
+                violation.sum().cast(pl.UInt64).alias(f"count_{index}"),
+                pl.col(row_index)
+                .cast(pl.UInt64)
+                .filter(violation)
+                .head(max_rows)
+                .implode()
+                .alias(f"rows_{index}"),
+            )
+        )
+        .collect(engine="streaming")
+        .row(0, named=True)
+    )
+    violations = pl.DataFrame(
+        {
+            "field": [field_name for field_name, _, _ in checks],
+            "constraint": [constraint for _, constraint, _ in checks],
+            "count": [results[f"count_{index}"] for index in range(len(checks))],
+            "rows": [results[f"rows_{index}"] for index in range(len(checks))],
+        },
+        schema=violations_schema,
+    )
+    return violations, errors
+
+
+def _get_unused_column_name(name: str, schema: pl.Schema) -> str:
+    """Prefixes the name with underscores until it isn't a column in the schema."""
+    while name in schema:
+        name = f"_{name}"
+    return name
+
+
+def _get_constraint_violation_exprs(
+    field: FieldProperties, polars_type: pl.DataType
+) -> tuple[dict[str, pl.Expr], list[ValueError]]:
+    """Creates an expression per constraint of the field that finds violating values.
+
+    Constraints that don't apply to the Polars type of the column are skipped. Missing
+    values only violate the `required` constraint.
+
+    Args:
+        field: The field with the constraints.
+        polars_type: The Polars type of the field's column.
+
+    Returns:
+        A Boolean expression per constraint name, which is True for each value that
+            violates the constraint, and an error per constraint with a bound that
+            can't be parsed.
+    """
+    constraints = field.constraints
+    if constraints is None:
+        return {}, []
+
+    column = pl.col(str(field.name))
+    is_string = isinstance(polars_type, pl.String | pl.Categorical | pl.Enum)
+    is_comparable = polars_type.is_numeric() or polars_type.is_temporal()
+    violations = {}
+    errors = []
+
+    if constraints.required:
+        violations["required"] = column.is_null()
+    if constraints.unique and not isinstance(polars_type, pl.Object):
+        violations["unique"] = column.is_duplicated() & column.is_not_null()
+    if constraints.pattern is not None and is_string:
+        violations["pattern"] = ~column.cast(pl.String).str.contains(
+            # Patterns must match the whole value
+            f"^(?:{constraints.pattern})$"
+        )
+    if constraints.enum is not None:
+        # Categories are compared as text, so enum values outside them don't fail.
+        enum_type = (
+            pl.String
+            if polars_type.base_type() in (pl.Categorical, pl.Enum)
+            else polars_type
+        )
+        violations["enum"] = ~column.cast(enum_type).is_in(
+            pl.Series(constraints.enum).cast(enum_type)
+        )
+
+    length = _get_length_expr(column, polars_type)
+    if constraints.min_length is not None and length is not None:
+        violations["minLength"] = length < constraints.min_length
+    if constraints.max_length is not None and length is not None:
+        violations["maxLength"] = length > constraints.max_length
+
+    bounds = [
+        ("minimum", constraints.minimum, column.__lt__),
+        ("maximum", constraints.maximum, column.__gt__),
+        ("exclusiveMinimum", constraints.exclusive_minimum, column.__le__),
+        ("exclusiveMaximum", constraints.exclusive_maximum, column.__ge__),
+    ]
+    for constraint, bound, is_violated_by in bounds:
+        if bound is None or not is_comparable:
+            continue
+        try:
+            violations[constraint] = is_violated_by(_as_type(bound, field, polars_type))
+        except ValueError as error:
+            errors.append(
+                ValueError(
+                    f"Can't check the '{constraint}' constraint of column "
+                    f"'{field.name}', as {error}"
+                )
+            )
+
+    violations = {
+        constraint: violation
+        if constraint == "required"
+        else violation.fill_null(False)
+        for constraint, violation in violations.items()
+    }
+    return violations, errors
+
+
+def _get_length_expr(column: pl.Expr, polars_type: pl.DataType) -> pl.Expr | None:
+    """Creates an expression for the length of each value, if it has a length."""
+    if isinstance(polars_type, pl.String | pl.Categorical | pl.Enum):
+        return column.cast(pl.String).str.len_chars()
+    if isinstance(polars_type, pl.List):
+        return column.list.len()
+    if isinstance(polars_type, pl.Array):
+        return column.arr.len()
+    return None
+
+
+def _as_type(
+    value: str | float | int, field: FieldProperties, polars_type: pl.DataType
+) -> pl.Expr:
+    """Converts a constraint bound to a literal of the column's Polars type.
+
+    Bounds given as strings are parsed in the format of the field's type, e.g., ISO
+    8601 for dates, times and datetimes, and `YYYY-MM` for year-months.
+
+    Args:
+        value: The bound.
+        field: The field with the constraint.
+        polars_type: The Polars type of the field's column.
+
+    Returns:
+        The bound as a literal.
+
+    Raises:
+        ValueError: If the bound can't be parsed or compared to the column's values.
+    """
+    if not isinstance(value, str):
+        if polars_type.is_temporal():
+            raise ValueError(f"the bound {value!r} isn't a {field.type}.")
+        return pl.lit(value)
+
+    base_type = polars_type.base_type()
+    try:
+        if base_type is pl.Datetime:
+            parsed: float | int | date | time | datetime = datetime.fromisoformat(value)
+        elif base_type is pl.Date:
+            parsed = date.fromisoformat(
+                f"{value}-01" if field.type == "yearmonth" else value
+            )
+        elif base_type is pl.Time:
+            parsed = time.fromisoformat(value)
+        elif polars_type.is_integer():
+            parsed = int(value)
+        elif polars_type.is_numeric():
+            parsed = float(value)
+        else:
+            raise ValueError
+    except ValueError:
+        raise ValueError(f"the bound {value!r} isn't a {field.type}.") from None
+    return pl.lit(parsed).cast(polars_type)
+
+
+def _check_keys_unique(data: Data, resource_properties: ResourceProperties) -> Data:
+    """Checks that the primary key and unique keys have no duplicate values.
+
+    Column names are expected to match the names specified in the resource properties.
+
+    Args:
+        data: The data to check.
+        resource_properties: The resource properties to check against.
+
+    Returns:
+        The data, if all key values are unique.
+
+    Raises:
+        ExceptionGroup: A group of `ValueError`s, one per key with duplicate values.
+    """
+    primary_key = get_nested_attr(resource_properties, "schema.primary_key")
+    unique_keys: list[list[str]] | None = get_nested_attr(
+        resource_properties, "schema.unique_keys", default=[]
+    )
+    schema = data.collect_schema()
+    keys = [
+        (key, is_primary_key)
+        for key, is_primary_key in [
+            (primary_key, True),
+            *[(unique_key, False) for unique_key in unique_keys or []],
+        ]
+        if key and _can_check_key(key, schema)
+    ]
+    if not keys:
+        return data
+
+    duplicates = pl.collect_all(
+        [
+            _get_duplicate_keys(data, key, nulls_equal=is_primary_key)
+            for key, is_primary_key in keys
+        ],
+        engine="streaming",
+    )
+    errors = [
+        ValueError(
+            f"The {'primary' if is_primary_key else 'unique'} key {key} has "
+            f"{duplicate.height} value(s) that are in more than one row, "
+            f"{duplicate['count'].sum()} row(s) in total, e.g., "
+            f"{duplicate.drop('count').head(5).rows(named=True)}."
+        )
+        for (key, is_primary_key), duplicate in zip(keys, duplicates)
+        if not duplicate.is_empty()
+    ]
+
+    if errors:
+        raise ExceptionGroup(
+            "The following keys in the data have values that are not unique:", errors
+        )
+    return data
+
+
+def _can_check_key(key: list[str] | str, schema: pl.Schema) -> bool:
+    """Whether all the key columns are in the data and can be compared.
+
+    Keys that refer to fields that aren't in the properties are left to
+    `check_properties()`.
+    """
+    key = [key] if isinstance(key, str) else key
+    return all(
+        name in schema and not isinstance(schema[name], pl.Object) for name in key
+    )
+
+
+def _get_duplicate_keys(
+    data: pl.DataFrame | pl.LazyFrame, key: list[str] | str, nulls_equal: bool
+) -> pl.LazyFrame:
+    """Finds the values of the key that are in more than one row.
+
+    Args:
+        data: The data to check.
+        key: The names of the key columns.
+        nulls_equal: Whether missing values are compared like other values. If False,
+            rows with missing values in any of the key columns are ignored.
+
+    Returns:
+        The duplicate key values, with the number of rows they are in as `count`.
+    """
+    key = [key] if isinstance(key, str) else key
+    data = data.lazy().select(key)
+    if not nulls_equal:
+        data = data.drop_nulls()
+    return (
+        data.group_by(key)
+        .agg(pl.len().alias("count"))
+        .filter(pl.col("count") > 1)
+        .sort(key, nulls_last=True)
+    )
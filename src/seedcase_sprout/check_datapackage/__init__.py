@@ -5,6 +5,7 @@ from .check_error_matcher import CheckErrorMatcher
 from .check_package_properties import check_package_properties
 from .check_properties import check_properties
 from .check_resource_properties import check_resource_properties
+from .clear_validator_cache import clear_validator_cache
 from .constants import (
     PACKAGE_RECOMMENDED_FIELDS,
     PACKAGE_REQUIRED_FIELDS,
@@ -19,6 +20,7 @@ __all__ = [
     "check_properties",
     "check_package_properties",
     "check_resource_properties",
+    "clear_validator_cache",
     "PACKAGE_RECOMMENDED_FIELDS",
     "PACKAGE_REQUIRED_FIELDS",
     "RESOURCE_REQUIRED_FIELDS",
@@ -1,11 +1,10 @@
+from functools import partial
+
 from seedcase_sprout.check_datapackage.check_error import CheckError
-from seedcase_sprout.check_datapackage.constants import (
-    DATA_PACKAGE_SCHEMA_PATH,
-)
 from seedcase_sprout.check_datapackage.internals import (
     _add_package_recommendations,
-    _check_object_against_json_schema,
-    _read_json,
+    _check_object_against_validator,
+    _get_validator,
 )
 
 
@@ -31,8 +30,15 @@ def check_package_properties(
     Returns:
         A list of errors. An empty list, if no errors are found.
     """
-    schema = _read_json(DATA_PACKAGE_SCHEMA_PATH)
+    validator = _get_validator(
+        f"package-properties-{check_recommendations}",
+        partial(_build_schema, check_recommendations=check_recommendations),
+    )
+    return _check_object_against_validator(properties, validator)
+
 
+def _build_schema(schema: dict, check_recommendations: bool) -> dict:
+    """Builds the schema for checking only package properties."""
     # Recommendations from the Data Package standard
     if check_recommendations:
         _add_package_recommendations(schema)
@@ -42,4 +48,4 @@ def check_package_properties(
     del schema["properties"]["resources"]["minItems"]
     del schema["properties"]["resources"]["items"]
 
-    return _check_object_against_json_schema(properties, schema)
+    return schema
@@ -1,10 +1,11 @@
+from functools import partial
+
 from seedcase_sprout.check_datapackage.check_error import CheckError
-from seedcase_sprout.check_datapackage.constants import DATA_PACKAGE_SCHEMA_PATH
 from seedcase_sprout.check_datapackage.internals import (
     _add_package_recommendations,
     _add_resource_recommendations,
-    _check_object_against_json_schema,
-    _read_json,
+    _check_object_against_validator,
+    _get_validator,
 )
 
 
@@ -29,10 +30,17 @@ def check_properties(
     Returns:
         A list of errors. An empty list, if no errors are found.
     """
-    schema = _read_json(DATA_PACKAGE_SCHEMA_PATH)
+    validator = _get_validator(
+        f"properties-{check_recommendations}",
+        partial(_build_schema, check_recommendations=check_recommendations),
+    )
+    return _check_object_against_validator(properties, validator)
+
 
+def _build_schema(schema: dict, check_recommendations: bool) -> dict:
+    """Builds the schema for checking package and resource properties."""
     if check_recommendations:
         _add_package_recommendations(schema)
         _add_resource_recommendations(schema)
 
-    return _check_object_against_json_schema(properties, schema)
+    return schema
@@ -0,0 +1,13 @@
+from seedcase_sprout.check_datapackage.internals import _clear_validators
+
+
+def clear_validator_cache() -> None:
+    """Clears the cached Data Package schema and its compiled validators.
+
+    The Data Package schema is read and compiled into a validator only once per process
+    for each kind of check, the first time the check is run. Later checks reuse the
+    same validator, until the modification time or size of the schema file changes.
+    Use this function to force the schema to be read and compiled again on the next
+    check, e.g., if the schema file was changed without changing either.
+    """
+    _clear_validators()
@@ -1,22 +1,112 @@
 import re
+from copy import deepcopy
+from functools import lru_cache
+from hashlib import sha256
 from json import loads
 from pathlib import Path
-from typing import Iterator
+from threading import Lock
+from typing import Callable, Iterator
 
 from jsonschema import Draft7Validator, FormatChecker, ValidationError
 
 from seedcase_sprout.check_datapackage.check_error import CheckError
 from seedcase_sprout.check_datapackage.constants import (
     COMPLEX_VALIDATORS,
+    DATA_PACKAGE_SCHEMA_PATH,
     NAME_PATTERN,
     PACKAGE_RECOMMENDED_FIELDS,
     SEMVER_PATTERN,
 )
 
+# Compiled validators, keyed by the hash of the schema file contents and the name of
+# the schema variant. Filled in lazily by `_get_validator()`.
+_VALIDATORS: dict[tuple[str, str], Draft7Validator] = {}
+_VALIDATORS_LOCK = Lock()
+# Increased whenever validators are removed, so caches of check results can tell
+# that they were made with other validators.
+_validators_generation = 0
 
-def _read_json(path: Path) -> dict:
-    """Reads the contents of a JSON file into an object."""
-    return loads(path.read_text())
+
+def _read_schema(path: Path) -> tuple[str, dict]:
+    """Reads a JSON schema file, only again once the file has changed.
+
+    The file is read again only if its modification time or size has changed since
+    it was last read.
+
+    Args:
+        path: The path to the JSON schema file.
+
+    Returns:
+        The SHA-256 hash of the file contents and the parsed schema. The schema must
+            not be modified, as it is shared between all callers.
+    """
+    stat = path.stat()
+    return _read_schema_file(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1)
+def _read_schema_file(path: Path, mtime_ns: int, size: int) -> tuple[str, dict]:
+    """Reads a JSON schema file, cached by its path, modification time and size."""
+    contents = path.read_bytes()
+    return sha256(contents).hexdigest(), loads(contents)
+
+
+def _get_validator(
+    variant: str, build_schema: Callable[[dict], dict]
+) -> Draft7Validator:
+    """Gets the compiled validator for a variant of the Data Package schema.
+
+    The validator for each variant is only built the first time it is requested. Later
+    calls reuse the same validator, as long as the contents of the schema file
+    haven't changed. Use `clear_validator_cache()` to force rebuilding the validators.
+
+    Args:
+        variant: A name uniquely identifying the schema variant built by
+            `build_schema`.
+        build_schema: A function that takes a copy of the full Data Package schema,
+            modifies it to create the variant and returns it.
+
+    Returns:
+        The validator for the schema variant.
+
+    Raises:
+        jsonschema.exceptions.SchemaError: If the built schema is invalid.
+    """
+    global _validators_generation
+    schema_hash, schema = _read_schema(DATA_PACKAGE_SCHEMA_PATH)
+    key = (schema_hash, variant)
+    with _VALIDATORS_LOCK:
+        if key not in _VALIDATORS:
+            # Validators of an earlier version of the schema file won't be used again.
+            old_keys = [old for old in _VALIDATORS if old[0] != schema_hash]
+            for old_key in old_keys:
+                del _VALIDATORS[old_key]
+            if old_keys:
+                _validators_generation += 1
+            variant_schema = build_schema(deepcopy(schema))
+            Draft7Validator.check_schema(variant_schema)
+            _VALIDATORS[key] = Draft7Validator(
+                variant_schema, format_checker=FormatChecker()
+            )
+        return _VALIDATORS[key]
+
+
+def _clear_validators() -> None:
+    """Removes all compiled validators and the cached schema file contents."""
+    global _validators_generation
+    with _VALIDATORS_LOCK:
+        _VALIDATORS.clear()
+        _read_schema_file.cache_clear()
+        _validators_generation += 1
+
+
+def _get_validators_generation() -> int:
+    """Gets the number of times compiled validators have been removed.
+
+    Results of checks that were cached under an earlier generation may have been
+    made with other validators and shouldn't be reused.
+    """
+    return _validators_generation
 
 
 def _add_package_recommendations(schema: dict) -> dict:
@@ -55,26 +145,21 @@ def _add_resource_recommendations(schema: dict) -> dict:
     return schema
 
 
-def _check_object_against_json_schema(
-    json_object: dict, schema: dict
+def _check_object_against_validator(
+    json_object: dict, validator: Draft7Validator
 ) -> list[CheckError]:
-    """Checks that `json_object` matches the given JSON schema.
+    """Checks that `json_object` matches the JSON schema of the given validator.
 
     Structural, type and format constraints are all checked. All schema violations are
     collected before errors are returned.
 
     Args:
         json_object: The JSON object to check.
-        schema: The JSON schema to check against.
+        validator: The validator for the JSON schema to check against.
 
     Returns:
         A list of errors. An empty list, if no errors are found.
-
-    Raises:
-        jsonschema.exceptions.SchemaError: If the given schema is invalid.
     """
-    Draft7Validator.check_schema(schema)
-    validator = Draft7Validator(schema, format_checker=FormatChecker())
     return _validation_errors_to_check_errors(validator.iter_errors(json_object))
 
 
@@ -0,0 +1,234 @@
+from pathlib import Path
+
+import polars as pl
+
+from seedcase_sprout.check_properties import check_properties
+from seedcase_sprout.lookup_resource_data import _scan_data
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.properties import (
+    PackageProperties,
+    ResourceProperties,
+    TableSchemaForeignKeyProperties,
+)
+
+
+def check_foreign_keys(
+    package_properties: PackageProperties, package_path: Path | None = None
+) -> PackageProperties:
+    """Checks that the foreign keys of all resources refer to existing rows.
+
+    For each foreign key in the `schema.foreign_keys` of each resource, the values of
+    its `fields` in the resource's data must be in the `reference.fields` of the
+    referenced resource's data. A foreign key without a `reference.resource` refers to
+    the resource itself. As in the Data Package standard, rows with a missing value in
+    any of the foreign key fields are ignored.
+
+    The data files are scanned lazily and the rows without a referenced row are found
+    with an anti-join. All foreign keys of the package are checked together on Polars'
+    streaming engine, which checks them in parallel without reading all the data
+    into memory. Resources without a data file are skipped, unless they are
+    referenced by a resource with a data file.
+
+    The referenced values are cast to the types of the foreign key fields. Values that
+    can't be cast, e.g., text referenced by an integer field, don't match any foreign
+    key value. A foreign key that can't be checked at all, e.g., because a referenced
+    field isn't in the data, is reported without stopping the other checks.
+
+    Args:
+        package_properties: The properties of the package, with the properties of its
+            resources.
+        package_path: The path to the data package root folder (where `datapackage.json`
+            is located). Defaults to the current working directory.
+
+    Returns:
+        Outputs the `package_properties` if all foreign keys refer to existing rows.
+
+    Raises:
+        ExceptionGroup[CheckError]: If the package properties are incorrect.
+        ExceptionGroup[ValueError]: If any foreign key has values without a referenced
+            row, refers to a resource that doesn't exist or has no data file, or
+            can't be checked. Has one error per foreign key.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            resource_properties = sp.example_resource_properties()
+            sp.write_resource_data(sp.example_data(), resource_properties)
+            sp.check_foreign_keys(sp.read_properties())
+        ```
+    """
+    check_properties(package_properties)
+    path = PackagePath(package_path)
+    resources = {
+        str(resource.name): resource for resource in package_properties.resources or []
+    }
+
+    checks = []
+    errors: list[Exception] = []
+    for resource in resources.values():
+        data_path = path.root() / str(resource.path)
+        if not data_path.exists():
+            continue
+        for foreign_key in _get_foreign_keys(resource):
+            try:
+                checks.append(
+                    (
+                        resource,
+                        foreign_key,
+                        _get_orphan_keys(
+                            _scan_data(data_path), foreign_key, resources, path
+                        ),
+                    )
+                )
+            except ValueError as error:
+                error.add_note(f"Resource: {resource.name}")
+                errors.append(error)
+
+    orphan_keys = _collect_orphan_keys([query for _, _, query in checks])
+    for (resource, foreign_key, _), orphans in zip(checks, orphan_keys):
+        if isinstance(orphans, pl.exceptions.PolarsError):
+            errors.append(_create_failed_check_error(resource, foreign_key, orphans))
+        elif not orphans.is_empty():
+            errors.append(_create_orphan_keys_error(resource, foreign_key, orphans))
+
+    if errors:
+        raise ExceptionGroup(
+            "The following foreign keys in the data refer to rows that don't exist:",
+            errors,
+        )
+    return package_properties
+
+
+def _get_foreign_keys(
+    resource: ResourceProperties,
+) -> list[TableSchemaForeignKeyProperties]:
+    """Gets the foreign keys of the resource that have fields."""
+    foreign_keys = resource.schema.foreign_keys if resource.schema else None
+    return [foreign_key for foreign_key in foreign_keys or [] if foreign_key.fields]
+
+
+def _get_orphan_keys(
+    data: pl.LazyFrame,
+    foreign_key: TableSchemaForeignKeyProperties,
+    resources: dict[str, ResourceProperties],
+    path: PackagePath,
+) -> pl.LazyFrame:
+    """Finds the foreign key values in the data that aren't in the referenced data.
+
+    Args:
+        data: The data of the resource with the foreign key.
+        foreign_key: The foreign key.
+        resources: The properties of all resources in the package, by name.
+        path: The path to the data package.
+
+    Returns:
+        The foreign key values without a referenced row, with the number of rows
+            they are in as `count`.
+
+    Raises:
+        ValueError: If the referenced resource doesn't exist or has no data file.
+    """
+    fields = list(foreign_key.fields or [])
+    reference = foreign_key.reference
+    reference_fields = list(reference.fields or []) if reference else fields
+    reference_name = reference.resource if reference else None
+
+    if reference_name:
+        if reference_name not in resources:
+            raise ValueError(
+                f"The foreign key {fields} refers to the resource '{reference_name}', "
+                "which isn't in the package."
+            )
+        reference_path = path.root() / str(resources[reference_name].path)
+        if not reference_path.exists():
+            raise ValueError(
+                f"The foreign key {fields} refers to the resource '{reference_name}', "
+                "which has no data file."
+            )
+        reference_data = _scan_data(reference_path)
+    else:
+        reference_data = data
+
+    schema = data.collect_schema()
+    referenced_keys = (
+        reference_data.select(
+            pl.col(reference_field).cast(schema[field], strict=False).alias(field)
+            for field, reference_field in zip(fields, reference_fields)
+        )
+        .drop_nulls()
+        .unique()
+    )
+    return (
+        data.select(fields)
+        .drop_nulls()
+        .join(referenced_keys, on=fields, how="anti")
+        .group_by(fields)
+        .agg(pl.len().alias("count"))
+    )
+
+
+def _collect_orphan_keys(
+    queries: list[pl.LazyFrame],
+) -> list[pl.DataFrame | pl.exceptions.PolarsError]:
+    """Collects the foreign key values without a referenced row of each foreign key.
+
+    The queries are collected together. If that fails, they are collected one by one,
+    so the error of a foreign key that can't be checked doesn't hide the others.
+
+    Args:
+        queries: The queries from `_get_orphan_keys()`.
+
+    Returns:
+        The result of each query, or the error it raised.
+    """
+    try:
+        return list(pl.collect_all(queries, engine="streaming"))
+    except pl.exceptions.PolarsError:
+        pass
+
+    results: list[pl.DataFrame | pl.exceptions.PolarsError] = []
+    for query in queries:
+        try:
+            results.append(query.collect(engine="streaming"))
+        except pl.exceptions.PolarsError as error:
+            results.append(error)
+    return results
+
+
+def _create_orphan_keys_error(
+    resource: ResourceProperties,
+    foreign_key: TableSchemaForeignKeyProperties,
+    orphans: pl.DataFrame,
+) -> ValueError:
+    """Creates the error for the foreign key values without a referenced row."""
+    reference = foreign_key.reference
+    reference_name = (reference.resource if reference else None) or resource.name
+    reference_fields = (
+        reference.fields if reference and reference.fields else foreign_key.fields
+    )
+    examples = (
+        orphans.drop("count").sort(pl.all(), nulls_last=True).head(5).rows(named=True)
+    )
+    error = ValueError(
+        f"The foreign key {foreign_key.fields} has {orphans.height} value(s) that are "
+        f"not in the field(s) {reference_fields} of resource '{reference_name}', "
+        f"{orphans['count'].sum()} row(s) in total, e.g., {examples}."
+    )
+    error.add_note(f"Resource: {resource.name}")
+    return error
+
+
+def _create_failed_check_error(
+    resource: ResourceProperties,
+    foreign_key: TableSchemaForeignKeyProperties,
+    polars_error: pl.exceptions.PolarsError,
+) -> ValueError:
+    """Creates the error for a foreign key that Polars couldn't check."""
+    error = ValueError(
+        f"Can't check the foreign key {foreign_key.fields}, as Polars raised "
+        f"{type(polars_error).__name__}: {polars_error}"
+    )
+    error.add_note(f"Resource: {resource.name}")
+    return error
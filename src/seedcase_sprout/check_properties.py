@@ -1,4 +1,9 @@
+from collections import OrderedDict
+from threading import Lock
+
 import seedcase_sprout.check_datapackage as cdp
+from seedcase_sprout.check_datapackage.internals import _get_validators_generation
+from seedcase_sprout.internals import _get_json_hash
 from seedcase_sprout.properties import PackageProperties, ResourceProperties
 from seedcase_sprout.sprout_checks.get_sprout_package_errors import (
     get_sprout_package_errors,
@@ -10,6 +15,16 @@ from seedcase_sprout.sprout_checks.get_sprout_resource_errors import (
 # Script only constant
 _RESOURCE_FIELD_PATTERN = r"resources\[\d+\]"
 
+# Hashes of the resource properties that have most recently passed
+# `check_resource_properties()`, with the least recently used first. Only the last
+# `_CHECKED_RESOURCE_PROPERTIES_MAX_SIZE` are kept, as, e.g., every write of resource
+# data changes the properties.
+_CHECKED_RESOURCE_PROPERTIES: OrderedDict[str, None] = OrderedDict()
+_CHECKED_RESOURCE_PROPERTIES_MAX_SIZE = 1024
+_CHECKED_RESOURCE_PROPERTIES_LOCK = Lock()
+# The generation of the validators the hashes were checked with.
+_checked_resource_properties_generation = 0
+
 
 def check_package_properties(properties: PackageProperties) -> PackageProperties:
     """Checks that the package, not resource, `properties` match Sprout's requirements.
@@ -87,6 +102,11 @@ def check_resource_properties(properties: ResourceProperties) -> ResourcePropert
     - `path` includes resource name.
     - `data` is not set.
 
+    Functions that check the resource properties along the way, like `check_data()`
+    or `write_resource_batch()`, skip the check if properties with the same content
+    have already passed it. This function always checks the `properties`, so use it
+    to force checking them again.
+
     Args:
         properties: The resource properties to check.
 
@@ -98,6 +118,7 @@ def check_resource_properties(properties: ResourceProperties) -> ResourcePropert
     """
     package_field_pattern = r"\$\.\w+$"
     _check_is_resource_properties_type(properties)
+    properties_dict = properties.compact_dict
     try:
         _generic_check_properties(
             PackageProperties(resources=[properties]),
@@ -110,9 +131,66 @@ def check_resource_properties(properties: ResourceProperties) -> ResourcePropert
                 error.json_path = error.json_path.replace(".resources[0]", "")
         raise error_info
 
+    _add_checked_resource_properties(_get_json_hash(properties_dict))
     return properties
 
 
+def _check_resource_properties_once(
+    properties: ResourceProperties,
+) -> ResourceProperties:
+    """Checks the resource `properties`, unless the same properties have passed before.
+
+    The check is skipped if resource properties with the same content have already
+    passed `check_resource_properties()` in this process. This way, the same
+    properties are checked only once when they are used by several functions in a row,
+    e.g., when writing, reading and joining batch files.
+
+    Args:
+        properties: The resource properties to check.
+
+    Returns:
+        Outputs the `properties` if all checks pass.
+
+    Raises:
+        ExceptionGroup: A group of `CheckError`s, one error per failed check.
+    """
+    _check_is_resource_properties_type(properties)
+    if not _is_checked_resource_properties(_get_json_hash(properties.compact_dict)):
+        check_resource_properties(properties)
+    return properties
+
+
+def _add_checked_resource_properties(properties_hash: str) -> None:
+    """Remembers that the resource properties with the hash have passed the checks.
+
+    The least recently used hash is forgotten once there are too many. All hashes are
+    forgotten once the validators have been cleared, e.g., by
+    `clear_validator_cache()`.
+    """
+    global _checked_resource_properties_generation
+    with _CHECKED_RESOURCE_PROPERTIES_LOCK:
+        generation = _get_validators_generation()
+        if generation != _checked_resource_properties_generation:
+            _CHECKED_RESOURCE_PROPERTIES.clear()
+            _checked_resource_properties_generation = generation
+        _CHECKED_RESOURCE_PROPERTIES[properties_hash] = None
+        _CHECKED_RESOURCE_PROPERTIES.move_to_end(properties_hash)
+        while len(_CHECKED_RESOURCE_PROPERTIES) > _CHECKED_RESOURCE_PROPERTIES_MAX_SIZE:
+            _CHECKED_RESOURCE_PROPERTIES.popitem(last=False)
+
+
+def _is_checked_resource_properties(properties_hash: str) -> bool:
+    """Whether resource properties with the hash have recently passed the checks."""
+    with _CHECKED_RESOURCE_PROPERTIES_LOCK:
+        if (
+            _get_validators_generation() != _checked_resource_properties_generation
+            or properties_hash not in _CHECKED_RESOURCE_PROPERTIES
+        ):
+            return False
+        _CHECKED_RESOURCE_PROPERTIES.move_to_end(properties_hash)
+        return True
+
+
 def _generic_check_properties(
     properties: PackageProperties, ignore: list[cdp.CheckErrorMatcher] = []
 ) -> PackageProperties:
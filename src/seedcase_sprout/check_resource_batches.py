@@ -0,0 +1,113 @@
+from pathlib import Path
+
+import polars as pl
+
+from seedcase_sprout.check_data import check_data
+from seedcase_sprout.check_properties import (
+    _check_resource_properties_once,
+)
+from seedcase_sprout.constants import BATCH_TIMESTAMP_COLUMN_NAME
+from seedcase_sprout.internals import _check_is_file
+from seedcase_sprout.paths import PackagePath, _get_batch_manifest_timestamps
+from seedcase_sprout.properties import ResourceProperties
+from seedcase_sprout.read_resource_batches import (
+    _check_batch_file_timestamp,
+    _check_has_timestamp_column,
+    _check_no_timestamp_column,
+    _extract_timestamp_from_batch_file_path,
+    _is_compacted_batch_file,
+)
+
+
+def check_resource_batches(
+    resource_properties: ResourceProperties, paths: list[Path] | None = None
+) -> list[Path]:
+    """Checks the structure of the batch resource file(s) without reading their data.
+
+    For each batch file given by `paths`, only the schema stored in the Parquet file's
+    metadata (the "footer") is read, which is a few kilobytes no matter how much data
+    the file has. The column names and types in the schema are then checked against
+    the `resource_properties`, like `check_data()` does. The names of batch files that
+    aren't in the batch manifest are checked to contain a correct timestamp.
+
+    This makes it a fast way to confirm that all the files in a resource's
+    `batch/` folder are correctly structured, before reading them with
+    `read_resource_batches()` or `scan_resource_batches()`. Since the data itself
+    isn't read, the values in the data are not checked against any constraints.
+
+    Args:
+        resource_properties: The `ResourceProperties` object that contains the
+            properties of the resource you want to check the batch files against.
+        paths: A list of paths for all the files in the resource's `batch/` folder.
+            Use `PackagePath().resource_batch_files()` to help provide the correct
+            paths to the batch files. Defaults to the batch files of the given resource.
+
+    Returns:
+        Outputs the `paths` to the batch files if all checks pass.
+
+    Raises:
+        ExceptionGroup[CheckError]: If the resource properties are incorrect.
+        ExceptionGroup: If any of the batch files don't pass the checks. Contains one
+            error per failed file, with a note giving the path of the file.
+
+    Examples:
+        ``` {python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            resource_properties = sp.example_resource_properties()
+            sp.write_resource_batch(sp.example_data(), resource_properties)
+
+            sp.check_resource_batches(resource_properties)
+        ```
+    """
+    _check_resource_properties_once(resource_properties)
+    if paths is None:
+        paths = PackagePath().resource_batch_files(str(resource_properties.name))
+
+    manifest_timestamps = _get_batch_manifest_timestamps(paths)
+    errors = []
+    for path in paths:
+        try:
+            _check_batch_file_schema(
+                path, resource_properties, path in manifest_timestamps
+            )
+        except Exception as error:
+            error.add_note(f"Batch file: {path}")
+            errors.append(error)
+
+    if errors:
+        raise ExceptionGroup(
+            f"{len(errors)} of the {len(paths)} batch files did not pass the checks.",
+            errors,
+        )
+
+    return paths
+
+
+def _check_batch_file_schema(
+    path: Path, resource_properties: ResourceProperties, is_in_manifest: bool = False
+) -> Path:
+    """Checks the name and the schema of a Parquet batch file.
+
+    Args:
+        path: Path to the Parquet batch file.
+        resource_properties: The resource properties to check the schema against.
+        is_in_manifest: Whether the batch file is in the batch manifest. If it is, its
+            name isn't checked, as its timestamp is taken from the manifest.
+
+    Returns:
+        The path, if all checks pass.
+    """
+    _check_is_file(path)
+    if not is_in_manifest:
+        _check_batch_file_timestamp(_extract_timestamp_from_batch_file_path(path))
+
+    schema = pl.read_parquet_schema(path)
+    if _is_compacted_batch_file(path):
+        _check_has_timestamp_column(list(schema))
+        del schema[BATCH_TIMESTAMP_COLUMN_NAME]
+    else:
+        _check_no_timestamp_column(list(schema))
+    check_data(pl.LazyFrame(schema=schema), resource_properties)
+    return path
@@ -0,0 +1,239 @@
+import hashlib
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from uuid import uuid4
+
+import polars as pl
+
+from seedcase_sprout.check_properties import _check_resource_properties_once
+from seedcase_sprout.constants import (
+    BATCH_TIMESTAMP_COLUMN_NAME,
+    COMPACTED_BATCH_FILE_SUFFIX,
+)
+from seedcase_sprout.get_nested_attr import get_nested_attr
+from seedcase_sprout.internals import (
+    _lock,
+    _read_jsonl,
+    _write_jsonl,
+)
+from seedcase_sprout.parquet_write_options import (
+    ParquetWriteOptions,
+    _get_parquet_write_kwargs,
+)
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.properties import ResourceProperties
+from seedcase_sprout.read_resource_batches import (
+    _get_batch_file_timestamps,
+    _is_compacted_batch_file,
+)
+from seedcase_sprout.scan_resource_batches import scan_resource_batches
+from seedcase_sprout.write_resource_batch import _create_batch_manifest_entry
+from seedcase_sprout.write_resource_data import _write_data_file
+
+
+@dataclass(frozen=True)
+class BatchCompactionReport:
+    """A report of the batch files merged by `compact_resource_batches()`.
+
+    Attributes:
+        batch_files (list[Path]): The batch files that were (or would be) merged.
+        compacted_file (Path | None): The batch file they were (or would be) merged
+            into. None, if there were fewer than two batch files to merge.
+        bytes_before (int): The total size of the merged batch files in bytes.
+        bytes_after (int): The size of the compacted batch file in bytes.
+        dry_run (bool): Whether the batch files were left unchanged.
+    """
+
+    batch_files: list[Path]
+    compacted_file: Path | None
+    bytes_before: int
+    bytes_after: int
+    dry_run: bool
+
+    @property
+    def files_saved(self) -> int:
+        """The number of batch files fewer after compacting."""
+        return max(len(self.batch_files) - 1, 0)
+
+    @property
+    def bytes_saved(self) -> int:
+        """The number of bytes saved by compacting."""
+        return self.bytes_before - self.bytes_after
+
+
+def compact_resource_batches(
+    resource_properties: ResourceProperties,
+    package_path: Path | None = None,
+    dry_run: bool = False,
+    parquet_options: ParquetWriteOptions | None = None,
+) -> BatchCompactionReport:
+    """Merges the resource's batch files into a single, larger batch file.
+
+    Resources that get data in many small batches end up with many small batch files,
+    which makes reading them slow. This function merges all the batch files that
+    haven't been compacted yet into one compacted batch file and then deletes them.
+
+    The compacted batch file keeps the timestamp of the batch file each row came from
+    in a timestamp column, so joining the batch files with `join_resource_batches()`
+    still keeps the latest version of each observational unit. Rows that are
+    replaced by a later version in the merged batch files are dropped, just as they
+    would be when joining the batch files. The batch manifest is updated to list the
+    compacted batch file instead of the merged ones. As the merged batch files are
+    gone, the next `build_resource_data()` fully rebuilds the data file.
+
+    The resource is locked while compacting, so no batch files can be added to it in
+    the meantime.
+
+    Args:
+        resource_properties: The `ResourceProperties` object that contains the
+            properties of the resource to compact the batch files of.
+        package_path: The path to the data package root folder (where `datapackage.json`
+            is located). Defaults to the current working directory.
+        dry_run: Whether to only report what compacting would do, without changing
+            any files. Defaults to False.
+        parquet_options: The options for writing the compacted batch file. Defaults to
+            None, which uses the default options (see
+            `set_default_parquet_write_options()`).
+
+    Returns:
+        A report with the merged batch files, the compacted batch file, and their
+            sizes.
+
+    Raises:
+        ExceptionGroup: A group of `CheckError`s, if resource properties are incorrect,
+            or a group of errors for the batch files that don't match them.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            resource_properties = sp.example_resource_properties()
+            sp.write_resource_batch(sp.example_data(), resource_properties)
+            sp.write_resource_batch(sp.example_data(), resource_properties)
+
+            # See what compacting would do first
+            print(sp.compact_resource_batches(resource_properties, dry_run=True))
+            sp.compact_resource_batches(resource_properties)
+        ```
+    """
+    _check_resource_properties_once(resource_properties)
+    path = PackagePath(package_path)
+    with _lock(path.resource(str(resource_properties.name)), exclusive=not dry_run):
+        return _compact_resource_batches(
+            resource_properties, path, dry_run, parquet_options
+        )
+
+
+def _compact_resource_batches(
+    resource_properties: ResourceProperties,
+    path: PackagePath,
+    dry_run: bool,
+    parquet_options: ParquetWriteOptions | None,
+) -> BatchCompactionReport:
+    """Compacts the batch files, while the resource folder is locked."""
+    resource_name = str(resource_properties.name)
+    batch_files = [
+        batch_file
+        for batch_file in path.resource_batch_files(resource_name)
+        if not _is_compacted_batch_file(batch_file)
+    ]
+    bytes_before = sum(batch_file.stat().st_size for batch_file in batch_files)
+    if len(batch_files) < 2:
+        return BatchCompactionReport(
+            batch_files=[],
+            compacted_file=None,
+            bytes_before=0,
+            bytes_after=0,
+            dry_run=dry_run,
+        )
+
+    data = _drop_replaced_rows(
+        scan_resource_batches(resource_properties, batch_files),
+        get_nested_attr(resource_properties, "schema.primary_key"),
+    ).collect(engine="streaming")
+    # Not taken from the data, as the merged batch files may have no rows.
+    timestamp = max(_get_batch_file_timestamps(batch_files).values())
+    compacted_file = path.resource_batch(resource_name) / (
+        f"{timestamp}-{uuid4()}{COMPACTED_BATCH_FILE_SUFFIX}"
+    )
+    write_kwargs = _get_parquet_write_kwargs(parquet_options)
+
+    if dry_run:
+        buffer = BytesIO()
+        data.write_parquet(buffer, **write_kwargs)
+        bytes_after = buffer.getbuffer().nbytes
+    else:
+        digest = _write_data_file(data, compacted_file, write_kwargs, "sha256")
+        _update_batch_manifest(
+            path, resource_name, batch_files, compacted_file, timestamp, data, digest
+        )
+        for batch_file in batch_files:
+            batch_file.unlink()
+        bytes_after = compacted_file.stat().st_size
+
+    return BatchCompactionReport(
+        batch_files=batch_files,
+        compacted_file=compacted_file,
+        bytes_before=bytes_before,
+        bytes_after=bytes_after,
+        dry_run=dry_run,
+    )
+
+
+def _drop_replaced_rows(
+    data: pl.LazyFrame, primary_key: list[str] | str | None
+) -> pl.LazyFrame:
+    """Drops rows that are replaced by rows from a later batch file.
+
+    Unlike when joining batch files, the timestamp column is kept, and rows are
+    sorted by it.
+    """
+    if not primary_key:
+        columns = data.collect_schema().names()
+        columns.remove(BATCH_TIMESTAMP_COLUMN_NAME)
+        return data.unique(subset=columns, keep="any").sort(
+            BATCH_TIMESTAMP_COLUMN_NAME, maintain_order=True
+        )
+
+    timestamp = pl.col(BATCH_TIMESTAMP_COLUMN_NAME)
+    return data.filter(timestamp == timestamp.max().over(primary_key)).sort(
+        BATCH_TIMESTAMP_COLUMN_NAME, maintain_order=True
+    )
+
+
+def _update_batch_manifest(
+    path: PackagePath,
+    resource_name: str,
+    batch_files: list[Path],
+    compacted_file: Path,
+    timestamp: str,
+    data: pl.DataFrame,
+    digest: "hashlib._Hash",
+) -> None:
+    """Replaces the merged batch files with the compacted one in the batch manifest.
+
+    Unlike adding batch files, this rewrites the manifest, as entries are removed.
+    Nothing is done if the resource has no batch manifest.
+    """
+    manifest_path = path.resource_batch_manifest(resource_name)
+    if not manifest_path.is_file():
+        return
+
+    merged_names = {batch_file.name for batch_file in batch_files}
+    entries = [
+        entry
+        for entry in _read_jsonl(manifest_path)
+        if entry["file"] not in merged_names
+    ]
+    entries.append(
+        _create_batch_manifest_entry(
+            compacted_file,
+            timestamp,
+            data.height,
+            data.drop(BATCH_TIMESTAMP_COLUMN_NAME).schema,
+            digest,
+        )
+    )
+    _write_jsonl(entries, manifest_path)
@@ -3,14 +3,32 @@ from pathlib import Path
 
 """Constants in the seedcase_sprout module."""
 
-"""The format of the timestamp used in batch file names."""
-BATCH_TIMESTAMP_FORMAT = "%Y-%m-%dT%H%M%SZ"
+"""The format of the UTC timestamp used in batch file names, with microseconds."""
+BATCH_TIMESTAMP_FORMAT = "%Y-%m-%dT%H%M%S%fZ"
 
-"""Regex pattern for timestamps with the format '%Y-%m-%dT%H%M%SZ'. Must match the
-format used by BATCH_TIMESTAMP_FORMAT"""
-BATCH_TIMESTAMP_PATTERN = r"\d{4}-\d{2}-\d{2}T\d{6}Z"
+"""Regex pattern for timestamps with the format '%Y-%m-%dT%H%M%S%fZ' or the legacy
+format '%Y-%m-%dT%H%M%SZ'. Must match the format used by BATCH_TIMESTAMP_FORMAT."""
+BATCH_TIMESTAMP_PATTERN = r"\d{4}-\d{2}-\d{2}T\d{6}(?:\d{6})?Z"
+
+"""Regex pattern for timestamps in the legacy format '%Y-%m-%dT%H%M%SZ', without
+microseconds, used in batch file names written by earlier versions. These are still
+read, as if their microseconds were 0."""
+LEGACY_BATCH_TIMESTAMP_PATTERN = r"\d{4}-\d{2}-\d{2}T\d{6}Z"
 
 """The name of the timestamp column added to the batch data (only used internally)."""
 BATCH_TIMESTAMP_COLUMN_NAME = "_batch_file_timestamp_"
 
+"""The end of the names of batch files made by `compact_resource_batches()`. These
+files keep the timestamp of each row's original batch file in the timestamp column."""
+COMPACTED_BATCH_FILE_SUFFIX = ".compacted.parquet"
+
+"""The name of the batch manifest file in a resource's `batch/` folder."""
+BATCH_MANIFEST_FILE_NAME = "manifest.jsonl"
+
+"""The size in bytes of the buffer used to write (and hash) a resource's data file."""
+DATA_FILE_BUFFER_SIZE = 8 * 1024 * 1024
+
+"""The default number of seconds to wait for a lock on a package or resource folder."""
+LOCK_TIMEOUT_SECONDS = 60
+
 TEMPLATES_PATH = Path(str(files("seedcase_sprout").joinpath("templates")))
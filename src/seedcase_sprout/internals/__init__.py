@@ -6,10 +6,11 @@ from .create import (
     _create_resource_properties_script_filename,
 )
 from .functionals import _map, _map2
-from .get import _get_iso_timestamp
-from .read import _read_json
+from .get import _get_iso_timestamp, _get_json_hash
+from .lock import _lock
+from .read import _read_json, _read_jsonl
 from .to import _to_camel_case, _to_snake_case
-from .write import _write_json
+from .write import _append_jsonl, _write_atomically, _write_json, _write_jsonl
 
 __all__ = [
     "_check_is_file",
@@ -18,9 +19,15 @@ __all__ = [
     "_create_resource_properties_script_filename",
     "_to_snake_case",
     "_get_iso_timestamp",
+    "_get_json_hash",
+    "_lock",
     "_map",
     "_map2",
     "_read_json",
+    "_read_jsonl",
     "_write_json",
+    "_write_atomically",
+    "_write_jsonl",
+    "_append_jsonl",
     "_to_camel_case",
 ]
@@ -3,17 +3,22 @@ from pathlib import Path
 from seedcase_sprout.internals.to import _to_snake_case
 
 
-def _create_resource_data_path(resource_name: str) -> str:
+def _create_resource_data_path(resource_name: str, partitioned: bool = False) -> str:
     """Creates a stringified relative path to the resource data file based on the name.
 
     Args:
         resource_name: The name of the resource.
+        partitioned: Whether the data is partitioned into a folder of Parquet files
+            instead of a single file. Defaults to False.
 
     Returns:
         The relative path from the package root to the resource data file.
-            E.g., "resources/test-resource/data.parquet"
+            E.g., "resources/test-resource/data.parquet", or
+            "resources/test-resource/data" if partitioned.
     """
-    return str(Path("resources", resource_name, "data.parquet"))
+    return str(
+        Path("resources", resource_name, "data" if partitioned else "data.parquet")
+    )
 
 
 def _create_resource_properties_script_filename(resource_name: str = "") -> str:
@@ -1,4 +1,6 @@
+import json
 from datetime import datetime
+from hashlib import sha256
 
 
 def _get_iso_timestamp() -> str:
@@ -8,3 +10,15 @@ def _get_iso_timestamp() -> str:
         The current ISO timestamp as a string. E.g. `2024-05-14T05:00:01+00:00`.
     """
     return datetime.now().astimezone().isoformat(timespec="seconds")
+
+
+def _get_json_hash(json_object: list | dict) -> str:
+    """Gets a hash of a JSON serialisable object that doesn't depend on key order.
+
+    Args:
+        json_object: The object to hash. Must be JSON serialisable.
+
+    Returns:
+        The SHA-256 hash of the object as a hexadecimal string.
+    """
+    return sha256(json.dumps(json_object, sort_keys=True).encode()).hexdigest()
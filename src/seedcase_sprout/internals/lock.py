@@ -0,0 +1,102 @@
+"""File locks to coordinate writes to a data package between processes.
+
+Locks are taken on the folder of the package (for package-wide writes like
+`datapackage.json`) or of a resource (for its batch and data files), so no extra
+lock files are added to the package. Many holders can share a shared lock, e.g.,
+to add batch files in parallel, while an exclusive lock has a single holder, e.g.,
+to rebuild the data file. Locking is only enforced on systems with `fcntl`
+(Linux and macOS).
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from time import monotonic, sleep
+from typing import Iterator
+
+from seedcase_sprout.constants import LOCK_TIMEOUT_SECONDS
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+"""The locks held by the current thread, by folder, with whether they are exclusive."""
+_HELD_LOCKS = threading.local()
+
+
+@contextmanager
+def _lock(
+    path: Path, exclusive: bool = True, timeout: float | None = LOCK_TIMEOUT_SECONDS
+) -> Iterator[Path]:
+    """Locks a folder of the data package for the duration of the `with` block.
+
+    Locks are reentrant within a thread: if the thread already holds a lock on the
+    folder, e.g., `build_resource_data()` calling `write_resource_data()`, the held
+    lock is used.
+
+    Args:
+        path: The path to the folder to lock. Use `PackagePath` to get the path of the
+            package or of a resource.
+        exclusive: Whether to take an exclusive lock. If False, a shared lock is
+            taken.
+        timeout: The number of seconds to wait for the lock. Waits indefinitely if
+            None.
+
+    Yields:
+        The path to the locked folder.
+
+    Raises:
+        FileNotFoundError: If the folder doesn't exist.
+        TimeoutError: If the lock couldn't be taken within the timeout.
+        RuntimeError: If an exclusive lock is requested while the thread holds a
+            shared lock on the folder.
+    """
+    held_locks: dict[Path, bool] = _HELD_LOCKS.__dict__.setdefault("locks", {})
+    key = path.resolve()
+    if fcntl is None:  # pragma: no cover
+        yield path
+        return
+
+    if key in held_locks:
+        if exclusive and not held_locks[key]:
+            raise RuntimeError(
+                f"Can't take an exclusive lock on '{path}' while holding a shared lock "
+                "on it in the same thread."
+            )
+        yield path
+        return
+
+    file_descriptor = os.open(path, os.O_RDONLY)
+    try:
+        _acquire(file_descriptor, path, exclusive, timeout)
+        held_locks[key] = exclusive
+        try:
+            yield path
+        finally:
+            del held_locks[key]
+    finally:
+        # Closing the file descriptor also releases the lock.
+        os.close(file_descriptor)
+
+
+def _acquire(
+    file_descriptor: int, path: Path, exclusive: bool, timeout: float | None
+) -> None:
+    """Takes the lock on the open folder, polling until it's free or the timeout."""
+    operation = (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB
+    deadline = None if timeout is None else monotonic() + timeout
+    delay = 0.001
+    while True:
+        try:
+            fcntl.flock(file_descriptor, operation)
+            return
+        except BlockingIOError:
+            if deadline is not None and monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Could not lock '{path}' within {timeout} seconds, as it is "
+                    "locked by another process or thread."
+                ) from None
+            sleep(delay)
+            delay = min(delay * 2, 0.1)
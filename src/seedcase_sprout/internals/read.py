@@ -1,4 +1,4 @@
-from json import loads
+from json import JSONDecodeError, loads
 from pathlib import Path
 
 
@@ -15,3 +15,27 @@ def _read_json(path: Path) -> dict:
         JSONDecodeError: If the contents of the file cannot be de-serialised as JSON.
     """
     return loads(path.read_text())
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    """Reads the contents of a JSON Lines file into a list of objects.
+
+    A last line that can't be de-serialised is skipped, as it is most likely from a
+    write that was interrupted before it finished.
+
+    Args:
+        path: The path to the file to load.
+
+    Returns:
+        The contents of each line of the file as an object.
+
+    Raises:
+        JSONDecodeError: If a line other than the last one cannot be de-serialised as
+            JSON.
+    """
+    lines = path.read_text().splitlines()
+    json_objects = [loads(line) for line in lines[:-1] if line]
+    try:
+        return json_objects + ([loads(lines[-1])] if lines and lines[-1] else [])
+    except JSONDecodeError:
+        return json_objects
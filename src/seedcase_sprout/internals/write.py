@@ -1,12 +1,62 @@
 import json
+import os
 from pathlib import Path
+from typing import Callable
+from uuid import uuid4
 
-from seedcase_sprout.write_file import write_file
+
+def _write_atomically(
+    write: Callable[[Path], object], path: Path, fsync: bool = True
+) -> Path:
+    """Writes a file so that it is either written completely or not changed at all.
+
+    The content is first written to a temporary file in the same folder, which then
+    replaces the file at `path` in a single step. Readers therefore only ever see the
+    old or the new file, never a partially written one, even if the process is
+    stopped while writing.
+
+    Args:
+        write: A function that writes the content to the path it is given.
+        path: The path to the file with name and extension.
+        fsync: Whether to flush the file and the folder to disk, so the new file
+            also survives a power loss or an operating system crash.
+
+    Returns:
+        The path to the written file.
+
+    Raises:
+        FileNotFoundError: If the parent folder of the file doesn't exist.
+    """
+    temp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        write(temp_path)
+        if fsync:
+            _fsync(temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    # Folders can't be opened (and don't need to be flushed) on Windows.
+    if fsync and os.name != "nt":
+        _fsync(path.parent)
+    return path
+
+
+def _fsync(path: Path) -> None:
+    """Flushes a file or a folder to disk."""
+    file_descriptor = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(file_descriptor)
+    finally:
+        os.close(file_descriptor)
 
 
 def _write_json(json_object: list | dict, path: Path) -> Path:
     """Writes an object as an indented JSON string to the specified location.
 
+    The file is written atomically, so it is never left partially written.
+
     Args:
         json_object: The object to write to the file. Must be JSON serialisable.
         path: The path to the file with name and extension.
@@ -18,4 +68,50 @@ def _write_json(json_object: list | dict, path: Path) -> Path:
         FileNotFoundError: If the parent folder of the file doesn't exist.
         TypeError: If the object is not JSON serialisable.
     """
-    return write_file(json.dumps(json_object, indent=2, ensure_ascii=False), path)
+    text = json.dumps(json_object, indent=2, ensure_ascii=False)
+    return _write_atomically(lambda temp_path: temp_path.write_text(text), path)
+
+
+def _write_jsonl(json_objects: list[dict], path: Path) -> Path:
+    """Writes objects as a JSON Lines file, with one object per line.
+
+    The file is written atomically, so it is never left partially written.
+
+    Args:
+        json_objects: The objects to write to the file. Must be JSON serialisable.
+        path: The path to the file with name and extension.
+
+    Returns:
+        The path to the JSON Lines file.
+
+    Raises:
+        FileNotFoundError: If the parent folder of the file doesn't exist.
+        TypeError: If the objects are not JSON serialisable.
+    """
+    text = "".join(
+        json.dumps(json_object, ensure_ascii=False) + "\n"
+        for json_object in json_objects
+    )
+    return _write_atomically(lambda temp_path: temp_path.write_text(text), path)
+
+
+def _append_jsonl(json_object: dict, path: Path) -> Path:
+    """Appends an object as a single line of JSON to the specified JSON Lines file.
+
+    The file is created if it doesn't exist. Existing lines are never changed.
+
+    Args:
+        json_object: The object to append to the file. Must be JSON serialisable.
+        path: The path to the file with name and extension.
+
+    Returns:
+        The path to the JSON Lines file.
+
+    Raises:
+        FileNotFoundError: If the parent folder of the file doesn't exist.
+        TypeError: If the object is not JSON serialisable.
+    """
+    line = json.dumps(json_object, ensure_ascii=False) + "\n"
+    with path.open("a", encoding="utf-8") as file:
+        file.write(line)
+    return path
@@ -1,17 +1,36 @@
+from typing import overload
+
 import polars as pl
 
-from seedcase_sprout.check_data import check_data
+from seedcase_sprout.check_data import (
+    _check_column_names,
+    _check_column_types,
+    check_data,
+)
 from seedcase_sprout.check_properties import (
-    check_resource_properties,
+    _check_resource_properties_once,
 )
 from seedcase_sprout.constants import BATCH_TIMESTAMP_COLUMN_NAME
 from seedcase_sprout.get_nested_attr import get_nested_attr
 from seedcase_sprout.properties import ResourceProperties
 
 
+@overload
 def join_resource_batches(
     data_list: list[pl.DataFrame], resource_properties: ResourceProperties
-) -> pl.DataFrame:
+) -> pl.DataFrame: ...
+
+
+@overload
+def join_resource_batches(
+    data_list: pl.LazyFrame, resource_properties: ResourceProperties
+) -> pl.LazyFrame: ...
+
+
+def join_resource_batches(
+    data_list: list[pl.DataFrame] | pl.LazyFrame,
+    resource_properties: ResourceProperties,
+) -> pl.DataFrame | pl.LazyFrame:
     """Joins all batch resource DataFrames into a single (Polars) DataFrame.
 
     This function takes a list of DataFrames, joins them together and drops any
@@ -29,16 +48,29 @@ def join_resource_batches(
     later files, the mistake will be kept in the batch file, but won't be included in
     the `data.parquet` file.
 
+    If `data_list` is a LazyFrame of all the batch data, e.g., from
+    `scan_resource_batches()`, the batches are joined lazily and a LazyFrame is
+    returned. The joining is then done without sorting all the data, so it can be
+    run by Polars' streaming engine. Give the LazyFrame to `write_resource_data()`
+    to write it to the `data.parquet` file without holding all the data in memory.
+    Only the column names and types of the LazyFrame are checked, as checking the
+    values would read all the data. The values are checked by `write_resource_data()`
+    instead, before writing. As a LazyFrame is only a plan, the batches are read and
+    joined again each time it is run: once for the field constraints, if there are
+    any, once for the primary and unique keys, if there are any, and once to write
+    the data.
+
     Args:
         data_list: A list of Polars DataFrames for all the batch files. Use
             `read_resource_batches()` to get a list of DataFrames that have been
-            checked against the properties individually.
+            checked against the properties individually. Alternatively, a LazyFrame
+            of all the batch files from `scan_resource_batches()`.
         resource_properties: The `ResourceProperties` object that contains the
             properties of the resource to check the data against.
 
     Returns:
         Outputs a single DataFrame object of all the batch data with duplicate
-            observational units removed.
+            observational units removed. A LazyFrame, if `data_list` is a LazyFrame.
 
     Raises:
         ValueError: If an empty `data_list` is provided.
@@ -58,9 +90,20 @@ def join_resource_batches(
             batches = sp.read_resource_batches(resource_properties=resource_properties)
 
             sp.join_resource_batches(batches, resource_properties)
+
+            # Lazily
+            batches = sp.scan_resource_batches(resource_properties=resource_properties)
+            sp.join_resource_batches(batches, resource_properties).collect()
         ```
     """
-    check_resource_properties(resource_properties)
+    _check_resource_properties_once(resource_properties)
+    primary_key = get_nested_attr(resource_properties, "schema.primary_key")
+
+    if isinstance(data_list, pl.LazyFrame):
+        joined_data = _drop_duplicate_obs_units_lazy(data_list, primary_key)
+        _check_column_names(joined_data, resource_properties)
+        _check_column_types(joined_data, resource_properties)
+        return joined_data
 
     if data_list == []:
         raise ValueError(
@@ -70,7 +113,6 @@ def join_resource_batches(
         )
 
     data = pl.concat(data_list)
-    primary_key = get_nested_attr(resource_properties, "schema.primary_key")
     data = _drop_duplicate_obs_units(data, primary_key)
 
     check_data(data, resource_properties)
@@ -86,3 +128,31 @@ def _drop_duplicate_obs_units(
     data = data.drop(BATCH_TIMESTAMP_COLUMN_NAME)
 
     return data.unique(subset=primary_key, keep="last")
+
+
+def _drop_duplicate_obs_units_lazy(
+    data: pl.LazyFrame, primary_key: list[str] | str | None
+) -> pl.LazyFrame:
+    """Lazily drop duplicates based on the primary key and keep the latest one.
+
+    Instead of sorting all the data, the latest timestamp per primary key is found with
+    a group-by and only the rows with that timestamp are kept with a semi-join. Both
+    can be run by Polars' streaming engine.
+    """
+    if not primary_key:
+        return data.drop(BATCH_TIMESTAMP_COLUMN_NAME).unique()
+
+    primary_key = [primary_key] if isinstance(primary_key, str) else primary_key
+    latest_timestamps = data.group_by(primary_key).agg(
+        pl.col(BATCH_TIMESTAMP_COLUMN_NAME).max()
+    )
+    data = data.join(
+        latest_timestamps,
+        on=[*primary_key, BATCH_TIMESTAMP_COLUMN_NAME],
+        how="semi",
+        nulls_equal=True,
+    )
+    data = data.drop(BATCH_TIMESTAMP_COLUMN_NAME)
+
+    # Rows from the same batch can still share a primary key.
+    return data.unique(subset=primary_key, keep="any")
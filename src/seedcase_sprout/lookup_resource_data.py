@@ -0,0 +1,134 @@
+from pathlib import Path
+
+import polars as pl
+
+from seedcase_sprout.check_properties import _check_resource_properties_once
+from seedcase_sprout.get_nested_attr import get_nested_attr
+from seedcase_sprout.internals import _lock
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.primary_key_index import (
+    _hash_primary_key,
+    _scan_primary_key_index,
+)
+from seedcase_sprout.properties import ResourceProperties
+
+
+def lookup_resource_data(
+    keys: pl.DataFrame,
+    resource_properties: ResourceProperties,
+    package_path: Path | None = None,
+) -> pl.DataFrame:
+    """Looks up rows in the resource's data by their primary key.
+
+    The rows are found with the resource's primary key index, written by
+    `write_resource_data()`, so only the parts of the data files that contain them
+    are read. If there is no index, e.g., because it was written by another version of
+    Polars, all the data is scanned instead.
+
+    Args:
+        keys: A DataFrame with the primary key columns of the rows to look up. Other
+            columns are ignored.
+        resource_properties: The `ResourceProperties` object that contains the
+            properties of the resource to look up the rows in.
+        package_path: The path to the data package root folder (where `datapackage.json`
+            is located). Defaults to the current working directory.
+
+    Returns:
+        The rows of the resource's data with a primary key in `keys`. Keys that aren't
+            in the data have no row.
+
+    Raises:
+        ExceptionGroup: A group of `CheckError`s, if resource properties are incorrect.
+        ValueError: If the resource has no primary key, or `keys` doesn't have all
+            primary key columns.
+        FileNotFoundError: If the resource has no data file.
+
+    Examples:
+        ```{python}
+        import polars as pl
+
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            resource_properties = sp.example_resource_properties()
+            sp.write_resource_data(sp.example_data(), resource_properties)
+            sp.lookup_resource_data(pl.DataFrame({"id": [34, 5]}), resource_properties)
+        ```
+    """
+    _check_resource_properties_once(resource_properties)
+    primary_key = get_nested_attr(resource_properties, "schema.primary_key")
+    if not primary_key:
+        raise ValueError(
+            f"Can't look up rows in resource '{resource_properties.name}', as it has "
+            "no primary key."
+        )
+    primary_key = [primary_key] if isinstance(primary_key, str) else primary_key
+    missing_columns = [name for name in primary_key if name not in keys.columns]
+    if missing_columns:
+        raise ValueError(
+            f"Can't look up rows, as the keys are missing the primary key column(s) "
+            f"{missing_columns}."
+        )
+
+    path = PackagePath(package_path)
+    resource_name = str(resource_properties.name)
+    data_path = path.root() / str(resource_properties.path)
+    with _lock(path.resource(resource_name), exclusive=False):
+        # The keys are cast before they are hashed, as the hashes depend on the types.
+        schema = _scan_data(data_path).collect_schema()
+        keys = keys.select(primary_key).cast(
+            {name: schema[name] for name in primary_key}
+        )
+        index = _scan_primary_key_index(path.resource_primary_key_index(resource_name))
+        data = (
+            _scan_data(data_path)
+            if index is None
+            else _scan_indexed_rows(index, keys, primary_key, data_path)
+        )
+        return data.join(
+            keys.lazy(), on=primary_key, how="semi", nulls_equal=True
+        ).collect()
+
+
+def _scan_indexed_rows(
+    index: pl.LazyFrame, keys: pl.DataFrame, primary_key: list[str], data_path: Path
+) -> pl.LazyFrame:
+    """Scans the rows of the data files that the index has for the keys.
+
+    Only the range of rows between the first and the last row found in each data file
+    is scanned, so Polars can skip the row groups outside it. As the index only has
+    hashes, the rows must still be joined with the keys.
+
+    Args:
+        index: The primary key index.
+        keys: The keys to scan the rows for.
+        primary_key: The names of the primary key columns.
+        data_path: The path to the data file or folder.
+
+    Returns:
+        The scanned rows.
+    """
+    locations = (
+        index.join(keys.lazy().select(_hash_primary_key(primary_key)), on="hash")
+        .group_by("file")
+        .agg(first=pl.col("row").min(), last=pl.col("row").max())
+        .collect()
+    )
+    if locations.is_empty():
+        return _scan_data(data_path).head(0)
+
+    return pl.concat(
+        [
+            pl.scan_parquet(data_path.parent / file, hive_partitioning=False).slice(
+                first, last - first + 1
+            )
+            for file, first, last in locations.sort("file").iter_rows()
+        ]
+    )
+
+
+def _scan_data(data_path: Path) -> pl.LazyFrame:
+    """Scans the data file, or all files in the folder for partitioned data."""
+    if data_path.is_dir():
+        return pl.scan_parquet(data_path / "**" / "*.parquet", hive_partitioning=False)
+    return pl.scan_parquet(data_path)
@@ -0,0 +1,87 @@
+from dataclasses import asdict, dataclass
+from typing import Any, Literal
+
+
+@dataclass(frozen=True)
+class ParquetWriteOptions:
+    """Options for writing the Parquet batch and data files of a resource.
+
+    Functions that write Parquet files, like `write_resource_batch()` and
+    `write_resource_data()`, take these options as an argument. If they aren't
+    given, the default options are used, which can be changed for all writes with
+    `set_default_parquet_write_options()`.
+
+    Attributes:
+        compression (Literal['lz4', 'uncompressed', 'snappy', 'gzip', 'brotli',
+            'zstd']): The compression codec. Defaults to 'zstd'.
+        compression_level (int | None): The compression level, if the codec has
+            levels. Higher levels give smaller files but are slower to write. Defaults
+            to None, which uses the default level of the codec.
+        row_group_size (int | None): The maximum number of rows in a row group.
+            Defaults to None, which uses the Polars default.
+        statistics (bool): Whether to write the minimum, maximum, and null count of
+            each column in each row group. These allow readers to skip row groups.
+            Defaults to True.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            sp.write_resource_batch(
+                sp.example_data(),
+                sp.example_resource_properties(),
+                parquet_options=sp.ParquetWriteOptions(compression_level=10),
+            )
+        ```
+    """
+
+    compression: Literal["lz4", "uncompressed", "snappy", "gzip", "brotli", "zstd"] = (
+        "zstd"
+    )
+    compression_level: int | None = None
+    row_group_size: int | None = None
+    statistics: bool = True
+
+
+_default_parquet_write_options = ParquetWriteOptions()
+
+
+def set_default_parquet_write_options(
+    options: ParquetWriteOptions | None = None,
+) -> ParquetWriteOptions:
+    """Sets the options used to write Parquet files when no options are given.
+
+    Args:
+        options: The new default options. Defaults to None, which resets the defaults
+            to `ParquetWriteOptions()`.
+
+    Returns:
+        The new default options.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        sp.set_default_parquet_write_options(
+            sp.ParquetWriteOptions(row_group_size=100_000)
+        )
+        # Reset to the defaults
+        sp.set_default_parquet_write_options()
+        ```
+    """
+    global _default_parquet_write_options
+    _default_parquet_write_options = options or ParquetWriteOptions()
+    return _default_parquet_write_options
+
+
+def _get_parquet_write_kwargs(options: ParquetWriteOptions | None) -> dict[str, Any]:
+    """Gets the arguments for Polars' `write_parquet()` and `sink_parquet()`.
+
+    Args:
+        options: The options to use. Defaults to the default options if None.
+
+    Returns:
+        The options as keyword arguments.
+    """
+    return asdict(options or _default_parquet_write_options)
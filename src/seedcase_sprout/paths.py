@@ -6,9 +6,18 @@ they are used in the context of a data package stored in the working directory (
 first approach).
 """
 
+import re
 from pathlib import Path
 
-from seedcase_sprout.internals import _create_resource_properties_script_filename
+from seedcase_sprout.constants import (
+    BATCH_MANIFEST_FILE_NAME,
+    BATCH_TIMESTAMP_PATTERN,
+    LEGACY_BATCH_TIMESTAMP_PATTERN,
+)
+from seedcase_sprout.internals import (
+    _create_resource_properties_script_filename,
+    _read_jsonl,
+)
 
 
 class PackagePath:
@@ -86,6 +95,43 @@ class PackagePath:
         """
         return self.resource(resource_name) / "data.parquet"
 
+    def resource_partitioned_data(self, resource_name: str) -> Path:
+        """Path to the specific resource's folder of partitioned data files.
+
+        Used instead of the single data file when the data is written partitioned, with
+        one `<field>=<value>/` sub-folder per partition.
+
+        Args:
+            resource_name: The name of the resource. Use `ResourceProperties.name` to
+                get the correct resource name.
+        """
+        return self.resource(resource_name) / "data"
+
+    def resource_data_manifest(self, resource_name: str) -> Path:
+        """Path to the specific resource's data manifest file.
+
+        The manifest records which batch files have already been joined into the
+        resource's data file, so the data file can be updated incrementally.
+
+        Args:
+            resource_name: The name of the resource. Use `ResourceProperties.name` to
+                get the correct resource name.
+        """
+        return self.resource(resource_name) / "data-manifest.json"
+
+    def resource_primary_key_index(self, resource_name: str) -> Path:
+        """Path to the specific resource's primary key index file.
+
+        The index is a Parquet file with a hash of the primary key of each row in the
+        resource's data, and the data file and row the row is in. It is written by
+        `write_resource_data()` for resources with a primary key.
+
+        Args:
+            resource_name: The name of the resource. Use `ResourceProperties.name` to
+                get the correct resource name.
+        """
+        return self.resource(resource_name) / "primary-key-index.parquet"
+
     def resource_batch(self, resource_name: str) -> Path:
         """Path to the specific resource's `batch/` folder.
 
@@ -95,14 +141,51 @@ class PackagePath:
         """
         return self.resource(resource_name) / "batch"
 
-    def resource_batch_files(self, resource_name: str) -> list[Path]:
+    def resource_batch_manifest(self, resource_name: str) -> Path:
+        """Path to the specific resource's batch manifest file.
+
+        The manifest is an append-only JSON Lines file in the `batch/` folder with one
+        entry per batch file written by `write_resource_batch()`.
+
+        Args:
+            resource_name: The name of the resource. Use `ResourceProperties.name` to
+                get the correct resource name.
+        """
+        return self.resource_batch(resource_name) / BATCH_MANIFEST_FILE_NAME
+
+    def resource_batch_files(
+        self, resource_name: str, check_folder: bool = False
+    ) -> list[Path]:
         """Paths to all the files in the specific resource's `batch/` folder.
 
+        The paths are ordered by the timestamp of the files, oldest first. If the
+        `batch/` folder has a batch manifest, the files and their timestamps are
+        looked up in it, so the folder isn't listed and no file names are parsed.
+        When `write_resource_batch()` creates the manifest, it also records the batch
+        files already in the folder. Without a manifest, the folder is listed and the
+        files are ordered by the timestamps in their names.
+
         Args:
             resource_name: The name of the resource. Use `ResourceProperties.name` to
                 get the correct resource name.
+            check_folder: Whether to also list the folder if there is a batch
+                manifest, to include batch files that aren't in the manifest and leave
+                out files in it that no longer exist, e.g., if batch files were added
+                or removed without Sprout. Defaults to False.
         """
-        return list(self.resource_batch(resource_name).glob("*.parquet"))
+        batch_path = self.resource_batch(resource_name)
+        timestamps = _read_batch_manifest_timestamps(batch_path)
+        if timestamps is None or check_folder:
+            manifest_timestamps = timestamps or {}
+            timestamps = {
+                name: manifest_timestamps.get(name)
+                or _get_batch_file_name_timestamp(name)
+                for name in (path.name for path in batch_path.glob("*.parquet"))
+            }
+        return [
+            batch_path / name
+            for name in sorted(timestamps, key=lambda name: (timestamps[name], name))
+        ]
 
     def properties_script(self) -> Path:
         """Path to the properties script."""
@@ -119,3 +202,56 @@ class PackagePath:
             / "scripts"
             / f"{_create_resource_properties_script_filename(resource_name)}.py"
         )
+
+
+def _read_batch_manifest_timestamps(batch_path: Path) -> dict[str, str] | None:
+    """Reads the timestamps of the batch files in the batch manifest of the folder.
+
+    Args:
+        batch_path: The path to the `batch/` folder.
+
+    Returns:
+        The timestamp of each batch file in the manifest, by file name. None, if the
+            folder has no batch manifest.
+    """
+    manifest_path = batch_path / BATCH_MANIFEST_FILE_NAME
+    if not manifest_path.is_file():
+        return None
+    return {entry["file"]: entry["timestamp"] for entry in _read_jsonl(manifest_path)}
+
+
+def _get_batch_manifest_timestamps(paths: list[Path]) -> dict[Path, str]:
+    """Looks up the timestamps of the batch files in the manifests of their folders.
+
+    Args:
+        paths: The paths to the batch files.
+
+    Returns:
+        The timestamp of each batch file that is in a batch manifest, by its path.
+    """
+    timestamps = {
+        batch_path: _read_batch_manifest_timestamps(batch_path) or {}
+        for batch_path in {path.parent for path in paths}
+    }
+    return {
+        path: timestamps[path.parent][path.name]
+        for path in paths
+        if path.name in timestamps[path.parent]
+    }
+
+
+def _get_batch_file_name_timestamp(name: str) -> str:
+    """Gets the timestamp in the batch file name, to order it with manifest entries.
+
+    Timestamps in the legacy format without microseconds are given zero microseconds,
+    like in `read_resource_batches()`. Names without a timestamp are used as they are.
+    """
+    match = re.search(BATCH_TIMESTAMP_PATTERN, name)
+    return _normalise_batch_timestamp(match.group()) if match else name
+
+
+def _normalise_batch_timestamp(timestamp: str) -> str:
+    """Adds zero microseconds to a timestamp in the legacy format without them."""
+    if re.fullmatch(LEGACY_BATCH_TIMESTAMP_PATTERN, timestamp):
+        return f"{timestamp.removesuffix('Z')}000000Z"
+    return timestamp
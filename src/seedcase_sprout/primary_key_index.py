@@ -0,0 +1,127 @@
+"""The primary key index of a resource's data.
+
+The index lets functions find out whether, and where, a primary key is in the
+resource's data without reading the data itself. It has one row per row of data,
+with a hash of the row's primary key, the path of the data file the row is in
+(relative to the resource folder), and the index of the row in that file. The rows
+are sorted by the hash.
+
+Polars doesn't guarantee that hashes are the same across its versions, so the index
+also records the Polars version that wrote it and is ignored when read with another
+version.
+"""
+
+from pathlib import Path
+
+import polars as pl
+
+from seedcase_sprout.internals import _write_atomically
+
+
+def _hash_primary_key(primary_key: list[str] | str) -> pl.Expr:
+    """Creates an expression hashing the primary key of each row.
+
+    The values are cast to strings first, so the hash doesn't depend on, e.g., the
+    width of an integer type.
+
+    Args:
+        primary_key: The names of the primary key columns.
+
+    Returns:
+        An expression for the hashes, named `hash`.
+    """
+    primary_key = [primary_key] if isinstance(primary_key, str) else primary_key
+    return (
+        pl.struct([pl.col(name).cast(pl.String) for name in primary_key])
+        .hash(seed=0)
+        .alias("hash")
+    )
+
+
+def _create_primary_key_index(
+    data: pl.DataFrame | pl.LazyFrame, file: str, primary_key: list[str] | str
+) -> pl.LazyFrame:
+    """Creates the index entries for the rows of a data file.
+
+    Args:
+        data: The data in the data file, in the same order.
+        file: The path to the data file, relative to the resource folder.
+        primary_key: The names of the primary key columns.
+
+    Returns:
+        The index entries.
+    """
+    return (
+        data.lazy()
+        .select(_hash_primary_key(primary_key))
+        .with_row_index("row")
+        .select("hash", file=pl.lit(file), row="row")
+    )
+
+
+def _write_primary_key_index(index: list[pl.LazyFrame], index_path: Path) -> Path:
+    """Writes the index entries of all data files to the index file.
+
+    Args:
+        index: The index entries of each data file.
+        index_path: The path to the index file.
+
+    Returns:
+        The path to the index file.
+    """
+    data = (
+        pl.concat(index)
+        .with_columns(polars_version=pl.lit(pl.__version__))
+        .sort("hash", maintain_order=True)
+    )
+    return _write_atomically(data.sink_parquet, index_path)
+
+
+def _scan_primary_key_index(index_path: Path) -> pl.LazyFrame | None:
+    """Scans the index file.
+
+    Args:
+        index_path: The path to the index file.
+
+    Returns:
+        The index, or None if there is no index file or it was written by another
+            version of Polars.
+    """
+    if not index_path.is_file():
+        return None
+
+    index = pl.scan_parquet(index_path)
+    versions = index.select("polars_version").head(1).collect().to_series()
+    if not versions.is_empty() and versions[0] != pl.__version__:
+        return None
+    return index
+
+
+def _count_indexed_rows(
+    data: pl.DataFrame, primary_key: list[str] | str, index_path: Path
+) -> int | None:
+    """Counts the rows of the data whose primary key is in the index.
+
+    As the index only has hashes, a row can be counted if the hash of its primary key
+    collides with that of another primary key, which is very unlikely.
+
+    Args:
+        data: The data to count the rows of.
+        primary_key: The names of the primary key columns.
+        index_path: The path to the index file.
+
+    Returns:
+        The number of rows, or None if the index can't be used.
+    """
+    index = _scan_primary_key_index(index_path)
+    if index is None:
+        return None
+
+    return (
+        data.lazy()
+        .select(_hash_primary_key(primary_key))
+        .join(index.select("hash"), on="hash", how="semi")
+        .select(pl.len())
+        .collect()
+        .item()
+    )
@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Callable
+
+from seedcase_sprout.properties import PackageProperties
+
+
+@dataclass(frozen=True)
+class PropertiesCacheInfo:
+    """Statistics of the cache used by `read_properties(cache=True)`.
+
+    Attributes:
+        hits (int): The number of reads that used cached properties.
+        misses (int): The number of reads that had to read the properties file.
+        size (int): The number of properties files with cached properties.
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
+"""The cached properties of each properties file, by the resolved path to the file.
+Each entry also has the key of the version of the file that the properties were
+read from."""
+_CACHE: dict[Path, tuple[tuple[int, int, int], PackageProperties]] = {}
+_CACHE_LOCK = Lock()
+_hits = 0
+_misses = 0
+
+
+def get_properties_cache_info() -> PropertiesCacheInfo:
+    """Gets the statistics of the cache used by `read_properties(cache=True)`.
+
+    Returns:
+        The number of cache hits and misses since the cache was last cleared, and the
+            number of cached properties files.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            sp.read_properties(cache=True)
+            sp.read_properties(cache=True)
+            print(sp.get_properties_cache_info())
+        ```
+    """
+    with _CACHE_LOCK:
+        return PropertiesCacheInfo(hits=_hits, misses=_misses, size=len(_CACHE))
+
+
+def clear_properties_cache(path: Path | None = None) -> None:
+    """Clears the cache used by `read_properties(cache=True)`.
+
+    The cache is invalidated automatically when a properties file changes, so this
+    is only needed to free memory, or if a file can change without changing its
+    modification time, size, or inode.
+
+    Args:
+        path: The path to the `datapackage.json` file to clear the cached properties
+            of. Defaults to None, which clears the whole cache and resets its hit and
+            miss counts.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        sp.clear_properties_cache()
+        ```
+    """
+    global _hits, _misses
+    with _CACHE_LOCK:
+        if path is not None:
+            _CACHE.pop(path.resolve(), None)
+            return
+        _CACHE.clear()
+        _hits = 0
+        _misses = 0
+
+
+def _get_cached_properties(
+    path: Path, read: Callable[[Path], PackageProperties]
+) -> PackageProperties:
+    """Gets the properties in the file from the cache, or reads and caches them.
+
+    The cached properties are used as long as the file has the same modification
+    time, size, and inode as when they were read. Only the latest version of each
+    file is kept. Each call gets its own copy of the properties, so changing them
+    doesn't change the cache.
+
+    Args:
+        path: The path to the properties file.
+        read: The function that reads and checks the properties in the file. Errors
+            aren't cached.
+
+    Returns:
+        A copy of the properties in the file.
+    """
+    global _hits, _misses
+    path = path.resolve()
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    with _CACHE_LOCK:
+        cached = _CACHE.get(path)
+        if cached and cached[0] == key:
+            _hits += 1
+            properties = cached[1]
+        else:
+            _misses += 1
+            properties = None
+
+    if properties is None:
+        properties = read(path)
+        with _CACHE_LOCK:
+            _CACHE[path] = (key, properties)
+    return _copy_properties(properties)
+
+
+def _copy_properties(properties: PackageProperties) -> PackageProperties:
+    """Copies the properties, including all nested objects and values.
+
+    The compact dictionary already has copies of all lists and dictionaries, so
+    creating properties from it is about twice as fast as `copy.deepcopy()`.
+    """
+    return PackageProperties.from_dict(properties.compact_dict)
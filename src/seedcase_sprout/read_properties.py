@@ -4,18 +4,27 @@ from seedcase_sprout.check_properties import check_properties
 from seedcase_sprout.internals import _check_is_file, _read_json
 from seedcase_sprout.paths import PackagePath
 from seedcase_sprout.properties import PackageProperties
+from seedcase_sprout.properties_cache import _get_cached_properties
 
 
-def read_properties(path: Path | None = None) -> PackageProperties:
+def read_properties(path: Path | None = None, cache: bool = False) -> PackageProperties:
     """Read in the properties from the `datapackage.json` file.
 
     Reads the `datapackage.json` file, checks that it is correct, and then
     outputs a `PackageProperties` object.
 
+    With `cache=True`, the properties are kept in memory after they are read and
+    checked, and later calls with `cache=True` return a copy of them, without reading
+    or checking the file again. The file is read again once its modification time,
+    size, or inode changes. Use `get_properties_cache_info()` to see how often the
+    cache is used and `clear_properties_cache()` to clear it.
+
     Args:
         path: The path to the `datapackage.json` file. Use `PackagePath().properties()`
             to help get the correct path. If no path is provided, this function looks
             for the `datapackage.json` file in the current working directory.
+        cache: Whether to use the cached properties, if the file hasn't changed since
+            they were read. Defaults to False.
 
     Returns:
         Outputs a `PackageProperties` object with the properties from the
@@ -27,6 +36,9 @@ def read_properties(path: Path | None = None) -> PackageProperties:
 
         with sp.ExamplePackage():
             sp.read_properties()
+
+            # Only read the file again if it has changed
+            sp.read_properties(cache=True)
         ```
 
     Raises:
@@ -35,6 +47,13 @@ def read_properties(path: Path | None = None) -> PackageProperties:
     """
     path = path or PackagePath().properties()
     _check_is_file(path)
+    if cache:
+        return _get_cached_properties(path, _read_properties)
+    return _read_properties(path)
+
+
+def _read_properties(path: Path) -> PackageProperties:
+    """Reads the properties from the file and checks them."""
     properties_dict = _read_json(path)
     properties = PackageProperties.from_dict(properties_dict)
     check_properties(properties)
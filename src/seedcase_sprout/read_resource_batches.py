@@ -1,25 +1,35 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
+from typing import cast
 
 import polars as pl
 
 from seedcase_sprout.check_data import check_data
 from seedcase_sprout.check_properties import (
-    check_resource_properties,
+    _check_resource_properties_once,
 )
 from seedcase_sprout.constants import (
     BATCH_TIMESTAMP_COLUMN_NAME,
     BATCH_TIMESTAMP_FORMAT,
     BATCH_TIMESTAMP_PATTERN,
+    COMPACTED_BATCH_FILE_SUFFIX,
+)
+from seedcase_sprout.internals import _check_is_file, _map
+from seedcase_sprout.paths import (
+    PackagePath,
+    _get_batch_manifest_timestamps,
+    _normalise_batch_timestamp,
 )
-from seedcase_sprout.internals import _check_is_file, _map, _map2
-from seedcase_sprout.paths import PackagePath
 from seedcase_sprout.properties import ResourceProperties
 
 
 def read_resource_batches(
-    resource_properties: ResourceProperties, paths: list[Path] | None = None
+    resource_properties: ResourceProperties,
+    paths: list[Path] | None = None,
+    max_workers: int = 1,
 ) -> list[pl.DataFrame]:
     """Reads all the batch resource file(s) into a list of (Polars) DataFrames.
 
@@ -31,21 +41,31 @@ def read_resource_batches(
     correctly structured and tidy, this function still runs checks to ensure the
     data are correct by comparing to the properties.
 
+    With `max_workers` above 1, the batch files are read and checked concurrently in a
+    pool of threads. Since Polars does most of its work outside of Python, this can
+    speed up reading many batch files considerably. The DataFrames are still output in
+    the same order as `paths`. Whether the files are read concurrently or not, all of
+    them are read, and if reading or checking fails for some of them, the errors are
+    collected into one `ExceptionGroup`, with each error noting the path of its file.
+
     Args:
         resource_properties: The `ResourceProperties` object that contains the
             properties of the resource you want to check the data against.
         paths: A list of paths for all the files in the resource's `batch/` folder.
             Use `path_resource_batch_files()` to help provide the correct paths to the
             batch files. Defaults to the batch files of the given resource.
+        max_workers: The maximum number of threads to read the batch files with.
+            Defaults to 1, reading the files one after the other.
 
     Returns:
         Outputs a list of DataFrame objects from all the batch files.
 
     Raises:
         FileNotFoundError: If a file in the list of paths doesn't exist.
-        ValueError: If the batch file name is not in the expected pattern.
-        ValueError: If the timestamp column name matches an existing column in the
-            DataFrame.
+        ExceptionGroup: If reading or checking any of the batch files fails. Contains
+            one error per failed file, e.g., a ValueError if the batch file name is not
+            in the expected pattern, or if the timestamp column name matches an
+            existing column in the DataFrame.
 
     Examples:
         ``` {python}
@@ -58,38 +78,126 @@ def read_resource_batches(
             sp.read_resource_batches(resource_properties)
         ```
     """
-    check_resource_properties(resource_properties)
+    _check_resource_properties_once(resource_properties)
     if paths is None:
         paths = PackagePath().resource_batch_files(str(resource_properties.name))
 
     _map(paths, _check_is_file)
-    return _map2(paths, [resource_properties], _read_parquet_batch_file)
+    return _read_parquet_batch_files(paths, resource_properties, max_workers)
+
+
+def _read_parquet_batch_files(
+    paths: list[Path], resource_properties: ResourceProperties, max_workers: int
+) -> list[pl.DataFrame]:
+    """Reads the Parquet batch files, concurrently in a pool of threads if asked to.
+
+    Args:
+        paths: Paths to the Parquet batch files.
+        resource_properties: The resource properties to check the data against.
+        max_workers: The maximum number of threads to use. With 1, the files are read
+            one after the other.
+
+    Returns:
+        The Parquet files as DataFrames, in the same order as `paths`.
+
+    Raises:
+        ExceptionGroup: If reading or checking any of the files fails. Contains one
+            error per failed file.
+    """
+    manifest_timestamps = _get_batch_manifest_timestamps(paths)
+    timestamps = [manifest_timestamps.get(path) for path in paths]
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    _try_read_parquet_batch_file,
+                    paths,
+                    repeat(resource_properties),
+                    timestamps,
+                )
+            )
+    else:
+        results = list(
+            map(
+                _try_read_parquet_batch_file,
+                paths,
+                repeat(resource_properties),
+                timestamps,
+            )
+        )
+
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        raise ExceptionGroup(
+            f"Could not read {len(errors)} of the {len(paths)} batch files.", errors
+        )
+
+    return cast(list[pl.DataFrame], results)
+
+
+def _try_read_parquet_batch_file(
+    path: Path, resource_properties: ResourceProperties, timestamp: str | None
+) -> pl.DataFrame | Exception:
+    """Reads a Parquet batch file, returning the error noting the path if it fails."""
+    try:
+        return _read_parquet_batch_file(path, resource_properties, timestamp)
+    except Exception as error:
+        error.add_note(f"Batch file: {path}")
+        return error
 
 
 def _read_parquet_batch_file(
-    path: Path, resource_properties: ResourceProperties
+    path: Path, resource_properties: ResourceProperties, timestamp: str | None = None
 ) -> pl.DataFrame:
     """Reads a Parquet batch file and adds the timestamp as a column.
 
     This function reads a Parquet batch file into a Polars DataFrame and adds
-    a timestamp column to the DataFrame, extracted from the file name.
+    a timestamp column to the DataFrame. Compacted batch files already have the
+    timestamp column, which is kept as is.
 
     Args:
         path: Path to the Parquet batch file.
         resource_properties: The resource properties to check the data against.
+        timestamp: The timestamp of the batch file from the batch manifest. Defaults
+            to None, which extracts it from the file name and checks it.
 
     Returns:
         The Parquet file as a DataFrame with a timestamp column added.
     """
     data = pl.read_parquet(path)
-    check_data(data, resource_properties)
+    if _is_compacted_batch_file(path):
+        _check_has_timestamp_column(data.columns)
+        check_data(data.drop(BATCH_TIMESTAMP_COLUMN_NAME), resource_properties)
+        return data
 
-    timestamp = _extract_timestamp_from_batch_file_path(path)
-    _check_batch_file_timestamp(timestamp)
+    check_data(data, resource_properties)
+    if timestamp is None:
+        timestamp = _extract_timestamp_from_batch_file_path(path)
+        _check_batch_file_timestamp(timestamp)
     data = _add_timestamp_as_column(data, timestamp)
     return data
 
 
+def _get_batch_file_timestamps(paths: list[Path]) -> dict[Path, str]:
+    """Gets the timestamp of each batch file.
+
+    The timestamps are looked up in the batch manifest, and only extracted from the
+    names of the files that aren't in it.
+
+    Args:
+        paths: The paths to the batch files.
+
+    Returns:
+        The timestamp of each batch file, by its path.
+    """
+    manifest_timestamps = _get_batch_manifest_timestamps(paths)
+    return {
+        path: manifest_timestamps.get(path)
+        or _extract_timestamp_from_batch_file_path(path)
+        for path in paths
+    }
+
+
 def _extract_timestamp_from_batch_file_path(path: Path) -> str:
     """Extracts the timestamp from the file name.
 
@@ -97,6 +205,8 @@ def _extract_timestamp_from_batch_file_path(path: Path) -> str:
     it should contain a timestamp in the format defined by BATCH_TIMESTAMP_PATTERN.
 
     If multiple timestamps are found in the file name, the first one is used.
+    Timestamps in the legacy format without microseconds are normalised to the
+    current format, so all timestamps can be ordered by comparing them as strings.
     """
     timestamp_list = re.findall(BATCH_TIMESTAMP_PATTERN, path.stem)
 
@@ -106,7 +216,7 @@ def _extract_timestamp_from_batch_file_path(path: Path) -> str:
             f"expected format '{BATCH_TIMESTAMP_PATTERN}'."
         )
 
-    return timestamp_list[0]
+    return _normalise_batch_timestamp(timestamp_list[0])
 
 
 def _check_batch_file_timestamp(timestamp: str) -> str:
@@ -132,13 +242,30 @@ def _add_timestamp_as_column(data: pl.DataFrame, timestamp: str) -> pl.DataFrame
     Returns:
         Data with added timestamp column.
 
+    Raises:
+        ValueError: If a column with the name BATCH_TIMESTAMP_COLUMN_NAME already exists
+        in the data.
+    """
+    _check_no_timestamp_column(data.columns)
+    return data.with_columns(pl.lit(timestamp).alias(BATCH_TIMESTAMP_COLUMN_NAME))
+
+
+def _check_no_timestamp_column(columns: list[str]) -> list[str]:
+    """Checks that none of the columns has the name of the timestamp column.
+
+    Args:
+        columns: The column names of the data.
+
+    Returns:
+        The column names, if the check passes.
+
     Raises:
         ValueError: If a column with the name BATCH_TIMESTAMP_COLUMN_NAME already exists
         in the data.
     """
     # TODO: We could move this to be a check of the resource properties in
     # `sprout_checks/`
-    if BATCH_TIMESTAMP_COLUMN_NAME in data.columns:
+    if BATCH_TIMESTAMP_COLUMN_NAME in columns:
         raise ValueError(
             "One or multiple of the provided resource batch files contain a "
             f"column named '{BATCH_TIMESTAMP_COLUMN_NAME}'. This column is used "
@@ -146,4 +273,30 @@ def _add_timestamp_as_column(data: pl.DataFrame, timestamp: str) -> pl.DataFrame
             "rename it in the batch files and resource properties to read the resource "
             "batches."
         )
-    return data.with_columns(pl.lit(timestamp).alias(BATCH_TIMESTAMP_COLUMN_NAME))
+    return columns
+
+
+def _check_has_timestamp_column(columns: list[str]) -> list[str]:
+    """Checks that the columns of a compacted batch file include the timestamp column.
+
+    Args:
+        columns: The column names of the data.
+
+    Returns:
+        The column names, if the check passes.
+
+    Raises:
+        ValueError: If there is no column with the name BATCH_TIMESTAMP_COLUMN_NAME.
+    """
+    if BATCH_TIMESTAMP_COLUMN_NAME not in columns:
+        raise ValueError(
+            "Compacted batch files must have a column named "
+            f"'{BATCH_TIMESTAMP_COLUMN_NAME}' with the timestamp of the batch file "
+            "each row was originally added in."
+        )
+    return columns
+
+
+def _is_compacted_batch_file(path: Path) -> bool:
+    """Checks whether the batch file was made by `compact_resource_batches()`."""
+    return path.name.endswith(COMPACTED_BATCH_FILE_SUFFIX)
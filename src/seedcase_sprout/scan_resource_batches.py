@@ -0,0 +1,97 @@
+from pathlib import Path
+
+import polars as pl
+
+from seedcase_sprout.check_properties import (
+    _check_resource_properties_once,
+)
+from seedcase_sprout.check_resource_batches import check_resource_batches
+from seedcase_sprout.constants import (
+    BATCH_TIMESTAMP_COLUMN_NAME,
+    BATCH_TIMESTAMP_PATTERN,
+    LEGACY_BATCH_TIMESTAMP_PATTERN,
+)
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.properties import ResourceProperties
+from seedcase_sprout.read_resource_batches import _is_compacted_batch_file
+
+
+def scan_resource_batches(
+    resource_properties: ResourceProperties, paths: list[Path] | None = None
+) -> pl.LazyFrame:
+    """Lazily scans all the batch resource file(s) into a single (Polars) LazyFrame.
+
+    This function is the lazy version of `read_resource_batches()`. Instead of reading
+    each Parquet file given by `paths` into memory, it scans all of them into a single
+    Polars LazyFrame, so no data is read until the LazyFrame is collected. The
+    timestamp of each batch file is added as a column, based on the file name, just
+    like in `read_resource_batches()`. Compacted batch files (see
+    `compact_resource_batches()`) already have this column.
+
+    Only the names and schemas of the batch files are checked against the
+    `resource_properties` with `check_resource_batches()`, so this function stays fast
+    even for resources with many or large batch files.
+    Collect the LazyFrame with `collect(engine="streaming")` to process the data
+    in batches, so that the memory needed doesn't grow with the number of batch files.
+
+    Args:
+        resource_properties: The `ResourceProperties` object that contains the
+            properties of the resource you want to check the data against.
+        paths: A list of paths for all the files in the resource's `batch/` folder.
+            Use `PackagePath().resource_batch_files()` to help provide the correct
+            paths to the batch files. Defaults to the batch files of the given resource.
+
+    Returns:
+        Outputs a LazyFrame of the data from all the batch files.
+
+    Raises:
+        ValueError: If there are no batch files.
+        ExceptionGroup: If any of the batch files don't pass the checks, e.g., if a
+            file doesn't exist, its name doesn't have a correct timestamp, or its
+            columns don't match the properties. Contains one error per failed file.
+
+    Examples:
+        ``` {python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            resource_properties = sp.example_resource_properties()
+            sp.write_resource_batch(sp.example_data(), resource_properties)
+
+            sp.scan_resource_batches(resource_properties).collect()
+        ```
+    """
+    _check_resource_properties_once(resource_properties)
+    if paths is None:
+        paths = PackagePath().resource_batch_files(str(resource_properties.name))
+
+    if paths == []:
+        raise ValueError(
+            "Could not scan resource batches because no batch files were found for "
+            f"the resource '{resource_properties.name}'."
+        )
+
+    check_resource_batches(resource_properties, paths)
+
+    compacted_paths = [path for path in paths if _is_compacted_batch_file(path)]
+    other_paths = [path for path in paths if not _is_compacted_batch_file(path)]
+    scans = [pl.scan_parquet(compacted_paths)] if compacted_paths else []
+    if other_paths:
+        scans.append(_scan_with_timestamp_from_file_name(other_paths))
+    return pl.concat(scans, how="diagonal")
+
+
+def _scan_with_timestamp_from_file_name(paths: list[Path]) -> pl.LazyFrame:
+    """Scans batch files, adding the timestamp in their file names as a column."""
+    timestamp = pl.col(BATCH_TIMESTAMP_COLUMN_NAME)
+    return (
+        pl.scan_parquet(paths, include_file_paths=BATCH_TIMESTAMP_COLUMN_NAME)
+        # The first timestamp in the file name, normalised like in
+        # `_extract_timestamp_from_batch_file_path()`.
+        .with_columns(timestamp.str.extract(rf"({BATCH_TIMESTAMP_PATTERN})[^/\\]*$"))
+        .with_columns(
+            pl.when(timestamp.str.contains(rf"^{LEGACY_BATCH_TIMESTAMP_PATTERN}$"))
+            .then(timestamp.str.strip_suffix("Z") + "000000Z")
+            .otherwise(timestamp)
+        )
+    )
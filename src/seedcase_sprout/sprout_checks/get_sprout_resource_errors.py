@@ -49,8 +49,9 @@ def _check_resource_path_format(
     """Checks if the data path in the resource properties has the correct format.
 
     As the path is constructed from the resource name, its format can only be checked
-    if the resource name is correct. Type, required, and blank errors are not flagged
-    here to avoid flagging them twice.
+    if the resource name is correct. The path can point either to a single data file
+    or to a folder of partitioned data files. Type, required, and blank errors are not
+    flagged here to avoid flagging them twice.
 
     Args:
         properties: The resource properties to check.
@@ -73,12 +74,16 @@ def _check_resource_path_format(
         return []
 
     expected_path = _create_resource_data_path(str(name))
-    if path == expected_path:
+    partitioned_path = _create_resource_data_path(str(name), partitioned=True)
+    if path in (expected_path, partitioned_path):
         return []
 
     return [
         cdp.CheckError(
-            message=f"Expected the path to be '{expected_path}' but found '{path}'.",
+            message=(
+                f"Expected the path to be '{expected_path}' (or '{partitioned_path}' "
+                f"for partitioned data) but found '{path}'."
+            ),
             json_path=get_json_path_to_resource_field("path", index),
             validator="pattern",
         )
@@ -1,11 +1,15 @@
 from pathlib import Path
 
+from seedcase_sprout.internals import _write_atomically
+
 
 def write_file(string: str, path: Path) -> Path:
     """Writes a file to the given path with the given content.
 
     The parent folder of the file given in path must exist.
-    If the file already exists, it will be overwritten.
+    If the file already exists, it will be overwritten. The file is written
+    atomically, so it is never left partially written, e.g., if the process is
+    stopped while writing.
 
     Args:
         string: The content to be written to the file.
@@ -17,6 +21,4 @@ def write_file(string: str, path: Path) -> Path:
     Raises:
         FileNotFoundError: If the parent folder of the file doesn't exist.
     """
-    path.write_text(string)
-
-    return path
+    return _write_atomically(lambda temp_path: temp_path.write_text(string), path)
@@ -1,16 +1,19 @@
 from pathlib import Path
 
 from seedcase_sprout.check_properties import check_properties
-from seedcase_sprout.internals import _write_json
+from seedcase_sprout.internals import _lock, _write_json
 from seedcase_sprout.paths import PackagePath
 from seedcase_sprout.properties import PackageProperties
+from seedcase_sprout.properties_cache import clear_properties_cache
 
 
 def write_properties(properties: PackageProperties, path: Path | None = None) -> Path:
     """Writes the specified properties to the `datapackage.json` file.
 
     If the `datapackage.json` file already exists, it will be overwritten. If not,
-    a new file will be created.
+    a new file will be created. The package folder is locked while writing, so
+    properties written by different processes at the same time don't mix. Any
+    properties cached by `read_properties(cache=True)` for the file are cleared.
 
     Args:
         properties: The properties to write. Use `create_properties_script()` to
@@ -26,4 +29,7 @@ def write_properties(properties: PackageProperties, path: Path | None = None) ->
     """
     path = path or PackagePath().properties()
     check_properties(properties)
-    return _write_json(properties.compact_dict, path)
+    with _lock(path.parent):
+        path = _write_json(properties.compact_dict, path)
+        clear_properties_cache(path)
+        return path
@@ -1,32 +1,69 @@
-from datetime import datetime
+import hashlib
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from hashlib import file_digest, sha256
 from pathlib import Path
+from threading import Lock
 from uuid import uuid4
 
 import polars as pl
 
 from seedcase_sprout.check_data import check_data
 from seedcase_sprout.check_properties import (
-    check_resource_properties,
+    _check_resource_properties_once,
+)
+from seedcase_sprout.constants import (
+    BATCH_TIMESTAMP_COLUMN_NAME,
+    BATCH_TIMESTAMP_FORMAT,
+)
+from seedcase_sprout.get_nested_attr import get_nested_attr
+from seedcase_sprout.internals import (
+    _append_jsonl,
+    _get_json_hash,
+    _lock,
+)
+from seedcase_sprout.parquet_write_options import (
+    ParquetWriteOptions,
+    _get_parquet_write_kwargs,
 )
-from seedcase_sprout.constants import BATCH_TIMESTAMP_FORMAT
 from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.primary_key_index import _count_indexed_rows
 from seedcase_sprout.properties import ResourceProperties
+from seedcase_sprout.read_resource_batches import (
+    _check_batch_file_timestamp,
+    _extract_timestamp_from_batch_file_path,
+)
+from seedcase_sprout.write_resource_data import _format_hash, _write_data_file
+
+"""The last timestamp given to a batch file in this process, to keep them increasing."""
+_LAST_BATCH_TIMESTAMP = datetime.min.replace(tzinfo=timezone.utc)
+_LAST_BATCH_TIMESTAMP_LOCK = Lock()
 
 
 def write_resource_batch(
     data: pl.DataFrame,
     resource_properties: ResourceProperties,
     package_path: Path | None = None,
+    parquet_options: ParquetWriteOptions | None = None,
 ) -> Path:
     """Writes the tidied, original data into the resource's batch data folder.
 
     Writes the original data that is in a Tidy format and read as a pl.DataFrame
     into the resource location available from the `path` property of the
     `resource_properties`. This will save a timestamped, unique file
-    name to store it as a backup. See the
+    name to store it as a backup. The file is also recorded in the batch manifest
+    of the resource, so `PackagePath().resource_batch_files()` can list the batch
+    files and their timestamps without listing the folder. When the manifest is
+    created, the batch files already in the folder are recorded in it as well. The
+    hash of the file in the manifest is computed while writing it. See the
     [design](https://sprout.seedcase-project.org/docs/design/) docs for an
-    explanation of this batch file. Data is always checked against the properties
-    before writing it to the batch folder.
+    explanation of this batch file. If the resource has a primary key and its data has
+    been written, the manifest entry also has the number of rows in the batch that
+    are new (`inserted_rows`) and that replace a row in the data (`updated_rows`),
+    counted with the primary key index without reading the data. Data is always
+    checked against the properties before writing it to the batch folder. Batch files
+    can be written by several processes at the same time, but not while
+    `build_resource_data()` or `write_resource_data()` writes to the same resource.
 
     Args:
         data: A Polars DataFrame object with the data to write to the batch folder.
@@ -35,6 +72,8 @@ def write_resource_batch(
             and `get_resource_properties()` to get the correct resource properties.
         package_path: The path to the data package root folder (where `datapackage.json`
             is located). Defaults to the current working directory.
+        parquet_options: The options for writing the Parquet file. Defaults to None,
+            which uses the default options (see `set_default_parquet_write_options()`).
 
     Returns:
         The path to the written Parquet resource file.
@@ -55,28 +94,156 @@ def write_resource_batch(
             )
         ```
     """
-    check_resource_properties(resource_properties)
+    _check_resource_properties_once(resource_properties)
     check_data(data, resource_properties)
 
-    batch_path = PackagePath(package_path).resource_batch(str(resource_properties.name))
+    path = PackagePath(package_path)
+    resource_name = str(resource_properties.name)
+    batch_path = path.resource_batch(resource_name)
     batch_path.mkdir(exist_ok=True, parents=True)
+    timestamp = _get_compact_iso_timestamp()
     # TODO: Move out some of this into the create_batch_file_name during refactoring
-    batch_file_path = batch_path / _create_batch_file_name()
-
-    data.write_parquet(batch_file_path)
+    batch_file_path = batch_path / _create_batch_file_name(timestamp)
+
+    # A shared lock, as batch files can be added in parallel, but not while the data
+    # file is built from them.
+    with _lock(path.resource(resource_name), exclusive=False):
+        digest = _write_data_file(
+            data, batch_file_path, _get_parquet_write_kwargs(parquet_options), "sha256"
+        )
+        manifest_path = path.resource_batch_manifest(resource_name)
+        if not manifest_path.is_file():
+            for entry in _create_existing_batch_manifest_entries(batch_file_path):
+                _append_jsonl(entry, manifest_path)
+        _append_jsonl(
+            _create_batch_manifest_entry(
+                batch_file_path, timestamp, data.height, data.schema, digest
+            )
+            | _count_inserted_and_updated_rows(data, resource_properties, path),
+            manifest_path,
+        )
 
     return batch_file_path
 
 
-def _create_batch_file_name() -> Path:
-    return Path(f"{_get_compact_iso_timestamp()}-{uuid4()}.parquet")
+def _create_batch_file_name(timestamp: str) -> Path:
+    return Path(f"{timestamp}-{uuid4()}.parquet")
+
+
+def _create_batch_manifest_entry(
+    batch_file_path: Path,
+    timestamp: str,
+    rows: int,
+    schema: Mapping[str, pl.DataType],
+    digest: "hashlib._Hash",
+) -> dict:
+    """Creates the batch manifest entry describing a newly written batch file.
+
+    Args:
+        batch_file_path: The path to the batch file.
+        timestamp: The timestamp in the batch file name.
+        rows: The number of rows in the batch file.
+        schema: The schema of the data in the batch file, without the timestamp column
+            of compacted batch files.
+        digest: The SHA-256 hash of the batch file's content.
+
+    Returns:
+        The manifest entry with the file name, timestamp, number of rows, file size
+            in bytes, and hashes of the schema and the file contents.
+    """
+    return {
+        "file": batch_file_path.name,
+        "timestamp": timestamp,
+        "rows": rows,
+        "bytes": batch_file_path.stat().st_size,
+        "schema_hash": _get_json_hash(
+            {name: str(dtype) for name, dtype in schema.items()}
+        ),
+        "content_hash": _format_hash(digest),
+    }
+
+
+def _create_existing_batch_manifest_entries(batch_file_path: Path) -> list[dict]:
+    """Creates the batch manifest entries of the files already in the batch folder.
+
+    This is only done once, when the manifest is created, so it also lists the batch
+    files written before it existed. Only the Parquet metadata of each file is read
+    for its rows and schema, but the whole file is read for its hash. Files without a
+    correct timestamp in their name are left out, as they can't be ordered.
+
+    Args:
+        batch_file_path: The path to the newly written batch file, which is left out.
+
+    Returns:
+        The manifest entries, ordered by file name.
+    """
+    entries = []
+    for path in sorted(batch_file_path.parent.glob("*.parquet")):
+        if path == batch_file_path:
+            continue
+        try:
+            timestamp = _extract_timestamp_from_batch_file_path(path)
+            _check_batch_file_timestamp(timestamp)
+        except ValueError:
+            continue
+        schema = pl.read_parquet_schema(path)
+        schema.pop(BATCH_TIMESTAMP_COLUMN_NAME, None)
+        with path.open("rb") as file:
+            digest = file_digest(file, sha256)
+        rows = pl.scan_parquet(path).select(pl.len()).collect().item()
+        entries.append(
+            _create_batch_manifest_entry(path, timestamp, rows, schema, digest)
+        )
+    return entries
+
+
+def _count_inserted_and_updated_rows(
+    data: pl.DataFrame, resource_properties: ResourceProperties, path: PackagePath
+) -> dict:
+    """Counts how many rows of a batch are new or replace rows in the resource data.
+
+    The rows are looked up in the primary key index of the resource data, so the data
+    itself isn't read. Rows in batch files that haven't been built into the data yet
+    aren't counted as existing rows.
+
+    Args:
+        data: The data of the batch.
+        resource_properties: The properties of the resource.
+        path: The path to the data package.
+
+    Returns:
+        The number of inserted and updated rows, or an empty dictionary if the resource
+            has no primary key or primary key index.
+    """
+    primary_key = get_nested_attr(resource_properties, "schema.primary_key")
+    if not primary_key:
+        return {}
+    updated_rows = _count_indexed_rows(
+        data,
+        primary_key,
+        path.resource_primary_key_index(str(resource_properties.name)),
+    )
+    if updated_rows is None:
+        return {}
+    return {"inserted_rows": data.height - updated_rows, "updated_rows": updated_rows}
 
 
 def _get_compact_iso_timestamp() -> str:
-    """Gets the current timestamp in a compact ISO format.
+    """Gets the current UTC timestamp in a compact ISO format.
+
+    The timestamps are strictly increasing within a process: if the clock hasn't
+    moved on (or has moved back) since the last call, the last timestamp plus one
+    microsecond is used instead, so batch files written in quick succession are
+    still ordered by the time they were written.
 
     Returns:
         The current compact ISO timestamp as a string in the format defined by
         BATCH_TIMESTAMP_FORMAT.
     """
-    return datetime.now().strftime(BATCH_TIMESTAMP_FORMAT)
+    global _LAST_BATCH_TIMESTAMP
+    with _LAST_BATCH_TIMESTAMP_LOCK:
+        _LAST_BATCH_TIMESTAMP = max(
+            datetime.now(timezone.utc),
+            _LAST_BATCH_TIMESTAMP + timedelta(microseconds=1),
+        )
+        return _LAST_BATCH_TIMESTAMP.strftime(BATCH_TIMESTAMP_FORMAT)
@@ -1,16 +1,45 @@
+import hashlib
+import shutil
+from collections.abc import Buffer
+from functools import partial
+from io import RawIOBase
+from json import JSONDecodeError
 from pathlib import Path
+from typing import IO, Any, cast
+from urllib.parse import quote
 
 import polars as pl
 
 from seedcase_sprout.check_data import check_data
+from seedcase_sprout.constants import DATA_FILE_BUFFER_SIZE
+from seedcase_sprout.get_nested_attr import get_nested_attr
+from seedcase_sprout.internals import (
+    _create_resource_data_path,
+    _get_json_hash,
+    _lock,
+    _read_json,
+    _write_atomically,
+    _write_json,
+)
+from seedcase_sprout.parquet_write_options import (
+    ParquetWriteOptions,
+    _get_parquet_write_kwargs,
+)
 from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.primary_key_index import (
+    _create_primary_key_index,
+    _write_primary_key_index,
+)
 from seedcase_sprout.properties import ResourceProperties
 
 
 def write_resource_data(
-    data: pl.DataFrame,
+    data: pl.DataFrame | pl.LazyFrame,
     resource_properties: ResourceProperties,
     package_path: Path | None = None,
+    partition_by: list[str] | None = None,
+    parquet_options: ParquetWriteOptions | None = None,
+    hash_algorithm: str = "md5",
 ) -> Path:
     """Check and write the resource data into a file.
 
@@ -20,19 +49,71 @@ def write_resource_data(
     file is saved based on the path found in `ResourceProperties.path` and is
     always overwritten.  Before writing, this function does a check against the
     `resource_properties` to ensure that the data is correctly structured and
-    tidy.
+    tidy. A DataFrame is sorted by the primary key of the resource, if it has one, so
+    rows with similar keys are stored together and can be found quickly.
+
+    If `data` is a LazyFrame, e.g., from `join_resource_batches()` used on the output
+    of `scan_resource_batches()`, it is streamed directly into the Parquet file
+    without collecting all the data in memory first. A LazyFrame isn't sorted, as
+    sorting needs all of the data at once. Sort it before writing it, e.g., with
+    `data.sort(primary_key)`, if the rows should be ordered by the primary key.
+
+    The data is written to a temporary file that then replaces `data.parquet`, so
+    `data.parquet` is never left partially written, e.g., if the process is stopped
+    while writing. The resource is locked while writing, so other processes can't
+    write to it at the same time.
+
+    The `bytes` and `hash` of the `resource_properties` are updated to the size and
+    the hash of the written file. The hash is computed from the bytes as they are
+    written, so the file isn't read again. A LazyFrame is hashed right after it has
+    been streamed into the temporary file instead, as Polars can only stream into a
+    path. Use `write_properties()` to save the updated properties.
+
+    For resources with a primary key, a primary key index is written next to the data
+    (see `PackagePath().resource_primary_key_index()`). It records which data file
+    and row each primary key is in, so `lookup_resource_data()` can find rows and
+    `write_resource_batch()` can count how many of its rows are new without reading
+    the data.
 
+    With `partition_by`, the data is instead written as one Parquet file per
+    partition into the resource's `data/` folder (see
+    `PackagePath().resource_partitioned_data()`), in Hive-style
+    `<field>=<value>/` sub-folders. Each file still contains all columns. Only
+    partitions whose data has changed are rewritten and partitions that no longer
+    have any rows are removed, so readers can skip partitions that aren't relevant to
+    them. Whether a partition has changed is found by comparing a fingerprint of its
+    rows with the one recorded in the data manifest (see
+    `PackagePath().resource_data_manifest()`), so the existing partitions aren't
+    read. A LazyFrame is collected before being partitioned. As there isn't a single
+    file, the `bytes` and `hash` of the `resource_properties` are set to None.
+
+    The `path` of the `resource_properties` is set to the written data file or
+    folder, i.e., `resources/<name>/data.parquet`, or `resources/<name>/data` with
+    `partition_by`. The data file or folder of the other layout is removed, so
+    switching between them doesn't leave old data behind.
 
     Args:
-        data: A DataFrame object with the resources data from the files in its
-            `batch/` folder.
+        data: A DataFrame or LazyFrame object with the resources data from the files in
+            its `batch/` folder.
         resource_properties: The `ResourceProperties` object that contains the
             properties of the resource you want to create the Parquet file for.
         package_path: The path to the data package root folder (where `datapackage.json`
             is located). Defaults to the current working directory.
+        partition_by: The names of the fields to partition the data by. Defaults to
+            None, which writes the data into a single file.
+        parquet_options: The options for writing the Parquet file(s). Defaults to None,
+            which uses the default options (see `set_default_parquet_write_options()`).
+        hash_algorithm: The name of the algorithm to hash the data file with, as
+            given to `hashlib.new()`. Defaults to "md5". Hashes of other algorithms
+            are prefixed with the name, e.g., `sha256:<hash>`.
 
     Returns:
-        Outputs the path of the created Parquet file.
+        Outputs the path of the created Parquet file, or of the folder with the
+            partitioned Parquet files.
+
+    Raises:
+        ValueError: If a field in `partition_by` isn't in the data, or the hash
+            algorithm isn't available.
 
     Examples:
         ```{python}
@@ -46,9 +127,298 @@ def write_resource_data(
             data = sp.join_resource_batches(batches, resource_properties)
             # Write resource data file
             sp.write_resource_data(data, resource_properties)
+        ```
     """
     check_data(data, resource_properties)
-    data_path = PackagePath(package_path).resource_data(str(resource_properties.name))
+    path = PackagePath(package_path)
+    resource_name = str(resource_properties.name)
+    data_path = path.resource_data(resource_name)
+    folder_path = path.resource_partitioned_data(resource_name)
+    manifest_path = path.resource_data_manifest(resource_name)
+    primary_key = get_nested_attr(resource_properties, "schema.primary_key")
+    if primary_key and isinstance(data, pl.DataFrame):
+        data = data.sort(primary_key)
+    write_kwargs = _get_parquet_write_kwargs(parquet_options)
+    # Fails early for unavailable algorithms.
+    hashlib.new(hash_algorithm)
+    # The data of each written file, to index its rows.
+    partitions: dict[Path, pl.DataFrame | pl.LazyFrame]
+
+    with _lock(path.resource(resource_name)):
+        if partition_by:
+            written_partitions, fingerprints = _write_partitions(
+                data.collect() if isinstance(data, pl.LazyFrame) else data,
+                folder_path,
+                partition_by,
+                write_kwargs,
+                _read_partitions_manifest(manifest_path).get("partitions", {}),
+            )
+            partitions = dict(written_partitions)
+            _write_partitions_manifest(fingerprints, manifest_path)
+            data_path.unlink(missing_ok=True)
+            resource_properties.bytes = None
+            resource_properties.hash = None
+        else:
+            digest = _write_data_file(data, data_path, write_kwargs, hash_algorithm)
+            if folder_path.is_dir():
+                shutil.rmtree(folder_path)
+            _write_partitions_manifest(None, manifest_path)
+            resource_properties.bytes = data_path.stat().st_size
+            resource_properties.hash = _format_hash(digest)
+            if isinstance(data, pl.LazyFrame):
+                # Index the written file, so the LazyFrame isn't computed again.
+                data = pl.scan_parquet(data_path)
+            partitions = {data_path: data}
+        resource_properties.path = _create_resource_data_path(
+            resource_name, partitioned=bool(partition_by)
+        )
+
+        index_path = path.resource_primary_key_index(resource_name)
+        if primary_key:
+            _write_primary_key_index(
+                [
+                    _create_primary_key_index(
+                        partition,
+                        partition_path.relative_to(
+                            path.resource(resource_name)
+                        ).as_posix(),
+                        primary_key,
+                    )
+                    for partition_path, partition in partitions.items()
+                ],
+                index_path,
+            )
+        else:
+            index_path.unlink(missing_ok=True)
+
+    return folder_path if partition_by else data_path
+
+
+def _write_data_file(
+    data: pl.DataFrame | pl.LazyFrame,
+    data_path: Path,
+    write_kwargs: dict[str, Any],
+    hash_algorithm: str,
+) -> "hashlib._Hash":
+    """Writes the data file atomically and hashes its content.
+
+    Args:
+        data: The data to write.
+        data_path: The path to the data file.
+        write_kwargs: The keyword arguments for `write_parquet()` or `sink_parquet()`.
+        hash_algorithm: The name of the hash algorithm.
+
+    Returns:
+        The hash of the written file.
+    """
+    digest = hashlib.new(hash_algorithm)
+
+    def write(temp_path: Path) -> None:
+        if isinstance(data, pl.LazyFrame):
+            data.sink_parquet(temp_path, **write_kwargs)
+            with temp_path.open("rb") as file:
+                while chunk := file.read(DATA_FILE_BUFFER_SIZE):
+                    digest.update(chunk)
+            return
+        with temp_path.open("wb", buffering=DATA_FILE_BUFFER_SIZE) as file:
+            data.write_parquet(
+                cast(IO[bytes], _HashingWriter(file, digest)), **write_kwargs
+            )
+
+    _write_atomically(write, data_path)
+    return digest
+
+
+class _HashingWriter(RawIOBase):
+    """A writable file that hashes the bytes written to it on their way to a file."""
+
+    def __init__(self, file: IO[bytes], digest: "hashlib._Hash"):
+        """Wraps the file and the hash to update."""
+        self.file = file
+        self.digest = digest
+
+    def writable(self) -> bool:
+        """The file is writable."""
+        return True
+
+    def write(self, buffer: Buffer) -> int:
+        """Writes the bytes to the file and adds them to the hash."""
+        self.digest.update(buffer)
+        return self.file.write(buffer)
+
+
+def _format_hash(digest: "hashlib._Hash") -> str:
+    """Formats the hash as in the `hash` property, prefixed unless it's MD5."""
+    if digest.name == "md5":
+        return digest.hexdigest()
+    return f"{digest.name}:{digest.hexdigest()}"
+
+
+def _write_partitions(
+    data: pl.DataFrame,
+    folder_path: Path,
+    partition_by: list[str],
+    write_kwargs: dict[str, Any],
+    fingerprints: dict[str, dict],
+) -> tuple[dict[Path, pl.DataFrame], dict[str, dict]]:
+    """Writes the data as one Parquet file per partition into the folder.
+
+    A partition is only written if its fingerprint differs from the one recorded when
+    its file was last written, or the file has changed since.
+
+    Args:
+        data: The data to write.
+        folder_path: The path to the folder to write the partitions into.
+        partition_by: The names of the columns to partition the data by.
+        write_kwargs: The keyword arguments for `write_parquet()`.
+        fingerprints: The fingerprints of the partitions from the last write, by the
+            path to their file relative to the folder.
+
+    Returns:
+        The data of each partition, by the path to its file, and the fingerprints of
+            the written partitions.
+
+    Raises:
+        ValueError: If a column in `partition_by` isn't in the data.
+    """
+    missing_columns = [name for name in partition_by if name not in data.columns]
+    if missing_columns:
+        raise ValueError(
+            f"Can't partition the data by {missing_columns}, as the data has no "
+            "columns with these names."
+        )
+
+    folder_path.mkdir(exist_ok=True)
+    partitions = {}
+    new_fingerprints = {}
+    for key, partition in data.partition_by(
+        partition_by, as_dict=True, maintain_order=True
+    ).items():
+        relative_path = _create_partition_path(partition_by, key)
+        partition_path = folder_path / relative_path
+        partitions[partition_path] = partition
+        fingerprint = _get_partition_fingerprint(partition)
+        entry = fingerprints.get(relative_path.as_posix())
+        if not (
+            entry
+            and entry["fingerprint"] == fingerprint
+            and _get_file_stat(partition_path) == [entry["bytes"], entry["mtime_ns"]]
+        ):
+            partition_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomically(
+                partial(partition.write_parquet, **write_kwargs), partition_path
+            )
+        size, mtime_ns = _get_file_stat(partition_path) or [0, 0]
+        new_fingerprints[relative_path.as_posix()] = {
+            "fingerprint": fingerprint,
+            "bytes": size,
+            "mtime_ns": mtime_ns,
+        }
+
+    for old_path in set(folder_path.glob("**/*.parquet")) - set(partitions):
+        _remove_partition(old_path, folder_path)
+    return partitions, new_fingerprints
+
+
+def _get_partition_fingerprint(partition: pl.DataFrame) -> str:
+    """Hashes the schema and the rows of a partition, in their order.
+
+    Polars doesn't guarantee that row hashes are the same across its versions, so
+    fingerprints are only compared if they were recorded by the same version.
+    """
+    row_hashes = partition.with_row_index().hash_rows(seed=0)
+    return _get_json_hash([str(partition.schema), partition.height, row_hashes.sum()])
+
+
+def _get_file_stat(path: Path) -> list[int] | None:
+    """Gets the size and the modification time of the file, or None if it's missing."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _read_partitions_manifest(manifest_path: Path) -> dict:
+    """Reads the partition fingerprints recorded in the data manifest.
+
+    Args:
+        manifest_path: The path to the data manifest.
+
+    Returns:
+        The `partitions` and `polars_version` entries of the manifest. Empty, if there
+            are none, or they were recorded by another version of Polars.
+    """
+    try:
+        manifest = _read_json(manifest_path)
+        if manifest["polars_version"] != pl.__version__:
+            return {}
+        return {
+            "partitions": dict(manifest["partitions"]),
+            "polars_version": manifest["polars_version"],
+        }
+    except (OSError, JSONDecodeError, KeyError, TypeError, ValueError):
+        return {}
+
+
+def _write_partitions_manifest(
+    fingerprints: dict[str, dict] | None, manifest_path: Path
+) -> None:
+    """Records the partition fingerprints in the data manifest.
+
+    The other entries of the manifest, written by `build_resource_data()`, are kept.
+
+    Args:
+        fingerprints: The fingerprints of the partitions. None removes them, e.g.,
+            when the data is written to a single file.
+        manifest_path: The path to the data manifest.
+    """
+    try:
+        manifest = _read_json(manifest_path)
+    except (OSError, JSONDecodeError):
+        manifest = None
+    if not isinstance(manifest, dict):
+        if fingerprints is None:
+            return
+        manifest = {}
+
+    if fingerprints is None:
+        if "partitions" not in manifest:
+            return
+        manifest.pop("partitions")
+        manifest.pop("polars_version", None)
+    else:
+        manifest |= {"partitions": fingerprints, "polars_version": pl.__version__}
+    _write_json(manifest, manifest_path)
+
+
+def _create_partition_path(partition_by: list[str], key: tuple) -> Path:
+    """Creates the relative path to a partition's file from its values.
+
+    Values are percent-encoded, and missing values are written as
+    `__HIVE_DEFAULT_PARTITION__`, as in Hive.
+
+    Args:
+        partition_by: The names of the columns the data is partitioned by.
+        key: The values of these columns for the partition.
+
+    Returns:
+        The path, e.g., `year=2024/sex=female/data.parquet`.
+    """
+    return Path(
+        *[
+            f"{name}="
+            + ("__HIVE_DEFAULT_PARTITION__" if value is None else quote(str(value), ""))
+            for name, value in zip(partition_by, key)
+        ],
+        "data.parquet",
+    )
+
 
-    data.write_parquet(data_path)
-    return data_path
+def _remove_partition(path: Path, folder_path: Path) -> None:
+    """Removes a partition's file and any sub-folders that become empty."""
+    path.unlink()
+    for parent in path.parents:
+        if parent == folder_path or any(parent.iterdir()):
+            return
+        parent.rmdir()
@@ -0,0 +1,85 @@
+from json import dumps, loads
+
+from jsonschema import Draft7Validator
+from pytest import fixture
+
+import seedcase_sprout.check_datapackage.internals as internals
+from seedcase_sprout.check_datapackage.check_properties import check_properties
+from seedcase_sprout.check_datapackage.check_resource_properties import (
+    check_resource_properties,
+)
+from seedcase_sprout.check_datapackage.clear_validator_cache import (
+    clear_validator_cache,
+)
+from seedcase_sprout.check_datapackage.constants import DATA_PACKAGE_SCHEMA_PATH
+from seedcase_sprout.check_datapackage.internals import _VALIDATORS
+
+properties = {
+    "name": "package-1",
+    "id": "123",
+    "licenses": [{"name": "odc-pddl"}],
+    "resources": [{"name": "resource-1", "path": "data.csv"}],
+}
+
+
+@fixture
+def schema_checks(monkeypatch):
+    """Counts how often a schema is compiled into a validator."""
+    clear_validator_cache()
+    calls = []
+    check_schema = Draft7Validator.check_schema
+    monkeypatch.setattr(
+        Draft7Validator,
+        "check_schema",
+        lambda schema: calls.append(schema) or check_schema(schema),
+    )
+    return calls
+
+
+def test_builds_validator_only_once_per_variant(schema_checks):
+    """Repeated checks should reuse the same compiled validator."""
+    for _ in range(5):
+        assert check_properties(properties) == []
+        assert check_resource_properties(properties["resources"][0]) == []
+
+    assert len(schema_checks) == 2
+    assert len(_VALIDATORS) == 2
+
+
+def test_builds_separate_validators_with_and_without_recommendations(schema_checks):
+    """Checks with and without recommendations should not share a validator."""
+    bad_name = properties | {"name": "Not A Valid Name"}
+
+    assert check_properties(bad_name, check_recommendations=False) == []
+    assert len(check_properties(bad_name)) == 1
+    assert check_properties(bad_name, check_recommendations=False) == []
+    assert len(schema_checks) == 2
+
+
+def test_clears_validators(schema_checks):
+    """Validators should be rebuilt after clearing the cache."""
+    check_properties(properties)
+    clear_validator_cache()
+
+    assert _VALIDATORS == {}
+    assert check_properties(properties) == []
+    assert len(schema_checks) == 2
+
+
+def test_rebuilds_validators_when_schema_file_changes(
+    schema_checks, monkeypatch, tmp_path
+):
+    """Validators should be rebuilt once the schema file has changed, without
+    clearing the cache."""
+    schema_path = tmp_path / "schema.json"
+    schema = loads(DATA_PACKAGE_SCHEMA_PATH.read_text())
+    schema_path.write_text(dumps(schema))
+    monkeypatch.setattr(internals, "DATA_PACKAGE_SCHEMA_PATH", schema_path)
+    check_properties(properties)
+
+    schema["required"].append("title")
+    schema_path.write_text(dumps(schema, indent=2))
+
+    assert len(check_properties(properties)) == 1
+    assert len(schema_checks) == 2
+    assert len(_VALIDATORS) == 1
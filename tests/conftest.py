@@ -2,6 +2,8 @@ import os
 
 from pytest import fixture
 
+from seedcase_sprout.examples import ExamplePackage, example_resource_properties
+
 
 @fixture
 def tmp_cwd(tmp_path):
@@ -25,3 +27,24 @@ def tmp_cwd(tmp_path):
     os.chdir(tmp_path)
     yield tmp_path
     os.chdir(original)
+
+
+@fixture
+def package_path():
+    """Creates the example package and changes the working directory to it.
+
+    Yields:
+        The `PackagePath` of the example package.
+    """
+    with ExamplePackage() as package_path:
+        yield package_path
+
+
+@fixture
+def resource_properties():
+    """Creates the properties of the example resource.
+
+    Returns:
+        The `ResourceProperties` of the example resource.
+    """
+    return example_resource_properties()
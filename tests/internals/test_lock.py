@@ -0,0 +1,122 @@
+from threading import Event, Thread, Timer
+
+from pytest import fixture, raises
+
+from seedcase_sprout.examples import example_data, example_resource_properties
+from seedcase_sprout.internals import _lock
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.write_resource_batch import write_resource_batch
+
+
+@fixture
+def hold_lock():
+    """Holds a lock on a folder in another thread until the test is done."""
+    released = Event()
+    threads = []
+
+    def hold(path, exclusive=True):
+        locked = Event()
+
+        def run():
+            with _lock(path, exclusive=exclusive):
+                locked.set()
+                released.wait()
+
+        thread = Thread(target=run)
+        thread.start()
+        threads.append(thread)
+        locked.wait()
+        return released
+
+    yield hold
+    released.set()
+    [thread.join() for thread in threads]
+
+
+def test_times_out_if_locked_exclusively_elsewhere(tmp_path, hold_lock):
+    """Should raise TimeoutError if another holder has an exclusive lock."""
+    hold_lock(tmp_path)
+
+    with raises(TimeoutError):
+        with _lock(tmp_path, exclusive=False, timeout=0.05):
+            pass
+
+
+def test_times_out_if_exclusive_lock_requested_while_shared_elsewhere(
+    tmp_path, hold_lock
+):
+    """Should raise TimeoutError for an exclusive lock if another holder has a shared
+    lock."""
+    hold_lock(tmp_path, exclusive=False)
+
+    with raises(TimeoutError):
+        with _lock(tmp_path, timeout=0.05):
+            pass
+
+
+def test_shared_locks_can_be_held_at_the_same_time(tmp_path, hold_lock):
+    """Should allow several holders of a shared lock."""
+    hold_lock(tmp_path, exclusive=False)
+
+    with _lock(tmp_path, exclusive=False, timeout=0.05) as path:
+        assert path == tmp_path
+
+
+def test_waits_until_lock_is_released(tmp_path, hold_lock):
+    """Should take the lock once the other holder releases it."""
+    released = hold_lock(tmp_path)
+    Timer(0.05, released.set).start()
+
+    with _lock(tmp_path, timeout=5) as path:
+        assert path == tmp_path
+
+
+def test_is_reentrant_within_a_thread(tmp_path):
+    """Should reuse a lock already held by the same thread."""
+    with _lock(tmp_path), _lock(tmp_path, timeout=0), _lock(tmp_path, False, 0):
+        pass
+
+    # The lock is released again afterwards
+    with _lock(tmp_path, timeout=0):
+        pass
+
+
+def test_cannot_upgrade_shared_lock(tmp_path):
+    """Should raise RuntimeError if upgrading a shared lock held by the same thread."""
+    with _lock(tmp_path, exclusive=False):
+        with raises(RuntimeError):
+            with _lock(tmp_path):
+                pass
+
+
+def test_raises_error_if_folder_does_not_exist(tmp_path):
+    """Should raise FileNotFoundError if the folder to lock doesn't exist."""
+    with raises(FileNotFoundError):
+        with _lock(tmp_path / "non-existent"):
+            pass
+
+
+def test_batch_files_are_not_written_while_resource_is_locked(tmp_path, hold_lock):
+    """Batch files should only be written once an exclusive lock on the resource, e.g.,
+    while building its data file, is released."""
+    # Given
+    resource_properties = example_resource_properties()
+    package_path = PackagePath(tmp_path)
+    package_path.resource_batch(resource_properties.name).mkdir(parents=True)
+    released = hold_lock(package_path.resource(resource_properties.name))
+    batch_files = []
+
+    # When
+    writer = Thread(
+        target=lambda: batch_files.append(
+            write_resource_batch(example_data(), resource_properties, tmp_path)
+        )
+    )
+    writer.start()
+    writer.join(0.1)
+
+    # Then
+    assert package_path.resource_batch_files(resource_properties.name) == []
+    released.set()
+    writer.join()
+    assert package_path.resource_batch_files(resource_properties.name) == batch_files
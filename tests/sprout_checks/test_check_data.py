@@ -1,4 +1,5 @@
 import re
+from datetime import date, datetime, time
 
 import polars as pl
 from polars.testing import assert_frame_equal
@@ -11,6 +12,7 @@ from seedcase_sprout.examples import (
 )
 from seedcase_sprout.map_data_types import _get_allowed_polars_types
 from seedcase_sprout.properties import (
+    ConstraintsProperties,
     FieldProperties,
     ResourceProperties,
     TableSchemaProperties,
@@ -205,3 +207,224 @@ def test_rejects_geopoint_with_incorrect_inner_type():
 def test_rejects_incorrect_resource_properties():
     """Should throw an error if the resource properties are incorrect."""
     assert_raises_check_errors(lambda: check_data(example_data(), ResourceProperties()))
+
+
+@mark.parametrize(
+    "field_type, values, constraints, violating_rows",
+    [
+        ("integer", [1, None, 3], ConstraintsProperties(required=True), [1]),
+        ("integer", [1, 2, 1, None, None], ConstraintsProperties(unique=True), [0, 2]),
+        ("string", ["ab", "a1", None], ConstraintsProperties(pattern="[a-z]+"), [1]),
+        ("string", ["a", "b", "c"], ConstraintsProperties(enum=["a", "c"]), [1]),
+        ("string", ["a", "abc", None], ConstraintsProperties(min_length=2), [0]),
+        ("string", ["a", "abc", None], ConstraintsProperties(max_length=2), [1]),
+        ("number", [-1.0, 0.0, 1.0], ConstraintsProperties(minimum=0), [0]),
+        ("number", [-1.0, 0.0, 1.0], ConstraintsProperties(maximum=0), [2]),
+        ("integer", [-1, 0, 1], ConstraintsProperties(exclusive_minimum=0), [0, 1]),
+        ("integer", [-1, 0, 1], ConstraintsProperties(exclusive_maximum=0), [1, 2]),
+    ],
+)
+def test_rejects_values_not_matching_constraints(
+    resource_properties, field_type, values, constraints, violating_rows
+):
+    """Should raise an error per constraint that values in the data don't match,
+    giving the violating rows."""
+    resource_properties.schema.fields = [
+        FieldProperties(name="my_col", type=field_type, constraints=constraints)
+    ]
+    data = pl.DataFrame({"my_col": values})
+
+    with raises(ExceptionGroup) as error_info:
+        check_data(data, resource_properties)
+
+    errors = error_info.value.exceptions
+    assert len(errors) == 1
+    assert f"{len(violating_rows)} value(s)" in str(errors[0])
+    assert f"row(s) {violating_rows}" in str(errors[0])
+
+
+def test_checks_enum_constraint_with_values_outside_enum_categories(
+    resource_properties,
+):
+    """Should compare the values of an Enum column as text, so the constraint can have
+    values that aren't categories of the Enum."""
+    resource_properties.schema.fields = [
+        FieldProperties(
+            name="my_col",
+            type="string",
+            constraints=ConstraintsProperties(enum=["x", "z"]),
+        )
+    ]
+    data = pl.DataFrame({"my_col": ["x", "y"]}, schema={"my_col": pl.Enum(["x", "y"])})
+
+    assert_raises_errors(lambda: check_data(data, resource_properties), ValueError, 1)
+
+
+@mark.parametrize(
+    "field_type, values, constraints, violating_rows",
+    [
+        (
+            "time",
+            [time(9), time(11), None],
+            ConstraintsProperties(maximum="10:00:00"),
+            [1],
+        ),
+        (
+            "datetime",
+            [datetime(2024, 1, 1), datetime(2024, 1, 3)],
+            ConstraintsProperties(exclusive_maximum="2024-01-02T00:00:00Z"),
+            [1],
+        ),
+        (
+            "yearmonth",
+            [date(2024, 1, 1), date(2024, 3, 1)],
+            ConstraintsProperties(minimum="2024-02"),
+            [0],
+        ),
+        ("integer", [1, 5], ConstraintsProperties(minimum="2"), [0]),
+    ],
+)
+def test_parses_constraint_bounds_given_as_strings(
+    resource_properties, field_type, values, constraints, violating_rows
+):
+    """Should parse bounds given as strings in the format of the field's type."""
+    resource_properties.schema.fields = [
+        FieldProperties(name="my_col", type=field_type, constraints=constraints)
+    ]
+    data = pl.LazyFrame({"my_col": values})
+
+    with raises(ExceptionGroup) as error_info:
+        check_data(data, resource_properties)
+
+    [error] = error_info.value.exceptions
+    assert f"row(s) {violating_rows}" in str(error)
+
+
+def test_rejects_constraint_bounds_that_cant_be_parsed(resource_properties):
+    """Should raise an error per bound that can't be parsed, alongside the errors
+    for the other constraints."""
+    resource_properties.schema.fields = [
+        FieldProperties(
+            name="my_time",
+            type="time",
+            constraints=ConstraintsProperties(minimum="noon", maximum="25:00"),
+        ),
+        FieldProperties(
+            name="my_int",
+            type="integer",
+            constraints=ConstraintsProperties(required=True),
+        ),
+    ]
+    data = pl.DataFrame({"my_time": [time(9)], "my_int": [None]}).cast(
+        {"my_int": pl.Int64}
+    )
+
+    with raises(ExceptionGroup) as error_info:
+        check_data(data, resource_properties)
+
+    errors = error_info.value.exceptions
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert len(errors) == 3
+    assert "'minimum' constraint of column 'my_time'" in str(errors[0])
+
+
+def test_accepts_values_matching_constraints(resource_properties):
+    """Should not raise an error when all values match the constraints."""
+    resource_properties.schema.fields = [
+        FieldProperties(
+            name="my_date",
+            type="date",
+            constraints=ConstraintsProperties(
+                required=True, unique=True, minimum="2020-01-01"
+            ),
+        ),
+        FieldProperties(
+            name="my_string",
+            type="string",
+            constraints=ConstraintsProperties(
+                pattern="[a-z]+", enum=["ab", "cd"], min_length=2, max_length=2
+            ),
+        ),
+    ]
+    data = pl.DataFrame(
+        {
+            "my_date": pl.Series(["2020-01-01", "2024-02-29"]).str.to_date(),
+            "my_string": pl.Series(["ab", None]).cast(pl.Categorical),
+        }
+    )
+
+    assert check_data(data, resource_properties) is data
+
+
+def test_rejects_values_not_matching_constraints_in_lazy_data(resource_properties):
+    """Should check the constraints of all columns in a LazyFrame."""
+    resource_properties.schema.fields = [
+        FieldProperties(
+            name="my_int",
+            type="integer",
+            constraints=ConstraintsProperties(minimum=0, maximum=10),
+        ),
+        FieldProperties(
+            name="my_string",
+            type="string",
+            constraints=ConstraintsProperties(required=True),
+        ),
+    ]
+    data = pl.LazyFrame({"my_int": [-1, 5, 11], "my_string": ["a", None, "b"]})
+
+    assert_raises_errors(lambda: check_data(data, resource_properties), ValueError, 3)
+
+
+def test_rejects_duplicate_primary_key_values():
+    """Should report the number of duplicate primary key values and examples."""
+    resource_properties = example_resource_properties()
+    data = pl.concat([example_data(), example_data().head(2)])
+
+    with raises(ExceptionGroup) as error_info:
+        check_data(data, resource_properties)
+
+    [error] = error_info.value.exceptions
+    assert isinstance(error, ValueError)
+    assert "primary key ['id'] has 2 value(s)" in str(error)
+    assert "4 row(s) in total" in str(error)
+    assert "{'id': 34}" in str(error)
+
+
+def test_rejects_duplicate_unique_key_values_in_lazy_data(resource_properties):
+    """Should check each unique key of a LazyFrame, ignoring rows with missing key
+    values."""
+    resource_properties.schema.fields = [
+        FieldProperties(name="a", type="integer"),
+        FieldProperties(name="b", type="string"),
+    ]
+    resource_properties.schema.primary_key = ["a", "b"]
+    resource_properties.schema.unique_keys = [["a"], ["b"]]
+    data = pl.LazyFrame({"a": [1, 1, 2, None, None], "b": ["x", "y", "z", "w", "v"]})
+
+    with raises(ExceptionGroup) as error_info:
+        check_data(data, resource_properties)
+
+    [error] = error_info.value.exceptions
+    assert "unique key ['a'] has 1 value(s)" in str(error)
+
+
+def test_compares_missing_primary_key_values(resource_properties):
+    """Should treat missing primary key values as duplicates of each other."""
+    resource_properties.schema.fields = [FieldProperties(name="a", type="integer")]
+    resource_properties.schema.primary_key = "a"
+    data = pl.DataFrame({"a": [1, None, None]})
+
+    assert_raises_errors(lambda: check_data(data, resource_properties), ValueError)
+
+
+def test_accepts_unique_key_values(resource_properties):
+    """Should not raise an error if the keys have no duplicate values."""
+    resource_properties.schema.fields = [
+        FieldProperties(name="a", type="integer"),
+        FieldProperties(name="b", type="string"),
+    ]
+    resource_properties.schema.primary_key = ["a", "b"]
+    resource_properties.schema.unique_keys = [["b"]]
+    data = pl.DataFrame({"a": [1, 1, 2], "b": ["x", None, None]})
+
+    assert check_data(data, resource_properties) is data
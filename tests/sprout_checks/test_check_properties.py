@@ -1,9 +1,13 @@
+from collections import OrderedDict
+from importlib import import_module
 from pathlib import Path
 
 from pytest import fixture, mark, raises
 
+import seedcase_sprout.check_datapackage as cdp
 from seedcase_sprout.check_datapackage import CheckError
 from seedcase_sprout.check_properties import (
+    _check_resource_properties_once,
     check_package_properties,
     check_properties,
     check_resource_properties,
@@ -54,7 +58,7 @@ def test_passes_correct_properties(properties):
     assert check_resource_properties(properties.resources[1]) == properties.resources[1]
 
     # Even when resources isn't there.
-    delattr(properties, "resources")
+    properties.resources = None
     assert check_properties(properties) == properties
 
 
@@ -88,7 +92,7 @@ def test_error_incorrect_argument():
 @mark.parametrize("field", PACKAGE_SPROUT_REQUIRED_FIELDS.keys())
 def test_error_missing_required_package_properties(properties, field):
     """Should be an error if a required package properties is missing."""
-    delattr(properties, field)
+    setattr(properties, field, None)
 
     # All properties checks
     with raises(ExceptionGroup) as error_info:
@@ -209,7 +213,7 @@ def test_error_missing_required_nested_properties(properties):
 )
 def test_error_missing_required_resource_properties(properties, field):
     """Should be an error if a required resource properties is missing."""
-    delattr(properties.resources[0], field)
+    setattr(properties.resources[0], field, None)
 
     with raises(ExceptionGroup) as error_info:
         check_resource_properties(properties.resources[0])
@@ -318,3 +322,83 @@ def test_error_no_resource_name_in_path(properties, path):
         isinstance(error, CheckError) and error.json_path.endswith("path")
         for error in errors
     )
+
+
+@fixture
+def resource_checks(monkeypatch):
+    """Counts how often resource properties are checked against the standard."""
+    monkeypatch.setattr(
+        import_module("seedcase_sprout.check_properties"),
+        "_CHECKED_RESOURCE_PROPERTIES",
+        OrderedDict(),
+    )
+    calls = []
+    check = cdp.check_properties
+    monkeypatch.setattr(
+        cdp, "check_properties", lambda *args: calls.append(args) or check(*args)
+    )
+    return calls
+
+
+def test_checks_same_resource_properties_only_once(resource_checks):
+    """Resource properties with the same content should only be checked once
+    along the way."""
+    for _ in range(3):
+        _check_resource_properties_once(example_resource_properties())
+
+    assert len(resource_checks) == 1
+
+
+def test_checks_resource_properties_again_after_change(resource_checks):
+    """Changed resource properties should be checked again."""
+    resource_properties = example_resource_properties()
+    _check_resource_properties_once(resource_properties)
+    resource_properties.name = "spaces in name"
+
+    with raises(ExceptionGroup):
+        _check_resource_properties_once(resource_properties)
+    with raises(ExceptionGroup):
+        _check_resource_properties_once(resource_properties)
+    assert len(resource_checks) == 3
+
+
+def test_check_resource_properties_always_checks(resource_checks):
+    """Checking resource properties directly should force the check."""
+    _check_resource_properties_once(example_resource_properties())
+    check_resource_properties(example_resource_properties())
+
+    assert len(resource_checks) == 2
+
+
+def test_forgets_least_recently_checked_resource_properties(
+    resource_checks, monkeypatch
+):
+    """Should only remember the most recently checked resource properties."""
+    monkeypatch.setattr(
+        import_module("seedcase_sprout.check_properties"),
+        "_CHECKED_RESOURCE_PROPERTIES_MAX_SIZE",
+        2,
+    )
+    names = ["resource-1", "resource-2", "resource-1", "resource-3", "resource-2"]
+    for name in names:
+        _check_resource_properties_once(
+            ResourceProperties(name=name, title=name, description=name)
+        )
+
+    # resource-2 was the least recently used when resource-3 was checked
+    assert len(resource_checks) == 4
+
+
+def test_checks_resource_properties_again_after_clearing_validators(resource_checks):
+    """Clearing the validator cache should also forget the checked properties."""
+    _check_resource_properties_once(example_resource_properties())
+    cdp.clear_validator_cache()
+    _check_resource_properties_once(example_resource_properties())
+
+    assert len(resource_checks) == 2
+
+
+def test_check_resource_properties_once_checks_type():
+    """Should throw an error if the properties are not resource properties."""
+    with raises(TypeError):
+        _check_resource_properties_once(PackageProperties())
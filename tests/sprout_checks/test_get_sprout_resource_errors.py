@@ -80,6 +80,13 @@ def test_error_found_if_data_path_is_incorrect_(properties, path):
     assert errors[0].json_path == get_json_path_to_resource_field("path")
 
 
+def test_passes_path_to_partitioned_data(properties):
+    """Should pass if `path` points to the folder with partitioned data."""
+    properties["path"] = str(Path("resources", "resource-1", "data"))
+
+    assert get_sprout_resource_errors(properties) == []
+
+
 def test_ignores_path_if_name_incorrect(properties):
     """Should not check the path if the name is incorrect."""
     properties["name"] = "name with spaces"
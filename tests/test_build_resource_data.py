@@ -0,0 +1,341 @@
+from importlib import import_module
+from uuid import uuid4
+
+import polars as pl
+from polars.testing import assert_frame_equal
+from pytest import raises
+
+from seedcase_sprout.build_resource_data import build_resource_data
+from seedcase_sprout.examples import (
+    example_data,
+    example_resource_properties,
+)
+from seedcase_sprout.internals import _read_json, _write_json
+from seedcase_sprout.parquet_write_options import ParquetWriteOptions
+from seedcase_sprout.write_resource_batch import write_resource_batch
+
+new_data = pl.DataFrame(
+    {
+        "id": [99, 101],
+        "name": ["Mark Scout", "Irving B"],
+        "value": [1.0, 2.0],
+    }
+)
+
+
+def write_batch(data, package_path, timestamp):
+    """Writes a batch file with the given timestamp in its name."""
+    batch_path = package_path.resource_batch("example-resource")
+    batch_path.mkdir(exist_ok=True)
+    data.write_parquet(batch_path / f"{timestamp}-{uuid4()}.parquet")
+
+
+def read_manifest(package_path):
+    return _read_json(package_path.resource_data_manifest("example-resource"))
+
+
+def test_builds_data_from_all_batches(package_path, resource_properties):
+    """The first build should join all batch files and record them in the
+    manifest."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    write_batch(new_data, package_path, "2025-03-27T100000Z")
+
+    # When
+    data_path = build_resource_data(resource_properties, package_path.root())
+
+    # Then
+    assert data_path == package_path.resource_data("example-resource")
+    assert pl.read_parquet(data_path).sort("id")["name"].to_list() == [
+        "Helly R",
+        "Mark Scout",
+        "Ms Casey",
+        "Irving B",
+    ]
+    manifest = read_manifest(package_path)
+    assert len(manifest["batch_files"]) == 2
+    assert manifest["latest_batch_timestamp"] == "2025-03-27T100000000000Z"
+
+
+def test_merges_only_new_batches(package_path, resource_properties, monkeypatch):
+    """Only new batch files should be read and merged by primary key."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    build_resource_data(resource_properties, package_path.root())
+    write_batch(new_data, package_path, "2025-03-27T100000Z")
+    read_paths = []
+    module = import_module("seedcase_sprout.build_resource_data")
+    read_resource_batches = module.read_resource_batches
+    monkeypatch.setattr(
+        module,
+        "read_resource_batches",
+        lambda properties, paths: (
+            read_paths.extend(paths) or read_resource_batches(properties, paths)
+        ),
+    )
+
+    # When
+    data_path = build_resource_data(resource_properties, package_path.root())
+
+    # Then
+    assert len(read_paths) == 1
+    assert "2025-03-27T100000Z" in read_paths[0].name
+    assert pl.read_parquet(data_path).sort("id")["name"].to_list() == [
+        "Helly R",
+        "Mark Scout",
+        "Ms Casey",
+        "Irving B",
+    ]
+    assert len(read_manifest(package_path)["batch_files"]) == 2
+
+
+def test_incremental_build_matches_full_build(package_path, resource_properties):
+    """Merging new batches should give the same data as a full rebuild."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    build_resource_data(resource_properties, package_path.root())
+    write_batch(new_data, package_path, "2025-03-27T100000Z")
+
+    # When
+    incremental = pl.read_parquet(
+        build_resource_data(resource_properties, package_path.root())
+    )
+    full = pl.read_parquet(
+        build_resource_data(resource_properties, package_path.root(), incremental=False)
+    )
+
+    # Then
+    assert_frame_equal(incremental, full, check_row_order=False)
+
+
+def test_does_not_rewrite_data_without_new_batches(package_path, resource_properties):
+    """The data file shouldn't be rewritten when there are no new batch files."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    data_path = build_resource_data(resource_properties, package_path.root())
+    mtime = data_path.stat().st_mtime_ns
+
+    # When
+    build_resource_data(resource_properties, package_path.root())
+
+    # Then
+    assert data_path.stat().st_mtime_ns == mtime
+
+
+def test_sets_data_file_properties_without_new_batches(
+    package_path, resource_properties
+):
+    """Should set the bytes, hash, and path of the properties when nothing is
+    written, like when the data file is written."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    build_resource_data(resource_properties, package_path.root())
+    built_properties = example_resource_properties()
+
+    # When
+    build_resource_data(built_properties, package_path.root())
+
+    # Then
+    assert built_properties.bytes == resource_properties.bytes is not None
+    assert built_properties.hash == resource_properties.hash is not None
+    assert built_properties.path == resource_properties.path
+
+
+def test_rebuilds_when_partitioning_changes(package_path, resource_properties):
+    """Should rewrite the data when it's built with another partitioning."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    build_resource_data(resource_properties, package_path.root(), partition_by=["name"])
+
+    # When
+    data_path = build_resource_data(
+        resource_properties, package_path.root(), partition_by=["id"]
+    )
+
+    # Then
+    partitions = [path.name for path in data_path.iterdir() if path.is_dir()]
+    assert partitions
+    assert all(partition.startswith("id=") for partition in partitions)
+
+
+def test_rebuilds_when_parquet_options_change(package_path, resource_properties):
+    """Should rewrite the data when it's built with other Parquet options."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    data_path = build_resource_data(resource_properties, package_path.root())
+    data_file_hash = read_manifest(package_path)["data_file_hash"]
+
+    # When
+    build_resource_data(
+        resource_properties,
+        package_path.root(),
+        parquet_options=ParquetWriteOptions(compression="uncompressed"),
+    )
+
+    # Then
+    assert read_manifest(package_path)["data_file_hash"] != data_file_hash
+    assert resource_properties.bytes == data_path.stat().st_size
+
+
+def test_rebuilds_when_new_batch_is_older(package_path, resource_properties):
+    """A new batch file older than the joined ones should trigger a full rebuild, so
+    its rows don't replace newer rows."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    build_resource_data(resource_properties, package_path.root())
+    write_batch(new_data, package_path, "2025-03-25T100000Z")
+
+    # When
+    data = pl.read_parquet(
+        build_resource_data(resource_properties, package_path.root())
+    )
+
+    # Then
+    assert data.filter(pl.col("id") == 99)["name"].to_list() == ["Mark S"]
+
+
+def test_rebuilds_when_joined_batch_is_removed(package_path, resource_properties):
+    """The data file should be fully rebuilt when a joined batch file is removed."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    build_resource_data(resource_properties, package_path.root())
+    [old_batch_file] = package_path.resource_batch_files("example-resource")
+    old_batch_file.unlink()
+    write_batch(new_data, package_path, "2025-03-27T100000Z")
+
+    # When
+    data = pl.read_parquet(
+        build_resource_data(resource_properties, package_path.root())
+    )
+
+    # Then
+    assert_frame_equal(data, new_data, check_row_order=False)
+
+
+def test_rebuilds_when_manifest_is_inconsistent(package_path, resource_properties):
+    """The data file should be fully rebuilt when the manifest doesn't match it."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    build_resource_data(resource_properties, package_path.root())
+    manifest = read_manifest(package_path)
+    manifest["data_file_size"] = 0
+    _write_json(manifest, package_path.resource_data_manifest("example-resource"))
+    package_path.resource_data("example-resource").write_bytes(b"not parquet")
+
+    # When
+    data = pl.read_parquet(
+        build_resource_data(resource_properties, package_path.root())
+    )
+
+    # Then
+    assert_frame_equal(data, example_data(), check_row_order=False)
+
+
+def test_rebuilds_when_manifest_is_corrupt(package_path, resource_properties):
+    """The data file should be fully rebuilt when the manifest can't be read."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    build_resource_data(resource_properties, package_path.root())
+    package_path.resource_data_manifest("example-resource").write_text("{")
+
+    # When
+    data = pl.read_parquet(
+        build_resource_data(resource_properties, package_path.root())
+    )
+
+    # Then
+    assert_frame_equal(data, example_data(), check_row_order=False)
+
+
+def test_rebuilds_when_properties_change(package_path, resource_properties):
+    """The data file should be fully rebuilt when the resource properties change."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    build_resource_data(resource_properties, package_path.root())
+    resource_properties.schema.primary_key = None
+    write_batch(example_data(), package_path, "2025-03-27T100000Z")
+
+    # When
+    data = pl.read_parquet(
+        build_resource_data(resource_properties, package_path.root())
+    )
+
+    # Then
+    assert_frame_equal(data, example_data(), check_row_order=False)
+
+
+def test_throws_error_without_batches(package_path, resource_properties):
+    """Should throw an error if there are no batch files to build the data from."""
+    with raises(ValueError):
+        build_resource_data(resource_properties, package_path.root())
+
+
+def test_builds_partitioned_data_incrementally(
+    package_path, resource_properties, monkeypatch
+):
+    """Should build partitioned data, merging only new batch files into it."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    build_resource_data(resource_properties, package_path.root(), partition_by=["id"])
+    write_batch(new_data, package_path, "2025-03-27T100000Z")
+    read_paths = []
+    module = import_module("seedcase_sprout.build_resource_data")
+    read_resource_batches = module.read_resource_batches
+    monkeypatch.setattr(
+        module,
+        "read_resource_batches",
+        lambda properties, paths: (
+            read_paths.extend(paths) or read_resource_batches(properties, paths)
+        ),
+    )
+
+    # When
+    data_path = build_resource_data(
+        resource_properties, package_path.root(), partition_by=["id"]
+    )
+
+    # Then
+    assert data_path == package_path.resource_partitioned_data("example-resource")
+    assert len(read_paths) == 1
+    assert sorted(path.name for path in data_path.iterdir()) == [
+        "id=100",
+        "id=101",
+        "id=34",
+        "id=99",
+    ]
+    assert pl.read_parquet(data_path / "id=99" / "data.parquet")["name"].to_list() == [
+        "Mark Scout"
+    ]
+
+
+def test_rebuilds_when_joined_batch_is_changed(package_path, resource_properties):
+    """A batch file that was changed after being joined should trigger a full
+    rebuild."""
+    # Given
+    write_batch(example_data(), package_path, "2025-03-26T100000Z")
+    build_resource_data(resource_properties, package_path.root())
+    [batch_file] = package_path.resource_batch_files("example-resource")
+    new_data.write_parquet(batch_file)
+
+    # When
+    data = pl.read_parquet(
+        build_resource_data(resource_properties, package_path.root())
+    )
+
+    # Then
+    assert_frame_equal(data, new_data)
+
+
+def test_keeps_batches_written_before_batch_manifest(package_path, resource_properties):
+    """Batch files written before the batch manifest existed should still be built
+    into the data after newer batches are added to the manifest."""
+    # Given a package from before batch manifests
+    write_batch(example_data(), package_path, "2024-01-01T120000Z")
+
+    # When
+    write_resource_batch(new_data, resource_properties, package_path.root())
+    data_path = build_resource_data(resource_properties, package_path.root())
+
+    # Then
+    assert len(package_path.resource_batch_files("example-resource")) == 2
+    assert pl.read_parquet(data_path)["id"].sort().to_list() == [34, 99, 100, 101]
@@ -0,0 +1,165 @@
+import polars as pl
+from pytest import raises
+
+from seedcase_sprout.check_foreign_keys import check_foreign_keys
+from seedcase_sprout.examples import (
+    example_data,
+    example_resource_properties,
+)
+from seedcase_sprout.properties import (
+    FieldProperties,
+    ReferenceProperties,
+    ResourceProperties,
+    TableSchemaForeignKeyProperties,
+    TableSchemaProperties,
+)
+from seedcase_sprout.read_properties import read_properties
+from seedcase_sprout.write_resource_data import write_resource_data
+
+
+def create_orders_properties(
+    reference: ReferenceProperties | None,
+) -> ResourceProperties:
+    return ResourceProperties(
+        name="orders",
+        title="Orders",
+        description="Orders made by the records.",
+        schema=TableSchemaProperties(
+            fields=[
+                FieldProperties(name="order_id", type="integer"),
+                FieldProperties(name="record_id", type="integer"),
+            ],
+            primary_key=["order_id"],
+            foreign_keys=[
+                TableSchemaForeignKeyProperties(
+                    fields=["record_id"], reference=reference
+                )
+            ],
+        ),
+    )
+
+
+def write_orders(package_path, record_ids, reference):
+    properties = read_properties()
+    orders_properties = create_orders_properties(reference)
+    properties.resources = [*(properties.resources or []), orders_properties]
+    package_path.resource("orders").mkdir()
+    write_resource_data(
+        pl.DataFrame(
+            {"order_id": range(len(record_ids)), "record_id": record_ids},
+            schema={"order_id": pl.Int64, "record_id": pl.Int32},
+        ),
+        orders_properties,
+    )
+    return properties
+
+
+def test_accepts_foreign_keys_referring_to_existing_rows(package_path):
+    """Should not raise an error if all foreign key values have a referenced row,
+    ignoring missing values."""
+    write_resource_data(example_data(), example_resource_properties())
+    properties = write_orders(
+        package_path,
+        [34, 99, 34, None],
+        ReferenceProperties(resource="example-resource", fields=["id"]),
+    )
+
+    assert check_foreign_keys(properties) is properties
+
+
+def test_rejects_foreign_key_values_without_referenced_row(package_path):
+    """Should report the foreign key values that aren't in the referenced resource."""
+    write_resource_data(example_data(), example_resource_properties())
+    properties = write_orders(
+        package_path,
+        [34, 1, 1, 2],
+        ReferenceProperties(resource="example-resource", fields=["id"]),
+    )
+
+    with raises(ExceptionGroup) as error_info:
+        check_foreign_keys(properties, package_path.root())
+
+    [error] = error_info.value.exceptions
+    assert isinstance(error, ValueError)
+    assert "has 2 value(s)" in str(error)
+    assert "3 row(s) in total" in str(error)
+    assert "[{'record_id': 1}, {'record_id': 2}]" in str(error)
+    assert error.__notes__ == ["Resource: orders"]
+
+
+def test_checks_foreign_keys_referring_to_same_resource(package_path):
+    """A foreign key without a referenced resource should refer to the resource
+    itself."""
+    properties = write_orders(
+        package_path, [0, 1, 7], ReferenceProperties(fields=["order_id"])
+    )
+
+    with raises(ExceptionGroup) as error_info:
+        check_foreign_keys(properties)
+
+    assert "{'record_id': 7}" in str(error_info.value.exceptions[0])
+
+
+def test_rejects_references_to_missing_resources_or_data(package_path):
+    """Should report foreign keys referring to a resource that isn't in the package
+    or has no data file."""
+    properties = write_orders(
+        package_path,
+        [34],
+        ReferenceProperties(resource="example-resource", fields=["id"]),
+    )
+    orders_properties = properties.resources[-1]
+    orders_properties.schema.foreign_keys.append(
+        TableSchemaForeignKeyProperties(
+            fields=["order_id"],
+            reference=ReferenceProperties(resource="unknown", fields=["id"]),
+        )
+    )
+
+    with raises(ExceptionGroup) as error_info:
+        check_foreign_keys(properties)
+
+    messages = [str(error) for error in error_info.value.exceptions]
+    assert len(messages) == 2
+    assert "which has no data file" in messages[0]
+    assert "which isn't in the package" in messages[1]
+
+
+def test_reports_each_foreign_key_that_cant_be_checked(package_path):
+    """Referenced values that can't be cast to the foreign key's type shouldn't
+    match, and a foreign key that can't be checked shouldn't stop the others."""
+    write_resource_data(example_data(), example_resource_properties())
+    properties = write_orders(
+        package_path,
+        [34],
+        ReferenceProperties(resource="example-resource", fields=["name"]),
+    )
+    properties.resources[-1].schema.foreign_keys.append(
+        TableSchemaForeignKeyProperties(
+            fields=["order_id"],
+            reference=ReferenceProperties(
+                resource="example-resource", fields=["not-a-field"]
+            ),
+        )
+    )
+
+    with raises(ExceptionGroup) as error_info:
+        check_foreign_keys(properties)
+
+    messages = [str(error) for error in error_info.value.exceptions]
+    assert len(messages) == 2
+    assert "[{'record_id': 34}]" in messages[0]
+    assert "Can't check the foreign key ['order_id']" in messages[1]
+    assert "not-a-field" in messages[1]
+
+
+def test_skips_resources_without_data(package_path):
+    """Should not check the foreign keys of resources without a data file."""
+    properties = read_properties()
+    properties.resources.append(
+        create_orders_properties(
+            ReferenceProperties(resource="example-resource", fields=["id"])
+        )
+    )
+
+    assert check_foreign_keys(properties) is properties
@@ -0,0 +1,115 @@
+from pathlib import Path
+from uuid import uuid4
+
+import polars as pl
+from pytest import fixture, raises
+
+from seedcase_sprout.check_resource_batches import check_resource_batches
+from seedcase_sprout.constants import BATCH_TIMESTAMP_COLUMN_NAME
+from seedcase_sprout.properties import (
+    FieldProperties,
+    ResourceProperties,
+    TableSchemaProperties,
+)
+from tests.assert_raises_errors import assert_raises_check_errors
+
+batch_data = pl.DataFrame(
+    {
+        "id": [0, 1, 2],
+        "name": ["anne", "belinda", "catherine"],
+    }
+)
+
+
+@fixture
+def resource_properties() -> ResourceProperties:
+    return ResourceProperties(
+        name="1",
+        title="Test resource",
+        description="A test resource",
+        schema=TableSchemaProperties(
+            fields=[
+                FieldProperties(name="id", type="integer"),
+                FieldProperties(name="name", type="string"),
+            ]
+        ),
+    )
+
+
+@fixture
+def batch_path(tmp_path):
+    batch_path = tmp_path / "resources" / "1" / "batch"
+    batch_path.mkdir(parents=True)
+    return batch_path
+
+
+def write_batch(data: pl.DataFrame, batch_path: Path, timestamp="2025-03-26T100346Z"):
+    path = batch_path / f"{timestamp}-{uuid4()}.parquet"
+    data.write_parquet(path)
+    return path
+
+
+def test_passes_correct_batch_files(batch_path, resource_properties):
+    """Should output the paths if all batch files are correct."""
+    paths = [write_batch(batch_data, batch_path) for _ in range(3)]
+
+    assert check_resource_batches(resource_properties, paths) == paths
+
+
+def test_does_not_read_data(batch_path, resource_properties, monkeypatch):
+    """Should only read the schema of the batch files, not the data."""
+    paths = [write_batch(batch_data, batch_path)]
+    monkeypatch.setattr(pl, "read_parquet", None)
+    monkeypatch.setattr(pl, "scan_parquet", None)
+
+    assert check_resource_batches(resource_properties, paths) == paths
+
+
+def test_reports_all_incorrect_batch_files(batch_path, resource_properties):
+    """Should output an error per incorrect batch file, noting its path."""
+    # Given
+    paths = [
+        write_batch(batch_data, batch_path),
+        write_batch(batch_data.rename({"name": "not-name"}), batch_path),
+        write_batch(batch_data.cast({"id": pl.String}), batch_path),
+        write_batch(
+            batch_data.with_columns(pl.lit("x").alias(BATCH_TIMESTAMP_COLUMN_NAME)),
+            batch_path,
+        ),
+        write_batch(batch_data, batch_path, timestamp="2025-55-26T100346Z"),
+        batch_path / "2025-03-26T100346Z-does-not-exist.parquet",
+    ]
+
+    # When
+    with raises(ExceptionGroup) as error_info:
+        check_resource_batches(resource_properties, paths)
+
+    # Then
+    errors = error_info.value.exceptions
+    assert [type(error) for error in errors] == [
+        ValueError,
+        ExceptionGroup,
+        ValueError,
+        ValueError,
+        FileNotFoundError,
+    ]
+    assert [error.__notes__ for error in errors] == [
+        [f"Batch file: {path}"] for path in paths[1:]
+    ]
+
+
+def test_uses_cwd_if_no_paths(tmp_cwd, batch_path, resource_properties):
+    """If no paths are provided, should check the batch files of the resource in
+    the cwd."""
+    path = write_batch(batch_data, batch_path)
+
+    assert check_resource_batches(resource_properties) == [path]
+
+
+def test_raises_error_with_empty_resource_properties(batch_path):
+    """Raises errors from checks if the resource properties are empty."""
+    paths = [write_batch(batch_data, batch_path)]
+
+    assert_raises_check_errors(
+        lambda: check_resource_batches(ResourceProperties(), paths)
+    )
@@ -0,0 +1,219 @@
+from uuid import uuid4
+
+import polars as pl
+from polars.testing import assert_frame_equal
+from pytest import raises
+
+from seedcase_sprout.check_resource_batches import check_resource_batches
+from seedcase_sprout.compact_resource_batches import compact_resource_batches
+from seedcase_sprout.constants import (
+    BATCH_TIMESTAMP_COLUMN_NAME,
+    COMPACTED_BATCH_FILE_SUFFIX,
+)
+from seedcase_sprout.examples import (
+    example_data,
+)
+from seedcase_sprout.internals import _read_jsonl
+from seedcase_sprout.join_resource_batches import join_resource_batches
+from seedcase_sprout.read_resource_batches import (
+    _extract_timestamp_from_batch_file_path,
+    read_resource_batches,
+)
+from seedcase_sprout.scan_resource_batches import scan_resource_batches
+from seedcase_sprout.write_resource_batch import write_resource_batch
+
+updated_data = pl.DataFrame(
+    {"id": [99, 101], "name": ["Mark Scout", "Irving B"], "value": [1.0, 2.0]}
+)
+
+
+def join(resource_properties):
+    return join_resource_batches(
+        read_resource_batches(resource_properties), resource_properties
+    ).sort("id")
+
+
+def test_merges_batch_files_into_one(package_path, resource_properties):
+    """Should merge the batch files into one compacted batch file, without changing
+    the joined data."""
+    # Given
+    batch_files = [
+        write_resource_batch(data, resource_properties)
+        for data in [example_data(), updated_data, example_data().head(1)]
+    ]
+    joined_data = join(resource_properties)
+    bytes_before = sum(path.stat().st_size for path in batch_files)
+
+    # When
+    report = compact_resource_batches(resource_properties)
+
+    # Then
+    assert report.batch_files == batch_files
+    assert report.compacted_file.name.endswith(COMPACTED_BATCH_FILE_SUFFIX)
+    assert report.files_saved == 2
+    assert report.bytes_before == bytes_before
+    assert report.bytes_after == report.compacted_file.stat().st_size
+    assert not report.dry_run
+    assert not any(path.exists() for path in batch_files)
+    assert package_path.resource_batch_files(resource_properties.name) == [
+        report.compacted_file
+    ]
+    # Rows replaced by later batch files are dropped
+    assert pl.read_parquet(report.compacted_file).height == 4
+    assert_frame_equal(join(resource_properties), joined_data)
+    assert_frame_equal(
+        join_resource_batches(
+            scan_resource_batches(resource_properties), resource_properties
+        )
+        .collect()
+        .sort("id"),
+        joined_data,
+    )
+
+
+def test_names_compacted_file_after_latest_batch_file_without_rows(
+    package_path, resource_properties
+):
+    """Should take the timestamp of the compacted batch file from the names of the
+    merged batch files, so it also has one if they have no rows."""
+    # Given
+    batch_files = [
+        write_resource_batch(example_data().head(0), resource_properties)
+        for _ in range(2)
+    ]
+
+    # When
+    report = compact_resource_batches(resource_properties)
+
+    # Then
+    assert _extract_timestamp_from_batch_file_path(
+        report.compacted_file
+    ) == _extract_timestamp_from_batch_file_path(batch_files[-1])
+    assert pl.read_parquet(report.compacted_file).height == 0
+    assert package_path.resource_batch_files(resource_properties.name) == [
+        report.compacted_file
+    ]
+    assert join(resource_properties).height == 0
+
+
+def test_updates_batch_manifest(package_path, resource_properties):
+    """Should replace the merged batch files with the compacted one in the batch
+    manifest, keeping other entries."""
+    # Given
+    [write_resource_batch(example_data(), resource_properties) for _ in range(2)]
+    compact_resource_batches(resource_properties)
+    write_resource_batch(updated_data, resource_properties)
+    latest_batch_file = write_resource_batch(updated_data, resource_properties)
+
+    # When
+    report = compact_resource_batches(resource_properties)
+
+    # Then
+    entries = _read_jsonl(
+        package_path.resource_batch_manifest(resource_properties.name)
+    )
+    assert len(entries) == 2
+    assert entries[1]["file"] == report.compacted_file.name
+    assert entries[1]["rows"] == 2
+    assert latest_batch_file.name.startswith(entries[1]["timestamp"])
+
+
+def test_later_batch_files_replace_compacted_rows(package_path, resource_properties):
+    """Rows in batch files added after compacting should replace compacted rows."""
+    # Given
+    [write_resource_batch(example_data(), resource_properties) for _ in range(2)]
+    compact_resource_batches(resource_properties)
+
+    # When
+    write_resource_batch(updated_data, resource_properties)
+
+    # Then
+    assert join(resource_properties)["name"].to_list() == [
+        "Helly R",
+        "Mark Scout",
+        "Ms Casey",
+        "Irving B",
+    ]
+
+
+def test_dry_run_does_not_change_files(package_path, resource_properties):
+    """A dry run should report what compacting would do without changing files."""
+    # Given
+    batch_files = [
+        write_resource_batch(example_data(), resource_properties) for _ in range(2)
+    ]
+    manifest = package_path.resource_batch_manifest(resource_properties.name)
+    manifest_text = manifest.read_text()
+
+    # When
+    report = compact_resource_batches(resource_properties, dry_run=True)
+
+    # Then
+    assert report.dry_run
+    assert report.batch_files == batch_files
+    assert not report.compacted_file.exists()
+    assert 0 < report.bytes_after
+    assert report.bytes_saved == report.bytes_before - report.bytes_after
+    assert package_path.resource_batch_files(resource_properties.name) == batch_files
+    assert manifest.read_text() == manifest_text
+    assert (
+        compact_resource_batches(resource_properties).bytes_after == report.bytes_after
+    )
+
+
+def test_does_nothing_with_fewer_than_two_batch_files(
+    package_path, resource_properties
+):
+    """Should not compact a single batch file."""
+    batch_file = write_resource_batch(example_data(), resource_properties)
+
+    report = compact_resource_batches(resource_properties, package_path.root())
+
+    assert report.batch_files == []
+    assert report.compacted_file is None
+    assert report.files_saved == 0
+    assert report.bytes_saved == 0
+    assert package_path.resource_batch_files(resource_properties.name) == [batch_file]
+
+
+def test_compacts_without_primary_key_or_manifest(package_path, resource_properties):
+    """Without a primary key, only identical rows should be dropped. Without a batch
+    manifest, none should be created."""
+    # Given
+    resource_properties.schema.primary_key = None
+    batch_path = package_path.resource_batch(resource_properties.name)
+    batch_path.mkdir()
+    for timestamp in ["2025-03-26T100346Z", "2025-03-27T100346Z"]:
+        pl.concat([example_data(), updated_data]).write_parquet(
+            batch_path / f"{timestamp}-{uuid4()}.parquet"
+        )
+
+    # When
+    report = compact_resource_batches(resource_properties)
+
+    # Then
+    assert pl.read_parquet(report.compacted_file).height == 5
+    assert not package_path.resource_batch_manifest(resource_properties.name).exists()
+    assert package_path.resource_batch_files(resource_properties.name) == [
+        report.compacted_file
+    ]
+
+
+def test_raises_error_if_compacted_file_has_no_timestamp_column(
+    package_path, resource_properties
+):
+    """Reading or checking a compacted batch file without the timestamp column should
+    raise an error."""
+    batch_path = package_path.resource_batch(resource_properties.name)
+    batch_path.mkdir()
+    compacted_file = (
+        batch_path / f"2025-03-26T100346Z-{uuid4()}{COMPACTED_BATCH_FILE_SUFFIX}"
+    )
+    example_data().write_parquet(compacted_file)
+
+    with raises(ExceptionGroup) as error_info:
+        read_resource_batches(resource_properties, [compacted_file])
+    assert BATCH_TIMESTAMP_COLUMN_NAME in str(error_info.value.exceptions[0])
+    with raises(ExceptionGroup) as error_info:
+        check_resource_batches(resource_properties, [compacted_file])
+    assert isinstance(error_info.value.exceptions[0], ValueError)
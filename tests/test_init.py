@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+from importlib import import_module
+from pathlib import Path
+from types import FunctionType
+
+from pytest import raises
+
+import seedcase_sprout
+from seedcase_sprout import _EXPORTS
+
+heavy_modules = ["polars", "jsonschema", "dacite", "jinja2"]
+
+
+def get_imported_modules(code: str) -> set[str]:
+    """Runs the code in a new Python process and lists the modules it imports, as
+    reported by `python -X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=os.environ | {"PYTHONPATH": str(Path(seedcase_sprout.__file__).parents[1])},
+    )
+    return {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+def test_import_does_not_import_heavy_dependencies():
+    """Importing the package and using PackagePath shouldn't import the heavy
+    dependencies, so short-lived scripts start quickly."""
+    modules = get_imported_modules(
+        "import seedcase_sprout as sp; sp.PackagePath().properties()"
+    )
+
+    assert "seedcase_sprout" in modules
+    assert not modules & set(heavy_modules)
+
+
+def test_imports_dependencies_on_first_use():
+    """Dependencies should be imported once a function needing them is used."""
+    modules = get_imported_modules("import seedcase_sprout as sp; sp.check_data")
+
+    assert "polars" in modules
+
+
+def test_all_exports_are_lazily_importable():
+    """Every name in `__all__` except the re-exported helpers should be in the lazy
+    export table and be importable."""
+    assert set(_EXPORTS) == set(seedcase_sprout.__all__) - {"pprint", "dedent"}
+    for name in seedcase_sprout.__all__:
+        assert getattr(seedcase_sprout, name) is not None
+    assert set(seedcase_sprout.__all__) <= set(dir(seedcase_sprout))
+
+
+def test_star_import_imports_all_exports():
+    """`from seedcase_sprout import *` should import everything in `__all__`."""
+    namespace: dict = {}
+
+    exec("from seedcase_sprout import *", namespace)
+
+    assert set(seedcase_sprout.__all__) <= set(namespace)
+
+
+def test_exports_are_not_replaced_by_submodules():
+    """Importing a submodule with the same name as an export shouldn't replace the
+    export."""
+    import_module("seedcase_sprout.check_data")
+
+    assert isinstance(seedcase_sprout.check_data, FunctionType)
+
+
+def test_throws_error_for_unknown_attribute():
+    """Should raise an AttributeError for names that aren't exported."""
+    with raises(AttributeError, match="unknown_name"):
+        seedcase_sprout.unknown_name
@@ -1,13 +1,15 @@
 import polars as pl
 from polars.testing import assert_frame_equal
-from pytest import fixture, raises
+from pytest import fixture, mark, raises
 
 from seedcase_sprout.constants import BATCH_TIMESTAMP_COLUMN_NAME
-from seedcase_sprout.examples import example_resource_properties
+from seedcase_sprout.examples import ExamplePackage, example_resource_properties
 from seedcase_sprout.join_resource_batches import join_resource_batches
 from seedcase_sprout.properties import (
+    ConstraintsProperties,
     ResourceProperties,
 )
+from seedcase_sprout.write_resource_data import write_resource_data
 
 
 @fixture
@@ -230,3 +232,80 @@ def test_throws_error_with_empty_data_list(resource_properties):
         join_resource_batches([], resource_properties)
 
     assert resource_properties.name in str(error)
+
+
+@mark.parametrize(
+    "primary_key, expected_ids",
+    [
+        ("id", [0, 1, 2, 3]),
+        (["id", "value"], [0, 0, 1, 2, 3]),
+        (None, [0, 0, 0, 1, 2, 3]),
+    ],
+)
+def test_lazy_batches_are_joined_like_eager_batches(
+    data_list, resource_properties, primary_key, expected_ids
+):
+    """Joining a LazyFrame of batches should give the same result as a list of
+    DataFrames."""
+    # Given
+    resource_properties.schema.primary_key = primary_key
+
+    # When
+    joined_batches = join_resource_batches(
+        data_list=pl.concat(data_list).lazy(),
+        resource_properties=resource_properties,
+    )
+
+    # Then
+    assert isinstance(joined_batches, pl.LazyFrame)
+    joined_batches = joined_batches.collect(engine="streaming")
+    assert joined_batches["id"].sort().to_list() == expected_ids
+    assert_frame_equal(
+        joined_batches,
+        join_resource_batches(data_list, resource_properties),
+        check_row_order=False,
+    )
+
+
+def test_lazy_join_keeps_one_row_per_primary_key_within_a_batch(
+    data_list, resource_properties
+):
+    """Only one row should be kept when the latest batch has a duplicate primary
+    key."""
+    # Given
+    resource_properties.schema.primary_key = "id"
+    data = pl.concat(data_list[1:]).lazy()
+
+    # When
+    joined_batches = join_resource_batches(data, resource_properties).collect()
+
+    # Then
+    assert joined_batches["id"].sort().to_list() == [0, 2, 3]
+
+
+def test_lazy_join_throws_error_with_non_matching_column_names(
+    data_list, resource_properties
+):
+    """An error is raised when the column names of the LazyFrame don't match."""
+    data = pl.concat(data_list).lazy().rename({"name": "unexpected_column_name"})
+
+    with raises(ValueError):
+        join_resource_batches(data, resource_properties)
+
+
+def test_lazy_join_leaves_value_checks_to_writer(data_list, resource_properties):
+    """The values of a LazyFrame should only be checked when it's written, so the
+    batches aren't read for the checks twice."""
+    # Given
+    resource_properties.schema.fields[2].constraints = ConstraintsProperties(
+        minimum=100
+    )
+    data = pl.concat(data_list).lazy()
+
+    # When
+    joined_batches = join_resource_batches(data, resource_properties)
+
+    # Then
+    with ExamplePackage():
+        with raises(ExceptionGroup):
+            write_resource_data(joined_batches, resource_properties)
@@ -0,0 +1,98 @@
+import polars as pl
+from polars.testing import assert_frame_equal
+from pytest import mark, raises
+
+from seedcase_sprout.examples import (
+    example_data,
+)
+from seedcase_sprout.lookup_resource_data import lookup_resource_data
+from seedcase_sprout.parquet_write_options import ParquetWriteOptions
+from seedcase_sprout.write_resource_data import write_resource_data
+
+data = pl.DataFrame(
+    {
+        "id": range(1, 1001),
+        "name": [f"Name {i % 7}" for i in range(1, 1001)],
+        "value": [float(i) for i in range(1, 1001)],
+    }
+)
+
+
+@mark.parametrize("partition_by", [None, ["name"]])
+def test_looks_up_rows_by_primary_key(package_path, resource_properties, partition_by):
+    """Should return the rows with the given primary keys, and no rows for keys that
+    aren't in the data."""
+    # Given
+    write_resource_data(
+        data,
+        resource_properties,
+        partition_by=partition_by,
+        parquet_options=ParquetWriteOptions(row_group_size=100),
+    )
+
+    # When
+    rows = lookup_resource_data(
+        pl.DataFrame({"id": [500, 3, 2000, 3]}), resource_properties
+    )
+
+    # Then
+    assert_frame_equal(rows.sort("id"), data.filter(pl.col("id").is_in([3, 500])))
+
+
+def test_looks_up_rows_without_index(package_path, resource_properties):
+    """Should scan the data, if there is no primary key index."""
+    write_resource_data(example_data(), resource_properties)
+    package_path.resource_primary_key_index(resource_properties.name).unlink()
+
+    rows = lookup_resource_data(pl.DataFrame({"id": [99]}), resource_properties)
+
+    assert_frame_equal(rows, example_data().filter(pl.col("id") == 99))
+
+
+def test_ignores_index_from_other_polars_version(package_path, resource_properties):
+    """Should not use an index written by another version of Polars."""
+    write_resource_data(example_data(), resource_properties)
+    index_path = package_path.resource_primary_key_index(resource_properties.name)
+    pl.read_parquet(index_path).with_columns(
+        polars_version=pl.lit("0.0.0"), row=pl.lit(5, pl.UInt32)
+    ).write_parquet(index_path)
+
+    rows = lookup_resource_data(pl.DataFrame({"id": [99]}), resource_properties)
+
+    assert_frame_equal(rows, example_data().filter(pl.col("id") == 99))
+
+
+def test_casts_keys_to_data_types_before_using_index(package_path, resource_properties):
+    """Should find the rows of keys with another type than the primary key column."""
+    write_resource_data(example_data(), resource_properties)
+
+    rows = lookup_resource_data(pl.DataFrame({"id": [34.0]}), resource_properties)
+
+    assert_frame_equal(rows, example_data().filter(pl.col("id") == 34))
+
+
+def test_returns_no_rows_if_no_keys_match(package_path, resource_properties):
+    """Should return an empty DataFrame with the data's columns."""
+    write_resource_data(example_data(), resource_properties)
+
+    rows = lookup_resource_data(
+        pl.DataFrame({"id": [1]}, schema={"id": pl.Int32}), resource_properties
+    )
+
+    assert_frame_equal(rows, example_data().head(0))
+
+
+def test_throws_error_without_primary_key(package_path, resource_properties):
+    """Should throw an error if the resource has no primary key."""
+    resource_properties.schema.primary_key = None
+
+    with raises(ValueError, match="no primary key"):
+        lookup_resource_data(pl.DataFrame({"id": [1]}), resource_properties)
+
+
+def test_throws_error_if_keys_miss_primary_key_column(
+    package_path, resource_properties
+):
+    """Should throw an error if the keys don't have all primary key columns."""
+    with raises(ValueError, match="'id'"):
+        lookup_resource_data(pl.DataFrame({"name": ["a"]}), resource_properties)
@@ -0,0 +1,56 @@
+from pytest import fixture
+
+from seedcase_sprout.parquet_write_options import (
+    ParquetWriteOptions,
+    _get_parquet_write_kwargs,
+    set_default_parquet_write_options,
+)
+
+
+@fixture(autouse=True)
+def reset_default_options():
+    yield
+    set_default_parquet_write_options()
+
+
+def test_default_options_match_polars_defaults():
+    """The default options should be the same as the defaults in Polars."""
+    assert _get_parquet_write_kwargs(None) == {
+        "compression": "zstd",
+        "compression_level": None,
+        "row_group_size": None,
+        "statistics": True,
+    }
+
+
+def test_uses_changed_default_options():
+    """Should use the changed default options when no options are given."""
+    options = ParquetWriteOptions(compression="lz4", row_group_size=10)
+
+    assert set_default_parquet_write_options(options) == options
+    assert _get_parquet_write_kwargs(None) == {
+        "compression": "lz4",
+        "compression_level": None,
+        "row_group_size": 10,
+        "statistics": True,
+    }
+
+
+def test_given_options_override_default_options():
+    """Should use the given options instead of the default options."""
+    set_default_parquet_write_options(ParquetWriteOptions(compression="lz4"))
+
+    assert _get_parquet_write_kwargs(ParquetWriteOptions(statistics=False)) == {
+        "compression": "zstd",
+        "compression_level": None,
+        "row_group_size": None,
+        "statistics": False,
+    }
+
+
+def test_resets_default_options():
+    """Should reset the default options if no options are given."""
+    set_default_parquet_write_options(ParquetWriteOptions(compression="lz4"))
+
+    assert set_default_parquet_write_options() == ParquetWriteOptions()
+    assert _get_parquet_write_kwargs(None)["compression"] == "zstd"
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from pytest import mark
 
 from seedcase_sprout import PackagePath
@@ -15,7 +17,11 @@ def test_package_path_outputs_an_absolute_path(tmp_path):
     assert path.resources().is_absolute()
     assert path.resource("test").is_absolute()
     assert path.resource_data("test").is_absolute()
+    assert path.resource_partitioned_data("test").is_absolute()
+    assert path.resource_data_manifest("test").is_absolute()
+    assert path.resource_primary_key_index("test").is_absolute()
     assert path.resource_batch("test").is_absolute()
+    assert path.resource_batch_manifest("test").is_absolute()
 
 
 def test_methods_return_correct_path(tmp_path):
@@ -30,10 +36,26 @@ def test_methods_return_correct_path(tmp_path):
         package_path.resource_data("test")
         == tmp_path / "resources" / "test" / "data.parquet"
     )
+    assert (
+        package_path.resource_partitioned_data("test")
+        == tmp_path / "resources" / "test" / "data"
+    )
+    assert (
+        package_path.resource_data_manifest("test")
+        == tmp_path / "resources" / "test" / "data-manifest.json"
+    )
+    assert (
+        package_path.resource_primary_key_index("test")
+        == tmp_path / "resources" / "test" / "primary-key-index.parquet"
+    )
 
     assert (
         package_path.resource_batch("test") == tmp_path / "resources" / "test" / "batch"
     )
+    assert (
+        package_path.resource_batch_manifest("test")
+        == tmp_path / "resources" / "test" / "batch" / "manifest.jsonl"
+    )
 
 
 def test_resource_batch_files_returns_empty_list_when_no_batches(tmp_path):
@@ -57,6 +79,91 @@ def test_resource_batch_files_returns_file_paths_when_batches(tmp_path):
     assert package_path.resource_batch_files("test2") == [batch_folder / "file.parquet"]
 
 
+def test_resource_batch_files_are_ordered_by_file_name(tmp_path):
+    """resource_batch_files() should order the batch files by their (timestamped)
+    file names when there is no batch manifest."""
+    batch_folder = PackagePath(tmp_path).resource_batch("test")
+    batch_folder.mkdir(parents=True)
+    files = ["2025-03-26T100348Z.parquet", "2025-03-26T100346Z.parquet"]
+    [(batch_folder / file).touch() for file in files]
+
+    assert PackagePath(tmp_path).resource_batch_files("test") == [
+        batch_folder / file for file in reversed(files)
+    ]
+
+
+def test_resource_batch_files_are_looked_up_in_batch_manifest(tmp_path):
+    """resource_batch_files() should order the batch files by the timestamps in the
+    batch manifest."""
+    # Given
+    package_path = PackagePath(tmp_path)
+    batch_folder = package_path.resource_batch("test")
+    batch_folder.mkdir(parents=True)
+    [(batch_folder / file).touch() for file in ["a.parquet", "b.parquet"]]
+    package_path.resource_batch_manifest("test").write_text(
+        '{"file": "a.parquet", "timestamp": "2025-03-26T100348000000Z"}\n'
+        '{"file": "b.parquet", "timestamp": "2025-03-26T100346000000Z"}\n'
+    )
+
+    # When, Then
+    assert package_path.resource_batch_files("test") == [
+        batch_folder / "b.parquet",
+        batch_folder / "a.parquet",
+    ]
+
+
+def test_resource_batch_files_doesnt_list_folder_with_batch_manifest(
+    tmp_path, monkeypatch
+):
+    """resource_batch_files() should not list the folder if it has a batch manifest."""
+    # Given
+    package_path = PackagePath(tmp_path)
+    batch_folder = package_path.resource_batch("test")
+    batch_folder.mkdir(parents=True)
+    package_path.resource_batch_manifest("test").write_text(
+        '{"file": "a.parquet", "timestamp": "2025-03-26T100348000000Z"}\n'
+    )
+
+    def fail(*args):
+        raise AssertionError("Shouldn't be called.")
+
+    monkeypatch.setattr(Path, "glob", fail)
+
+    # When, Then
+    assert package_path.resource_batch_files("test") == [batch_folder / "a.parquet"]
+
+
+def test_resource_batch_files_reconciles_batch_manifest_with_folder(tmp_path):
+    """resource_batch_files() should only list the batch manifest, unless asked to
+    check the folder. Then, it should include batch files that aren't in the batch
+    manifest, ordered by the timestamp in their names, and leave out files in the
+    manifest that don't exist."""
+    # Given
+    package_path = PackagePath(tmp_path)
+    batch_folder = package_path.resource_batch("test")
+    batch_folder.mkdir(parents=True)
+    files = ["2025-03-26T100346Z-old.parquet", "b.parquet", "c.parquet"]
+    [(batch_folder / file).touch() for file in files]
+    package_path.resource_batch_manifest("test").write_text(
+        '{"file": "b.parquet", "timestamp": "2025-03-26T100348000000Z"}\n'
+        '{"file": "deleted.parquet", "timestamp": "2025-03-26T100349000000Z"}\n'
+        '{"file": "c.parquet", "timestamp": "2025-03-26T100345000000Z"}\n'
+        '{"file": "d.parq'
+    )
+
+    # When, Then
+    assert package_path.resource_batch_files("test") == [
+        batch_folder / "c.parquet",
+        batch_folder / "b.parquet",
+        batch_folder / "deleted.parquet",
+    ]
+    assert package_path.resource_batch_files("test", check_folder=True) == [
+        batch_folder / "c.parquet",
+        batch_folder / "2025-03-26T100346Z-old.parquet",
+        batch_folder / "b.parquet",
+    ]
+
+
 def test_path_defaults_to_cwd_at_call_time(tmp_cwd):
     """When no root path is provided, the root path should default to the cwd of the
     calling script."""
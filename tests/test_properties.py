@@ -5,9 +5,12 @@ from unittest.mock import patch
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
+import dacite
 import time_machine
-from pytest import mark
+from pytest import mark, raises
 
+from seedcase_sprout.examples import example_resource_properties_all_types
+from seedcase_sprout.internals import _to_camel_case
 from seedcase_sprout.properties import (
     ConstraintsProperties,
     ContributorProperties,
@@ -42,6 +45,31 @@ def test_initiated_class_only_contains_none_values(cls):
     assert all(value is None for value in asdict(cls()).values())
 
 
+@mark.parametrize(
+    "cls",
+    [
+        ContributorProperties,
+        LicenseProperties,
+        SourceProperties,
+        ReferenceProperties,
+        TableSchemaForeignKeyProperties,
+        ConstraintsProperties,
+        FieldProperties,
+        TableSchemaProperties,
+        ResourceProperties,
+        PackageProperties,
+    ],
+)
+def test_properties_objects_have_slots_only(cls):
+    """Properties objects should store their values in slots, without a `__dict__`,
+    so they don't accept attributes that aren't properties."""
+    properties = cls()
+
+    assert not hasattr(properties, "__dict__")
+    with raises(AttributeError):
+        properties.not_a_property = "value"
+
+
 def test_compact_dict_generates_empty_dictionary_when_no_args_given():
     """Should return an empty dictionary, when no arguments are given to Properties
     class."""
@@ -86,6 +114,63 @@ def test_compact_dict_removes_none_values_in_nested_objects():
     }
 
 
+def test_compact_dict_matches_asdict_with_camel_case_keys():
+    """Should give the same dictionary as `asdict()` with camel case keys and without
+    None values, for properties using all kinds of values."""
+    properties = PackageProperties.from_default(
+        name="package-1",
+        resources=[
+            example_resource_properties_all_types(),
+            ResourceProperties(
+                name="resource-2",
+                schema=TableSchemaProperties(
+                    fields=[
+                        FieldProperties(
+                            name="a",
+                            categories=[1, 2],
+                            constraints=ConstraintsProperties(
+                                unique=False,
+                                minimum=0.5,
+                                enum=[1, None],
+                                json_schema={"items": {"type": ["string"]}},
+                            ),
+                        )
+                    ],
+                    primary_key="a",
+                    unique_keys=[["a"]],
+                    foreign_keys=[
+                        TableSchemaForeignKeyProperties(
+                            fields=["a"], reference=ReferenceProperties(fields=["b"])
+                        )
+                    ],
+                ),
+            ),
+        ],
+    )
+
+    assert properties.compact_dict == asdict(
+        properties,
+        dict_factory=lambda items: {
+            _to_camel_case(key): value for key, value in items if value is not None
+        },
+    )
+
+
+def test_compact_dict_copies_mutable_values():
+    """Changing the compact dictionary shouldn't change the properties."""
+    properties = FieldProperties(
+        categories=["a"],
+        constraints=ConstraintsProperties(json_schema={"enum": ["a"]}),
+    )
+
+    compact_dict = properties.compact_dict
+    compact_dict["categories"].append("b")
+    compact_dict["constraints"]["jsonSchema"]["enum"].append("b")
+
+    assert properties.categories == ["a"]
+    assert properties.constraints.json_schema == {"enum": ["a"]}
+
+
 @patch("seedcase_sprout.properties.uuid4", return_value=UUID(int=1))
 @time_machine.travel(datetime(2024, 5, 14, 5, 0, 1, tzinfo=ZoneInfo("UTC")), tick=False)
 def test_creates_package_properties_with_correct_defaults(mock_uuid):
@@ -147,6 +232,86 @@ def test_transforms_dict_to_properties(dict, expected_properties):
     assert properties == expected_properties
 
 
+def test_from_dict_matches_dacite():
+    """Should create the same properties as dacite, for properties using all kinds of
+    values."""
+    properties_dict = PackageProperties(
+        name="package-1",
+        resources=[
+            example_resource_properties_all_types(),
+            ResourceProperties(
+                name="resource-2",
+                bytes=10,
+                schema=TableSchemaProperties(
+                    fields=[
+                        FieldProperties(
+                            name="a",
+                            categories=[1, 2],
+                            constraints=ConstraintsProperties(
+                                minimum=1, maximum=0.5, enum=[1, None]
+                            ),
+                        )
+                    ],
+                    primary_key=["a"],
+                    unique_keys=[["a"]],
+                    foreign_keys=[
+                        TableSchemaForeignKeyProperties(
+                            fields=["a"], reference=ReferenceProperties(fields=["b"])
+                        )
+                    ],
+                ),
+            ),
+        ],
+    ).compact_dict
+
+    assert PackageProperties.from_dict(properties_dict) == dacite.from_dict(
+        PackageProperties,
+        properties_dict,
+        dacite.Config(convert_key=_to_camel_case),
+    )
+
+
+@mark.parametrize(
+    "cls, properties_dict, error",
+    [
+        (PackageProperties, {"name": 5}, dacite.WrongTypeError),
+        (PackageProperties, {"keywords": ("a",)}, dacite.WrongTypeError),
+        (PackageProperties, {"resources": [1]}, dacite.WrongTypeError),
+        (
+            PackageProperties,
+            {"resources": [{"schema": {"fields": [{"name": 1}]}}]},
+            dacite.WrongTypeError,
+        ),
+        (
+            PackageProperties,
+            {"resources": [{"schema": {"primaryKey": ["a", 1]}}]},
+            dacite.UnionMatchError,
+        ),
+        (ResourceProperties, {"type": "other"}, dacite.WrongTypeError),
+        (FieldProperties, {"categories": [1, "a"]}, dacite.UnionMatchError),
+        (FieldProperties, {"constraints": {"minimum": [1]}}, dacite.UnionMatchError),
+        (
+            FieldProperties,
+            {"constraints": {"jsonSchema": {1: 1}}},
+            dacite.WrongTypeError,
+        ),
+        (TableSchemaProperties, {"fieldsMatch": ["no"]}, dacite.WrongTypeError),
+        (ConstraintsProperties, {"minLength": 1.5}, dacite.WrongTypeError),
+    ],
+)
+def test_from_dict_raises_same_errors_as_dacite(cls, properties_dict, error):
+    """Should raise the same error as dacite, with the same path to the incorrect
+    value."""
+    with raises(error) as expected_error:
+        dacite.from_dict(
+            cls, properties_dict, dacite.Config(convert_key=_to_camel_case)
+        )
+    with raises(error) as actual_error:
+        cls.from_dict(properties_dict)
+
+    assert str(actual_error.value) == str(expected_error.value)
+
+
 @mark.parametrize(
     "resource_properties, path",
     [
@@ -159,11 +324,25 @@ def test_transforms_dict_to_properties(dict, expected_properties):
             ResourceProperties(name="test-resource", path="some/path"),
             str(Path("resources", "test-resource", "data.parquet")),
         ),
+        (
+            ResourceProperties(
+                name="test-resource",
+                path=str(Path("resources", "test-resource", "data")),
+            ),
+            str(Path("resources", "test-resource", "data")),
+        ),
+        (
+            ResourceProperties(
+                name="test-resource",
+                path=str(Path("resources", "other-resource", "data")),
+            ),
+            str(Path("resources", "test-resource", "data.parquet")),
+        ),
     ],
 )
 def test_autogenerates_resource_data_path(resource_properties, path):
     """Should autogenerate the resource path from the resource name after object
-    creation (if the name is correct)."""
+    creation (if the name is correct), keeping a path to partitioned data."""
     assert resource_properties.path == path
 
 
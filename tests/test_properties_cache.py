@@ -0,0 +1,135 @@
+from importlib import import_module
+
+from pytest import fixture, raises
+
+from seedcase_sprout import (
+    PropertiesCacheInfo,
+    clear_properties_cache,
+    example_package_properties,
+    example_resource_properties,
+    get_properties_cache_info,
+    read_properties,
+    write_properties,
+)
+from seedcase_sprout.internals import _write_json
+
+
+@fixture(autouse=True)
+def empty_cache():
+    clear_properties_cache()
+    yield
+    clear_properties_cache()
+
+
+@fixture
+def properties():
+    properties = example_package_properties()
+    properties.resources = [example_resource_properties()]
+    return properties
+
+
+@fixture
+def properties_path(properties, tmp_path):
+    return write_properties(properties, tmp_path / "datapackage.json")
+
+
+def test_reads_properties_from_cache_if_file_unchanged(properties_path):
+    """Should only read the file the first time, and count the hits and misses."""
+    first = read_properties(properties_path, cache=True)
+    second = read_properties(properties_path, cache=True)
+
+    assert first == second == read_properties(properties_path)
+    assert get_properties_cache_info() == PropertiesCacheInfo(hits=1, misses=1, size=1)
+
+
+def test_skips_reading_and_checking_on_cache_hit(
+    properties, properties_path, monkeypatch
+):
+    """Should neither read nor check the file again when using the cache."""
+    read_properties(properties_path, cache=True)
+    module = import_module("seedcase_sprout.read_properties")
+
+    def fail(*args):
+        raise AssertionError("Shouldn't be called.")
+
+    monkeypatch.setattr(module, "_read_json", fail)
+    monkeypatch.setattr(module, "check_properties", fail)
+
+    assert read_properties(properties_path, cache=True) == properties
+
+
+def test_doesnt_use_cache_by_default(properties_path):
+    """Should only use the cache when asked to."""
+    read_properties(properties_path)
+    read_properties(properties_path)
+
+    assert get_properties_cache_info() == PropertiesCacheInfo(hits=0, misses=0, size=0)
+
+
+def test_returns_copies_of_cached_properties(properties, properties_path):
+    """Changing the returned properties shouldn't change the cached ones."""
+    read_properties(properties_path, cache=True)
+    cached_properties = read_properties(properties_path, cache=True)
+    cached_properties.name = "another-name"
+    cached_properties.licenses.append(cached_properties.licenses[0])
+    cached_properties.resources[0].schema.fields[0].name = "another-field"
+
+    assert read_properties(properties_path, cache=True) == properties
+
+
+def test_rereads_file_if_changed(properties, properties_path):
+    """Should read the file again once it has changed."""
+    read_properties(properties_path, cache=True)
+    properties.title = "A changed title"
+    _write_json(properties.compact_dict, properties_path)
+
+    assert read_properties(properties_path, cache=True) == properties
+    assert get_properties_cache_info() == PropertiesCacheInfo(hits=0, misses=2, size=1)
+
+
+def test_write_properties_clears_cached_properties(properties, properties_path):
+    """Writing the properties should clear the cached properties of the file."""
+    read_properties(properties_path, cache=True)
+    write_properties(properties, properties_path)
+
+    assert get_properties_cache_info().size == 0
+
+
+def test_doesnt_cache_incorrect_properties(properties, tmp_path):
+    """Should raise the errors for incorrect properties on every read."""
+    properties.name = "incorrect name"
+    properties_path = _write_json(
+        properties.compact_dict, tmp_path / "datapackage.json"
+    )
+
+    for _ in range(2):
+        with raises(ExceptionGroup):
+            read_properties(properties_path, cache=True)
+
+    assert get_properties_cache_info() == PropertiesCacheInfo(hits=0, misses=2, size=0)
+
+
+def test_clears_cached_properties_of_file(properties, properties_path, tmp_path):
+    """Should clear only the cached properties of the given file, keeping the
+    counts."""
+    other_path = tmp_path / "other" / "datapackage.json"
+    other_path.parent.mkdir()
+    write_properties(properties, other_path)
+    read_properties(properties_path, cache=True)
+    read_properties(other_path, cache=True)
+
+    clear_properties_cache(properties_path)
+
+    assert get_properties_cache_info() == PropertiesCacheInfo(hits=0, misses=2, size=1)
+    read_properties(other_path, cache=True)
+    assert get_properties_cache_info().hits == 1
+
+
+def test_clears_whole_cache(properties_path):
+    """Should clear all cached properties and reset the counts."""
+    read_properties(properties_path, cache=True)
+    read_properties(properties_path, cache=True)
+
+    clear_properties_cache()
+
+    assert get_properties_cache_info() == PropertiesCacheInfo(hits=0, misses=0, size=0)
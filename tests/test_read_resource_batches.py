@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from uuid import uuid4
 
@@ -15,6 +16,7 @@ from seedcase_sprout.read_resource_batches import (
 )
 from tests.assert_raises_errors import (
     assert_raises_check_errors,
+    assert_raises_errors,
 )
 from tests.directory_structure_setup import (
     create_test_data_package,
@@ -86,10 +88,30 @@ def test_reads_resource_batches_correctly(resource_paths, resource_properties):
     assert all(data.shape == (3, 3) for data in data_list)
     assert all(len(column.unique()) == 1 for column in timestamp_column)
     assert all(
-        column.unique()[0] == "2025-03-26T100346Z" for column in timestamp_column
+        column.unique()[0] == "2025-03-26T100346000000Z" for column in timestamp_column
     )
 
 
+def test_takes_timestamps_from_batch_manifest(resource_paths, resource_properties):
+    """Should take the timestamps of the batch files in the batch manifest from it,
+    instead of from their names."""
+    # Given
+    batch_path = resource_paths[0].parent
+    (batch_path / "manifest.jsonl").write_text(
+        json.dumps({"file": resource_paths[0].name, "timestamp": "manifest-timestamp"})
+        + "\n"
+    )
+
+    # When
+    data_list = read_resource_batches(resource_properties, resource_paths)
+
+    # Then
+    assert [data[BATCH_TIMESTAMP_COLUMN_NAME][0] for data in data_list] == [
+        "manifest-timestamp",
+        "2025-03-26T100346000000Z",
+    ]
+
+
 def test_raises_error_when_file_does_not_exist(resource_paths, resource_properties):
     """Raises FileNotFoundError when a file in the list of paths doesn't exist"""
     # Given
@@ -119,16 +141,20 @@ def test_raises_error_when_timestamp_column_matches_existing_column(
     batch_data.write_parquet(batch_path)
 
     # When, Then
-    with raises(ValueError):
-        read_resource_batches(
+    assert_raises_errors(
+        lambda: read_resource_batches(
             resource_properties=resource_properties, paths=[batch_path]
-        )
+        ),
+        ValueError,
+        error_count=1,
+    )
 
 
 @mark.parametrize(
     "incorrect_timestamp",
     [
         "2025-55-26T100346Z",  # incorrect month
+        "2025-55-26T100346123456Z",  # incorrect month, with microseconds
         "2025-02-30T100346",  # no timezone
         "2025-03-26T100346",  # incorrect date (30 February)
         "2025-03-26",  # no time
@@ -145,10 +171,13 @@ def test_raises_error_when_file_name_timestamp_does_not_match_pattern(
     batch_data_1.write_parquet(batch_file_path)
 
     # When, Then
-    with raises(ValueError):
-        read_resource_batches(
+    assert_raises_errors(
+        lambda: read_resource_batches(
             resource_properties=resource_properties, paths=[batch_file_path]
-        )
+        ),
+        ValueError,
+        error_count=1,
+    )
 
 
 def test_if_multiple_correct_timestamps_in_file_name_use_first_one(
@@ -168,7 +197,31 @@ def test_if_multiple_correct_timestamps_in_file_name_use_first_one(
     )
 
     # Then
-    assert data_list[0][BATCH_TIMESTAMP_COLUMN_NAME][0] == "2025-03-26T100346Z"
+    assert data_list[0][BATCH_TIMESTAMP_COLUMN_NAME][0] == "2025-03-26T100346000000Z"
+
+
+def test_reads_timestamps_with_microseconds_in_order_with_legacy_ones(
+    resource_paths, resource_properties
+):
+    """Timestamps with microseconds are read, and legacy timestamps without them are
+    normalised so that all timestamps are ordered correctly as strings."""
+    # Given
+    batch_path = resource_paths[0].parent
+    batch_file_paths = [
+        batch_path / f"2025-03-26T100346000001Z-{uuid4()}.parquet",
+        batch_path / f"2025-03-26T100346Z-{uuid4()}.parquet",
+    ]
+    [batch_data_1.write_parquet(path) for path in batch_file_paths]
+
+    # When
+    data_list = read_resource_batches(
+        resource_properties=resource_properties, paths=batch_file_paths
+    )
+    timestamps = [data[BATCH_TIMESTAMP_COLUMN_NAME][0] for data in data_list]
+
+    # Then
+    assert timestamps == ["2025-03-26T100346000001Z", "2025-03-26T100346000000Z"]
+    assert max(timestamps) == timestamps[0]
 
 
 def test_raises_error_when_properties_do_not_match_data(
@@ -179,10 +232,13 @@ def test_raises_error_when_properties_do_not_match_data(
     resource_properties.schema.fields[0].name = "not-id"
 
     # When, Then
-    with raises(ValueError):
-        read_resource_batches(
+    assert_raises_errors(
+        lambda: read_resource_batches(
             resource_properties=resource_properties, paths=resource_paths
-        )
+        ),
+        ValueError,
+        error_count=len(resource_paths),
+    )
 
 
 def test_raises_error_with_empty_resource_properties(resource_paths):
@@ -211,3 +267,48 @@ def test_no_error_thrown_when_no_batches_using_cwd_as_default(
     data_list = read_resource_batches(resource_properties)
 
     assert len(data_list) == 0
+
+
+def test_reads_resource_batches_concurrently_in_order(
+    resource_paths, resource_properties
+):
+    """Reading with multiple threads should give the same DataFrames in the same
+    order."""
+    # Given
+    expected = read_resource_batches(resource_properties, resource_paths)
+
+    # When
+    data_list = read_resource_batches(
+        resource_properties, resource_paths, max_workers=4
+    )
+
+    # Then
+    assert len(data_list) == len(expected)
+    assert all(data.equals(other) for data, other in zip(data_list, expected))
+
+
+@mark.parametrize("max_workers", [1, 4])
+def test_collects_errors_from_all_files(
+    resource_paths, resource_properties, max_workers
+):
+    """All files that fail should be reported in one ExceptionGroup, naming the
+    files."""
+    # Given
+    batch_path = resource_paths[0].parent
+    bad_paths = [batch_path / f"2025-03-26T100346Z-{uuid4()}.parquet" for _ in range(2)]
+    for bad_path in bad_paths:
+        batch_data_1.rename({"name": "not-name"}).write_parquet(bad_path)
+
+    # When
+    with raises(ExceptionGroup) as error_info:
+        read_resource_batches(
+            resource_properties, [*resource_paths, *bad_paths], max_workers=max_workers
+        )
+
+    # Then
+    errors = error_info.value.exceptions
+    assert len(errors) == 2
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert [error.__notes__ for error in errors] == [
+        [f"Batch file: {bad_path}"] for bad_path in bad_paths
+    ]
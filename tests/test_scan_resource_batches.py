@@ -0,0 +1,188 @@
+from pathlib import Path
+from uuid import uuid4
+
+import polars as pl
+from pytest import fixture, mark, raises
+
+from seedcase_sprout.constants import BATCH_TIMESTAMP_COLUMN_NAME
+from seedcase_sprout.properties import (
+    FieldProperties,
+    ResourceProperties,
+    TableSchemaProperties,
+)
+from seedcase_sprout.scan_resource_batches import scan_resource_batches
+from tests.assert_raises_errors import (
+    assert_raises_check_errors,
+    assert_raises_errors,
+)
+from tests.directory_structure_setup import (
+    create_test_data_package,
+)
+
+batch_data_1 = pl.DataFrame(
+    {
+        "id": [0, 1, 2],
+        "name": ["anne", "belinda", "catherine"],
+    }
+)
+
+batch_data_2 = pl.DataFrame(
+    {
+        "id": [3, 4, 5],
+        "name": ["dorothy", "figaro", "gabrielle"],
+    }
+)
+
+
+@fixture
+def resource_properties() -> ResourceProperties:
+    return ResourceProperties(
+        name="1",
+        title="Test resource",
+        description="A test resource",
+        schema=TableSchemaProperties(
+            fields=[
+                FieldProperties(name="id", type="integer"),
+                FieldProperties(name="name", type="string"),
+            ]
+        ),
+    )
+
+
+@fixture
+def test_package(tmp_path):
+    create_test_data_package(tmp_path)
+    batch_path = tmp_path / "resources" / "1" / "batch"
+    batch_path.mkdir(parents=True)
+
+    batch_data_1.write_parquet(batch_path / f"2025-03-26T100346Z-{uuid4()}.parquet")
+    batch_data_2.write_parquet(batch_path / f"2025-03-27T100346Z-{uuid4()}.parquet")
+
+    return tmp_path
+
+
+@fixture
+def resource_paths(test_package):
+    return sorted((test_package / "resources" / "1" / "batch").iterdir())
+
+
+def test_scans_resource_batches_correctly(resource_paths, resource_properties):
+    """Scans all batches into one LazyFrame with the expected timestamp column."""
+    # When
+    data = scan_resource_batches(resource_properties, resource_paths)
+
+    # Then
+    assert isinstance(data, pl.LazyFrame)
+    data = data.collect().sort("id")
+    assert data.drop(BATCH_TIMESTAMP_COLUMN_NAME).equals(
+        pl.concat([batch_data_1, batch_data_2])
+    )
+    assert (
+        data[BATCH_TIMESTAMP_COLUMN_NAME].to_list()
+        == ["2025-03-26T100346000000Z"] * 3 + ["2025-03-27T100346000000Z"] * 3
+    )
+
+
+def test_scans_resource_batches_with_streaming_engine(
+    resource_paths, resource_properties
+):
+    """The scanned LazyFrame can be collected with the streaming engine."""
+    data = scan_resource_batches(resource_properties, resource_paths)
+
+    assert data.collect(engine="streaming").shape == (6, 3)
+
+
+def test_uses_first_timestamp_in_file_name(resource_paths, resource_properties):
+    """If multiple timestamps are found in the file name, the first one is used."""
+    # Given
+    batch_file_path = (
+        resource_paths[0].parent
+        / f"2025-03-26T100346Z-1990-03-26T100346Z-{uuid4()}.parquet"
+    )
+    batch_data_1.write_parquet(batch_file_path)
+
+    # When
+    data = scan_resource_batches(resource_properties, [batch_file_path]).collect()
+
+    # Then
+    assert data[BATCH_TIMESTAMP_COLUMN_NAME].unique().to_list() == [
+        "2025-03-26T100346000000Z"
+    ]
+
+
+def test_raises_error_when_file_does_not_exist(resource_paths, resource_properties):
+    """Raises FileNotFoundError when a file in the list of paths doesn't exist."""
+    # Given
+    resource_paths.append(Path("non-existent-file.parquet"))
+
+    # When, Then
+    assert_raises_errors(
+        lambda: scan_resource_batches(resource_properties, resource_paths),
+        FileNotFoundError,
+        1,
+    )
+
+
+def test_raises_error_when_no_batch_files(tmp_cwd, resource_properties):
+    """Raises ValueError when there are no batch files to scan."""
+    with raises(ValueError):
+        scan_resource_batches(resource_properties)
+
+
+def test_raises_error_when_timestamp_column_matches_existing_column(
+    resource_paths, resource_properties
+):
+    """Raises ValueError when the timestamp column name matches an existing column."""
+    # Given
+    batch_path = resource_paths[0].parent / f"2025-03-26T100346Z-{uuid4()}.parquet"
+    batch_data_1.with_columns(
+        pl.lit("2024-03-26T100346Z").alias(BATCH_TIMESTAMP_COLUMN_NAME)
+    ).write_parquet(batch_path)
+
+    # When, Then
+    assert_raises_errors(
+        lambda: scan_resource_batches(resource_properties, [batch_path]), ValueError
+    )
+
+
+@mark.parametrize("incorrect_timestamp", ["2025-55-26T100346Z", "2025-03-26"])
+def test_raises_error_when_file_name_timestamp_does_not_match_pattern(
+    resource_paths, resource_properties, incorrect_timestamp
+):
+    """Raises ValueError when the batch file name is not in the expected pattern."""
+    # Given
+    batch_path = resource_paths[0].parent / f"{incorrect_timestamp}-{uuid4()}.parquet"
+    batch_data_1.write_parquet(batch_path)
+
+    # When, Then
+    assert_raises_errors(
+        lambda: scan_resource_batches(resource_properties, [batch_path]), ValueError
+    )
+
+
+def test_raises_error_when_properties_do_not_match_data(
+    resource_paths, resource_properties
+):
+    """Raises errors from checks when the resource properties don't match the data."""
+    # Given
+    resource_properties.schema.fields[0].name = "not-id"
+
+    # When, Then
+    assert_raises_errors(
+        lambda: scan_resource_batches(resource_properties, resource_paths), ValueError
+    )
+
+
+def test_raises_error_with_empty_resource_properties(resource_paths):
+    """Raises errors from checks if the resource properties are empty."""
+    assert_raises_check_errors(
+        lambda: scan_resource_batches(ResourceProperties(), resource_paths)
+    )
+
+
+def test_uses_cwd_if_no_paths(tmp_cwd, test_package, resource_properties):
+    """If no paths are provided, should use the cwd as the package root to retrieve
+    batch files from resource."""
+    data = scan_resource_batches(resource_properties)
+
+    assert data.collect().shape == (6, 3)
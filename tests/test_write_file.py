@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from pytest import fixture, raises
 
 from seedcase_sprout.write_file import write_file
@@ -40,3 +42,26 @@ def test_overwrites_file_content_if_file_already_exists(tmp_path, file_content):
 
     assert write_file(new_file_content, file_path) == file_path
     assert file_path.read_text() == new_file_content
+
+
+def test_keeps_original_file_if_writing_fails(tmp_path, file_content, monkeypatch):
+    """Tests that the original file is kept and no temporary file is left behind if
+    writing is stopped part way through."""
+    # Given
+    file_path = tmp_path / "test.txt"
+    write_file(file_content, file_path)
+
+    def write_partially(path, string):
+        path.open("w").write(string[:3])
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(Path, "write_text", write_partially)
+
+    # When
+    with raises(KeyboardInterrupt):
+        write_file("This is new content.", file_path)
+
+    # Then
+    monkeypatch.undo()
+    assert file_path.read_text() == file_content
+    assert list(tmp_path.iterdir()) == [file_path]
@@ -1,7 +1,13 @@
+import json
 import os
 import re
+from datetime import datetime, timezone
+from hashlib import sha256
+from importlib import import_module
+from zoneinfo import ZoneInfo
 
 import polars as pl
+import time_machine
 from polars.testing import assert_frame_equal
 from pytest import raises
 
@@ -10,8 +16,13 @@ from seedcase_sprout.examples import (
     example_data,
     example_resource_properties,
 )
+from seedcase_sprout.parquet_write_options import ParquetWriteOptions
 from seedcase_sprout.paths import PackagePath
-from seedcase_sprout.write_resource_batch import write_resource_batch
+from seedcase_sprout.write_resource_batch import (
+    _get_compact_iso_timestamp,
+    write_resource_batch,
+)
+from seedcase_sprout.write_resource_data import write_resource_data
 
 
 def test_writes_correct_resource_batch_file(tmp_path):
@@ -80,3 +91,150 @@ def test_uses_cwd_if_no_path_provided(tmp_cwd):
     # Then
     assert batch_file.exists()
     assert package_path.resource_batch(resource_properties.name) in batch_file.parents
+
+
+def test_records_batch_files_in_batch_manifest(tmp_path):
+    """Should append an entry per written batch file to the batch manifest."""
+    # Given
+    package_path = PackagePath(tmp_path)
+    resource_properties = example_resource_properties()
+
+    # When
+    batch_files = [
+        write_resource_batch(example_data(), resource_properties, tmp_path)
+        for _ in range(2)
+    ]
+
+    # Then
+    manifest_path = package_path.resource_batch_manifest(resource_properties.name)
+    entries = [json.loads(line) for line in manifest_path.read_text().splitlines()]
+    assert [entry["file"] for entry in entries] == [path.name for path in batch_files]
+    assert (
+        entries[0]["timestamp"]
+        == re.findall(BATCH_TIMESTAMP_PATTERN, batch_files[0].name)[0]
+    )
+    assert entries[0]["rows"] == example_data().height
+    assert entries[0]["bytes"] == batch_files[0].stat().st_size
+    assert entries[0]["schema_hash"] == entries[1]["schema_hash"]
+    assert (
+        entries[0]["content_hash"]
+        == f"sha256:{sha256(batch_files[0].read_bytes()).hexdigest()}"
+    )
+    assert package_path.resource_batch_files(resource_properties.name) == sorted(
+        batch_files
+    )
+
+
+def test_records_existing_batch_files_when_creating_batch_manifest(tmp_path):
+    """Should record the batch files written before the batch manifest existed, except
+    those without a correct timestamp in their name."""
+    # Given
+    package_path = PackagePath(tmp_path)
+    resource_properties = example_resource_properties()
+    batch_folder = package_path.resource_batch(resource_properties.name)
+    batch_folder.mkdir(parents=True)
+    legacy_file = batch_folder / "2025-03-26T100346Z-legacy.parquet"
+    example_data().head(2).write_parquet(legacy_file)
+    example_data().write_parquet(batch_folder / "not-a-batch-file.parquet")
+
+    # When
+    batch_file = write_resource_batch(example_data(), resource_properties, tmp_path)
+
+    # Then
+    manifest_path = package_path.resource_batch_manifest(resource_properties.name)
+    entries = [json.loads(line) for line in manifest_path.read_text().splitlines()]
+    assert [entry["file"] for entry in entries] == [legacy_file.name, batch_file.name]
+    assert entries[0]["timestamp"] == "2025-03-26T100346000000Z"
+    assert entries[0]["rows"] == 2
+    assert entries[0]["schema_hash"] == entries[1]["schema_hash"]
+    assert (
+        entries[0]["content_hash"]
+        == f"sha256:{sha256(legacy_file.read_bytes()).hexdigest()}"
+    )
+    assert package_path.resource_batch_files(resource_properties.name) == [
+        legacy_file,
+        batch_file,
+    ]
+
+
+def test_counts_inserted_and_updated_rows_in_batch_manifest(tmp_path):
+    """Should record how many rows of the batch are new and how many replace rows in
+    the resource data, once the data has been written."""
+    # Given
+    package_path = PackagePath(tmp_path)
+    resource_properties = example_resource_properties()
+    write_resource_batch(example_data(), resource_properties, tmp_path)
+    write_resource_data(example_data().head(2), resource_properties, tmp_path)
+    new_data = example_data().with_columns(pl.col("id").cast(pl.Int32))
+
+    # When
+    write_resource_batch(new_data, resource_properties, tmp_path)
+
+    # Then
+    manifest_path = package_path.resource_batch_manifest(resource_properties.name)
+    entries = [json.loads(line) for line in manifest_path.read_text().splitlines()]
+    assert "inserted_rows" not in entries[0]
+    assert entries[1]["inserted_rows"] == 1
+    assert entries[1]["updated_rows"] == 2
+
+
+@time_machine.travel(
+    datetime(2025, 3, 26, 12, 3, 46, 5, tzinfo=ZoneInfo("Europe/Copenhagen")),
+    tick=False,
+)
+def test_batch_timestamps_are_utc_with_microseconds(monkeypatch):
+    """Timestamps should be in UTC with microseconds and strictly increasing, even if
+    the clock hasn't moved on."""
+    monkeypatch.setattr(
+        import_module("seedcase_sprout.write_resource_batch"),
+        "_LAST_BATCH_TIMESTAMP",
+        datetime.min.replace(tzinfo=timezone.utc),
+    )
+    timestamps = [_get_compact_iso_timestamp() for _ in range(3)]
+
+    assert timestamps == [
+        "2025-03-26T110346000005Z",
+        "2025-03-26T110346000006Z",
+        "2025-03-26T110346000007Z",
+    ]
+
+
+def test_batch_files_are_ordered_by_write_order(tmp_path):
+    """Batch files written in quick succession should be listed in the order they
+    were written."""
+    # Given
+    resource_properties = example_resource_properties()
+
+    # When
+    batch_files = [
+        write_resource_batch(example_data(), resource_properties, tmp_path)
+        for _ in range(10)
+    ]
+
+    # Then
+    assert (
+        PackagePath(tmp_path).resource_batch_files(resource_properties.name)
+        == batch_files
+    )
+
+
+def test_writes_with_given_parquet_options(tmp_path):
+    """Should write the batch file with the given Parquet options."""
+    # Given
+    data = pl.DataFrame(
+        {"id": range(3000), "name": ["Helly R"] * 3000, "value": [1.0] * 3000}
+    )
+    resource_properties = example_resource_properties()
+
+    # When
+    compressed_path = write_resource_batch(data, resource_properties, tmp_path)
+    uncompressed_path = write_resource_batch(
+        data,
+        resource_properties,
+        tmp_path,
+        ParquetWriteOptions(compression="uncompressed"),
+    )
+
+    # Then
+    assert_frame_equal(pl.read_parquet(uncompressed_path), data)
+    assert uncompressed_path.stat().st_size > 2 * compressed_path.stat().st_size
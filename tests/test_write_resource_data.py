@@ -1,5 +1,8 @@
+from hashlib import md5, sha256
+
 import polars as pl
 from polars.testing import assert_frame_equal
+from pytest import raises
 
 from seedcase_sprout.examples import (
     ExamplePackage,
@@ -8,6 +11,10 @@ from seedcase_sprout.examples import (
     example_resource_properties,
     example_resource_properties_all_types,
 )
+from seedcase_sprout.parquet_write_options import (
+    ParquetWriteOptions,
+    set_default_parquet_write_options,
+)
 from seedcase_sprout.read_properties import read_properties
 from seedcase_sprout.write_resource_data import write_resource_data
 from tests.assert_raises_errors import (
@@ -72,3 +79,336 @@ def test_throws_error_if_properties_do_not_match_data():
     assert_raises_errors(
         lambda: write_resource_data(example_data(), resource_properties), ValueError
     )
+
+
+def test_writes_lazy_data():
+    """Should stream a LazyFrame into the data file."""
+    with ExamplePackage() as package_path:
+        resource_properties = read_properties().resources[0]
+        data = example_data()
+
+        data_path = write_resource_data(
+            data.lazy(), resource_properties, package_path.root()
+        )
+
+        assert_frame_equal(pl.read_parquet(data_path), data)
+
+
+def test_keeps_data_file_if_writing_fails():
+    """Should keep the existing data file, and leave no temporary file behind, if
+    writing the new data fails."""
+    with ExamplePackage() as package_path:
+        # Given
+        resource_properties = example_resource_properties()
+        data_path = write_resource_data(example_data(), resource_properties)
+        failing_data = (
+            example_data()
+            .lazy()
+            .with_columns(
+                pl.col("value").map_batches(_raise_error, return_dtype=pl.Float64)
+            )
+        )
+
+        # When
+        with raises(Exception, match="Failed"):
+            write_resource_data(failing_data, resource_properties)
+
+        # Then
+        assert_frame_equal(pl.read_parquet(data_path), example_data())
+        assert set(package_path.resource(resource_properties.name).iterdir()) == {
+            data_path,
+            package_path.resource_primary_key_index(resource_properties.name),
+        }
+
+
+def _raise_error(series: pl.Series) -> pl.Series:
+    raise ValueError("Failed")
+
+
+def test_writes_partitioned_data():
+    """Should write one file per partition, in Hive-style folders, with all columns."""
+    with ExamplePackage() as package_path:
+        # Given
+        resource_properties = example_resource_properties()
+        data = example_data().with_columns(name=pl.Series(["a/b", None, "a/b"]))
+
+        # When
+        folder_path = write_resource_data(
+            data, resource_properties, partition_by=["name"]
+        )
+
+        # Then
+        assert folder_path == package_path.resource_partitioned_data(
+            resource_properties.name
+        )
+        assert sorted(
+            str(path.relative_to(folder_path)) for path in folder_path.glob("**/*.*")
+        ) == [
+            "name=__HIVE_DEFAULT_PARTITION__/data.parquet",
+            "name=a%2Fb/data.parquet",
+        ]
+        assert_frame_equal(
+            pl.read_parquet(folder_path / "name=a%2Fb" / "data.parquet"),
+            data.filter(pl.col("name") == "a/b"),
+        )
+
+
+def test_only_rewrites_changed_partitions():
+    """Should leave unchanged partitions untouched and remove empty partitions."""
+    with ExamplePackage() as package_path:
+        # Given
+        resource_properties = example_resource_properties()
+        folder_path = package_path.resource_partitioned_data(resource_properties.name)
+        write_resource_data(example_data(), resource_properties, partition_by=["id"])
+        paths = [folder_path / f"id={id}" / "data.parquet" for id in [34, 99]]
+        mtimes = [path.stat().st_mtime_ns for path in paths]
+        changed_data = (
+            example_data()
+            .filter(pl.col("id") != 100)
+            .with_columns(
+                value=pl.when(pl.col("id") == 99).then(0.0).otherwise(pl.col("value"))
+            )
+        )
+
+        # When
+        write_resource_data(changed_data, resource_properties, partition_by=["id"])
+
+        # Then
+        assert paths[0].stat().st_mtime_ns == mtimes[0]
+        assert paths[1].stat().st_mtime_ns != mtimes[1]
+        assert pl.read_parquet(paths[1])["value"].to_list() == [0.0]
+        assert sorted(path.name for path in folder_path.iterdir()) == ["id=34", "id=99"]
+
+
+def test_doesnt_read_existing_partitions(monkeypatch):
+    """Should find unchanged partitions from their fingerprints, not by reading
+    them."""
+    with ExamplePackage() as package_path:
+        # Given
+        resource_properties = example_resource_properties()
+        folder_path = package_path.resource_partitioned_data(resource_properties.name)
+        write_resource_data(example_data(), resource_properties, partition_by=["id"])
+        mtime = (folder_path / "id=34" / "data.parquet").stat().st_mtime_ns
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Shouldn't be called.")
+
+        monkeypatch.setattr(pl, "read_parquet", fail)
+
+        # When
+        write_resource_data(example_data(), resource_properties, partition_by=["id"])
+
+        # Then
+        assert (folder_path / "id=34" / "data.parquet").stat().st_mtime_ns == mtime
+
+
+def test_rewrites_partition_changed_since_last_write():
+    """Should rewrite a partition whose file was changed by something else."""
+    with ExamplePackage() as package_path:
+        # Given
+        resource_properties = example_resource_properties()
+        folder_path = package_path.resource_partitioned_data(resource_properties.name)
+        write_resource_data(example_data(), resource_properties, partition_by=["id"])
+        partition_path = folder_path / "id=34" / "data.parquet"
+        example_data().head(0).write_parquet(partition_path)
+
+        # When
+        write_resource_data(example_data(), resource_properties, partition_by=["id"])
+
+        # Then
+        assert_frame_equal(
+            pl.read_parquet(partition_path, hive_partitioning=False),
+            example_data().filter(pl.col("id") == 34),
+        )
+
+
+def test_replaces_data_file_with_partitions_and_back():
+    """Should remove the data of the other layout and update the path when switching
+    between partitioned and unpartitioned data."""
+    with ExamplePackage() as package_path:
+        # Given
+        resource_properties = example_resource_properties()
+        data_path = package_path.resource_data(resource_properties.name)
+        folder_path = package_path.resource_partitioned_data(resource_properties.name)
+        write_resource_data(example_data(), resource_properties)
+
+        # When
+        write_resource_data(example_data(), resource_properties, partition_by=["id"])
+
+        # Then
+        assert not data_path.exists()
+        assert folder_path.is_dir()
+        assert resource_properties.path == "resources/example-resource/data"
+
+        # When
+        write_resource_data(example_data(), resource_properties)
+
+        # Then
+        assert data_path.is_file()
+        assert not folder_path.exists()
+        assert resource_properties.path == "resources/example-resource/data.parquet"
+
+
+def test_throws_error_if_partition_field_not_in_data():
+    """Should throw ValueError if the data can't be partitioned by a field."""
+    with ExamplePackage():
+        with raises(ValueError, match="not-a-field"):
+            write_resource_data(
+                example_data(),
+                example_resource_properties(),
+                partition_by=["not-a-field"],
+            )
+
+
+def test_sorts_data_by_primary_key():
+    """Should sort the data by the primary key before writing it."""
+    with ExamplePackage():
+        data_path = write_resource_data(
+            example_data().reverse(), example_resource_properties()
+        )
+
+        assert_frame_equal(pl.read_parquet(data_path), example_data().sort("id"))
+
+
+def test_doesnt_sort_lazy_data_by_primary_key():
+    """Should stream a LazyFrame into the file in its own order."""
+    with ExamplePackage():
+        data_path = write_resource_data(
+            example_data().reverse().lazy(), example_resource_properties()
+        )
+
+        assert_frame_equal(pl.read_parquet(data_path), example_data().reverse())
+
+
+def test_writes_with_default_parquet_options():
+    """Should write the data with the default Parquet options, unless others are
+    given."""
+    with ExamplePackage():
+        # Given
+        data = pl.DataFrame(
+            {"id": range(3000), "name": ["Helly R"] * 3000, "value": [1.0] * 3000}
+        )
+        resource_properties = example_resource_properties()
+        compressed_size = write_resource_data(data, resource_properties).stat().st_size
+
+        # When
+        set_default_parquet_write_options(
+            ParquetWriteOptions(compression="uncompressed")
+        )
+        try:
+            uncompressed_size = (
+                write_resource_data(data, resource_properties).stat().st_size
+            )
+            compressed_again_size = (
+                write_resource_data(
+                    data, resource_properties, parquet_options=ParquetWriteOptions()
+                )
+                .stat()
+                .st_size
+            )
+        finally:
+            set_default_parquet_write_options()
+
+        # Then
+        assert uncompressed_size > 2 * compressed_size
+        assert compressed_again_size == compressed_size
+
+
+def test_writes_primary_key_index():
+    """Should write the primary key index of the data file, sorted by the hash."""
+    with ExamplePackage() as package_path:
+        resource_properties = example_resource_properties()
+
+        write_resource_data(example_data().lazy(), resource_properties)
+
+        index = pl.read_parquet(
+            package_path.resource_primary_key_index(resource_properties.name)
+        )
+        assert index["hash"].is_sorted()
+        assert index["file"].unique().to_list() == ["data.parquet"]
+        assert sorted(index["row"].to_list()) == [0, 1, 2]
+        assert index["polars_version"].unique().to_list() == [pl.__version__]
+
+
+def test_writes_primary_key_index_of_partitions():
+    """Should index the rows of each partition by the partition's file."""
+    with ExamplePackage() as package_path:
+        resource_properties = example_resource_properties()
+
+        write_resource_data(example_data(), resource_properties, partition_by=["name"])
+
+        index = pl.read_parquet(
+            package_path.resource_primary_key_index(resource_properties.name)
+        )
+        assert sorted(index["file"].to_list()) == [
+            "data/name=Helly%20R/data.parquet",
+            "data/name=Mark%20S/data.parquet",
+            "data/name=Ms%20Casey/data.parquet",
+        ]
+        assert index["row"].to_list() == [0, 0, 0]
+
+
+def test_removes_primary_key_index_without_primary_key():
+    """Should remove the primary key index if the resource has no primary key."""
+    with ExamplePackage() as package_path:
+        resource_properties = example_resource_properties()
+        write_resource_data(example_data(), resource_properties)
+        resource_properties.schema.primary_key = None
+
+        write_resource_data(example_data(), resource_properties)
+
+        assert not package_path.resource_primary_key_index(
+            resource_properties.name
+        ).exists()
+
+
+def test_updates_bytes_and_hash_of_properties():
+    """Should set the size and the MD5 hash of the written file in the properties."""
+    with ExamplePackage():
+        resource_properties = example_resource_properties()
+
+        data_path = write_resource_data(example_data(), resource_properties)
+
+        assert resource_properties.bytes == data_path.stat().st_size
+        assert resource_properties.hash == md5(data_path.read_bytes()).hexdigest()
+
+
+def test_hashes_lazy_data_with_given_algorithm():
+    """Should prefix hashes of other algorithms than MD5 with the algorithm."""
+    with ExamplePackage():
+        resource_properties = example_resource_properties()
+
+        data_path = write_resource_data(
+            example_data().lazy(), resource_properties, hash_algorithm="sha256"
+        )
+
+        assert resource_properties.bytes == data_path.stat().st_size
+        assert (
+            resource_properties.hash
+            == f"sha256:{sha256(data_path.read_bytes()).hexdigest()}"
+        )
+
+
+def test_clears_bytes_and_hash_of_partitioned_data():
+    """Should unset the size and the hash, as partitioned data has several files."""
+    with ExamplePackage():
+        resource_properties = example_resource_properties()
+        write_resource_data(example_data(), resource_properties)
+
+        write_resource_data(example_data(), resource_properties, partition_by=["id"])
+
+        assert resource_properties.bytes is None
+        assert resource_properties.hash is None
+
+
+def test_throws_error_if_hash_algorithm_not_available():
+    """Should throw an error before writing, if the hash algorithm doesn't exist."""
+    with ExamplePackage() as package_path:
+        resource_properties = example_resource_properties()
+
+        with raises(ValueError):
+            write_resource_data(
+                example_data(), resource_properties, hash_algorithm="unknown"
+            )
+
+        assert not package_path.resource_data(resource_properties.name).exists()